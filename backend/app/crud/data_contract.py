@@ -1,39 +1,382 @@
 import logging
-from typing import List, Optional
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy import ColumnElement, Select, Update, and_, delete, exists, func, insert, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
+from ..database.types import CompressedJSON, CompressedText
+from ..database.writer import after_commit
 from ..models.data_contract import DataContract as DataContractModel
+from ..models.data_contract_tag import DataContractTag as DataContractTagModel
 from ..schemas.data_contract.objects.data_contract import DataContract
+from ..schemas.data_contract.objects.data_contract_summary import DataContractSummary
+from ..schemas.data_contract.routes.data_contract_bulk_create import DataContractBulkCreateResult
 from ..schemas.data_contract.routes.data_contract_create import DataContractCreate
 from ..schemas.data_contract.routes.data_contract_delete import DataContractDelete
+from ..schemas.data_contract.routes.data_contract_tags import DataContractTagCount
 from ..schemas.data_contract.routes.data_contract_update import DataContractUpdate
+from ..utils.cache import data_contract_cache
 from ..utils.config import settings
-from ..utils.tools import db_to_pydantic_model, pydantic_to_db_model
+from ..utils.shared_cache import shared_cache
+from ..utils.tools import (
+    chunked,
+    content_hash,
+    db_to_pydantic_model,
+    format_validation_error,
+    if_match_satisfied,
+    info_to_db_columns,
+    make_etag,
+    merge_patch_to_db_dict,
+    pydantic_to_db_dict,
+    pydantic_to_document,
+)
+
+# Label of the content hash selected along with the fields of a projection, which is not a field of a data contract
+CONTENT_HASH_LABEL = "content_hash"
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
-def create_data_contract(db: Session, data_contract: DataContractCreate) -> DataContract:
+def _select_fields(fields: Dict[str, Optional[List[str]]]) -> Select:
+    """
+    Builds a SELECT statement reading only the requested fields of the data contracts.
+
+    Whole sections are read as columns, and single keys of JSON sections are extracted by the database,
+    so the sections that were not requested are never read nor decoded. Compressed sections cannot be read
+    by the database, so they are read whole and their keys are picked by ``_row_to_summary``. The content hash
+    is read along with the fields, so that the ETag of the response describes the very fields returned.
+
+    :param Dict[str, Optional[List[str]]] fields: The projection, as returned by ``parse_fields``.
+    :return Select: The SELECT statement, with one labelled column per requested field, and the content hash.
+    """
+    columns = [DataContractModel.id, DataContractModel.content_hash.label(CONTENT_HASH_LABEL)]
+    for section, keys in fields.items():
+        if section == "id":
+            continue
+        column = getattr(DataContractModel, section)
+        if keys is None or isinstance(column.type, CompressedJSON):
+            columns.append(column.label(section))
+        else:
+            columns.extend(column[key].label(f"{section}.{key}") for key in keys)
+    return select(*columns)
+
+
+def _prefix_range(column: Any, prefix: str) -> ColumnElement[bool]:
+    """
+    Builds a condition matching the values of a column that start with a prefix.
+
+    The condition is a range rather than a LIKE pattern, so that it is evaluated through the B-tree index
+    of the column on every backend.
+
+    The upper bound is the prefix with its last character incremented. The trailing U+10FFFF characters cannot be
+    incremented, so they are dropped first, and a prefix made only of them has no upper bound.
+
+    :param Any column: The column to match.
+    :param str prefix: The case-sensitive prefix.
+    :return ColumnElement[bool]: The condition.
+    """
+    stem = prefix.rstrip(chr(sys.maxunicode))
+    if not stem:
+        return column >= prefix
+    following = ord(stem[-1]) + 1
+    # The surrogates cannot be encoded, and every character after them sorts after the ones before them
+    if 0xD800 <= following <= 0xDFFF:
+        following = 0xE000
+    return and_(column >= prefix, column < stem[:-1] + chr(following))
+
+
+def _filter(statement: Select, filters: Optional[Dict[str, Any]]) -> Select:
+    """
+    Restricts a SELECT statement on data contracts to the ones matching the filters.
+
+    The filters are evaluated by the database, through the indexed `info_*` columns and the tag table:
+
+    - ``owner``: the exact owner of the data contracts.
+    - ``title_prefix``: the case-sensitive prefix of their title.
+    - ``version``: their exact version, or a version range such as "2.x" or "2.*" (any version starting with "2.").
+    - ``tags_all``: a list of tags the data contracts must all have.
+    - ``tags_any``: a list of tags the data contracts must have at least one of.
+
+    :param Select statement: The SELECT statement to restrict.
+    :param Optional[Dict[str, Any]] filters: The filters, keyed by name. Missing or empty filters are ignored.
+    :return Select: The restricted SELECT statement.
+    """
+    filters = filters or {}
+    if filters.get("owner"):
+        statement = statement.where(DataContractModel.info_owner == filters["owner"])
+    if filters.get("title_prefix"):
+        statement = statement.where(_prefix_range(DataContractModel.info_title, filters["title_prefix"]))
+    version = filters.get("version")
+    if version:
+        if version.endswith((".x", ".*")):
+            statement = statement.where(_prefix_range(DataContractModel.info_version, version[:-1]))
+        else:
+            statement = statement.where(DataContractModel.info_version == version)
+    tags_all = set(filters.get("tags_all") or [])
+    if tags_all:
+        statement = statement.where(
+            DataContractModel.id.in_(
+                select(DataContractTagModel.contract_id)
+                .where(DataContractTagModel.tag.in_(tags_all))
+                .group_by(DataContractTagModel.contract_id)
+                .having(func.count() == len(tags_all))
+            )
+        )
+    tags_any = set(filters.get("tags_any") or [])
+    if tags_any:
+        statement = statement.where(
+            DataContractModel.id.in_(
+                select(DataContractTagModel.contract_id).where(DataContractTagModel.tag.in_(tags_any))
+            )
+        )
+    return statement
+
+
+def _tag_rows(id: str, tags: Optional[List[str]]) -> List[Dict[str, str]]:
+    """
+    Builds the rows of the tag table for the tags of a data contract.
+
+    :param str id: The ID of the data contract.
+    :param Optional[List[str]] tags: The tags of the data contract, if any.
+    :return List[Dict[str, str]]: One row per distinct tag.
+    """
+    return [{"contract_id": id, "tag": tag} for tag in dict.fromkeys(tags or [])]
+
+
+def _count_tags() -> Select:
+    """
+    Builds a SELECT statement counting the data contracts of each tag, most used first.
+
+    :return Select: The SELECT statement, returning `tag` and `count` columns.
+    """
+    count = func.count().label("count")
+    return (
+        select(DataContractTagModel.tag, count)
+        .group_by(DataContractTagModel.tag)
+        .order_by(count.desc(), DataContractTagModel.tag)
+    )
+
+
+def _select_missing_documents(rows: Sequence[Any]) -> Optional[Select]:
+    """
+    Builds a SELECT statement loading the data contracts that have no stored document yet.
+
+    :param Sequence[Any] rows: Rows holding the `id` and `document` columns of data contracts.
+    :return Optional[Select]: The SELECT statement, or None if every row has a document.
+    """
+    missing_ids = [row.id for row in rows if row.document is None]
+    if not missing_ids:
+        return None
+    return select(DataContractModel).where(DataContractModel.id.in_(missing_ids))
+
+
+def _merge_documents(rows: Sequence[Any], loaded: Sequence[DataContractModel]) -> List[str]:
+    """
+    Returns the JSON documents of data contracts, in the order of the rows.
+
+    Data contracts stored before the document column existed are serialized from their validated model.
+
+    :param Sequence[Any] rows: Rows holding the `id` and `document` columns of data contracts.
+    :param Sequence[DataContractModel] loaded: The data contracts loaded by ``_select_missing_documents``.
+    :return List[str]: The JSON documents.
+    """
+    serialized = {model.id: pydantic_to_document(db_to_pydantic_model(model)) for model in loaded}
+    return [row.document if row.document is not None else serialized[row.id] for row in rows]
+
+
+def _check_if_match(id: str, current: Any, if_match: Optional[str]) -> None:
+    """
+    Checks the If-Match header of a write against the current ETag of a data contract.
+
+    :param str id: The unique identifier of the data contract.
+    :param Any current: A row holding the `content_hash` column of the data contract.
+    :param Optional[str] if_match: The value of the If-Match header, if any.
+    :raises StaleDataError: If the header does not match the current ETag.
+    """
+    if not if_match_satisfied(if_match, make_etag([current.content_hash])):
+        raise StaleDataError(f"Data contract {id} does not match {if_match}")
+
+
+def _update_version(id: str, version: int, row: Dict[str, Any]) -> Update:
+    """
+    Builds an UPDATE statement writing a data contract only if it is still at the version it was read at.
+
+    The version is compared and incremented by the statement itself, so that of two concurrent writes based on the
+    same version, only one updates the row and the other one updates no row, without any lock being taken.
+
+    :param str id: The unique identifier of the data contract.
+    :param int version: The version of the data contract when it was read.
+    :param Dict[str, Any] row: The column values to write.
+    :return Update: The UPDATE statement, of which the row count tells whether the write applied.
+    """
+    return (
+        update(DataContractModel)
+        .where(DataContractModel.id == id, DataContractModel.version == version)
+        .values(**row, version=version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _load_document(db: Session, id: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Reads the stored JSON document of a data contract and its content hash from the database.
+
+    :param Session db: The database session.
+    :param str id: The unique identifier of the data contract.
+    :return Optional[Tuple[str, Optional[str]]]: The document and content hash, or None if not found.
+    """
+    rows = db.execute(
+        select(DataContractModel.id, DataContractModel.document, DataContractModel.content_hash).where(
+            DataContractModel.id == id
+        )
+    ).all()
+    if not rows:
+        return None
+    statement = _select_missing_documents(rows)
+    return _merge_documents(rows, db.scalars(statement).all() if statement is not None else [])[0], rows[0].content_hash
+
+
+def _invalidate_cached(db: Session, *ids: str) -> None:
+    """
+    Drops written data contracts from the in-process cache of every worker, and from the shared cache.
+
+    When the write is committed by the write queue, they are only dropped once its group is committed, so that
+    the previous version is not cached again in between.
+
+    :param Session db: The database session the write was committed by.
+    :param str ids: The unique identifiers of the written data contracts.
+    """
+
+    def invalidate() -> None:
+        data_contract_cache.invalidate(*ids)
+        shared_cache.invalidate(ids)
+
+    after_commit(db, invalidate)
+
+
+def _prepare_bulk_rows(
+    data_contracts: List[Any],
+) -> Tuple[List[Optional[DataContractBulkCreateResult]], List[Tuple[int, Dict[str, Any]]]]:
+    """
+    Validates and converts the data contracts of a bulk creation in a single pass.
+
+    :param List[Any] data_contracts: The raw data contracts to create, as parsed from the request body.
+    :return Tuple[List[Optional[DataContractBulkCreateResult]], List[Tuple[int, Dict[str, Any]]]]: The outcome of
+        each data contract, set for the invalid ones and the duplicated IDs, and the column values of the others,
+        along with their index.
+    """
+    results: List[Optional[DataContractBulkCreateResult]] = [None] * len(data_contracts)
+    pending: List[Tuple[int, Dict[str, Any]]] = []
+    seen_ids = set()
+    for index, raw_data_contract in enumerate(data_contracts):
+        raw_id = raw_data_contract.get("id") if isinstance(raw_data_contract, dict) else None
+        try:
+            data_contract = DataContractCreate.model_validate(raw_data_contract)
+        except ValidationError as e:
+            results[index] = DataContractBulkCreateResult(
+                index=index,
+                id=raw_id if isinstance(raw_id, str) else None,
+                success=False,
+                error=format_validation_error(e),
+            )
+            continue
+        if data_contract.id in seen_ids:
+            results[index] = DataContractBulkCreateResult(
+                index=index, id=data_contract.id, success=False, error="Duplicated ID in the request"
+            )
+            continue
+        seen_ids.add(data_contract.id)
+        pending.append((index, pydantic_to_db_dict(data_contract)))
+    return results, pending
+
+
+def _skip_existing(
+    results: List[Optional[DataContractBulkCreateResult]],
+    pending: List[Tuple[int, Dict[str, Any]]],
+    existing_ids: Set[str],
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Reports the data contracts of a bulk creation whose IDs already exist, and drops them from the rows to insert.
+
+    :param List[Optional[DataContractBulkCreateResult]] results: The outcome of each data contract, updated in place.
+    :param List[Tuple[int, Dict[str, Any]]] pending: The column values to insert, along with their index.
+    :param Set[str] existing_ids: The IDs of the pending data contracts that already exist.
+    :return List[Tuple[int, Dict[str, Any]]]: The column values left to insert, along with their index.
+    """
+    for index, row in pending:
+        if row["id"] in existing_ids:
+            results[index] = DataContractBulkCreateResult(
+                index=index, id=row["id"], success=False, error="Data contract already exists"
+            )
+    return [(index, row) for index, row in pending if row["id"] not in existing_ids]
+
+
+def _paginate(statement: Select, limit: int, after_id: Optional[str]) -> Select:
+    """
+    Restricts a SELECT statement on data contracts to one keyset page, ordered by ID.
+
+    One more row than ``limit`` is selected, to know whether another page follows.
+
+    :param Select statement: The SELECT statement to restrict.
+    :param int limit: The maximum number of data contracts of the page.
+    :param Optional[str] after_id: The ID of the last data contract of the previous page, if any.
+    :return Select: The restricted SELECT statement.
+    """
+    statement = statement.order_by(DataContractModel.id)
+    if after_id is not None:
+        statement = statement.where(DataContractModel.id > after_id)
+    return statement.limit(limit + 1)
+
+
+def _row_to_summary(row: Any, fields: Dict[str, Optional[List[str]]]) -> DataContractSummary:
+    """
+    Converts a projected row into a data contract summary, without validating the JSON sections.
+
+    :param Row row: A row returned by a statement built with ``_select_fields``.
+    :param Dict[str, Optional[List[str]]] fields: The projection the statement was built from.
+    :return DataContractSummary: The summary, holding only the requested fields.
+    """
+    summary: Dict[str, Any] = {}
+    for label, value in row._mapping.items():
+        if label == CONTENT_HASH_LABEL:
+            continue
+        section, _, key = label.partition(".")
+        if key:
+            summary.setdefault(section, {})[key] = value
+        elif fields.get(section) is not None:
+            # A compressed section read whole, of which only some keys were requested
+            summary[section] = {key: value.get(key) if isinstance(value, dict) else None for key in fields[section]}
+        else:
+            summary[section] = value
+    return DataContractSummary.model_construct(**summary)
+
+
+def create_data_contract(db: Session, data_contract: DataContractCreate) -> Dict[str, Any]:
     """
     Creates a new data contract in the database.
 
+    The data contract has already been validated, so it is serialized once and stored as is. The stored document
+    is returned along with the other column values, so that it can be served without serializing it again.
+
     :param Session db: The database session.
     :param DataContractCreate data_contract: The data contract to be created.
-    :return DataContract: The created data contract.
+    :return Dict[str, Any]: The column values of the created data contract, including its document and content hash.
     :raises SQLAlchemyError: If there's an error during database operations.
     :raises Exception: If there's any other unexpected error.
     """
     try:
-        created_data_contract = DataContract.model_validate(data_contract.model_dump())
-        db_data_contract = pydantic_to_db_model(created_data_contract)
-        db.add(db_data_contract)
+        row = pydantic_to_db_dict(data_contract)
+        db.add(DataContractModel(**row))
+        db.add_all(DataContractTagModel(**tag_row) for tag_row in _tag_rows(row["id"], row["tags"]))
         db.commit()
-        db.refresh(db_data_contract)
-        logger.info(f" ✅ Data contract created successfully: {db_data_contract.id}")
-        return created_data_contract
+        logger.info(f" ✅ Data contract created successfully: {row['id']}")
+        return row
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f" ❌ Failed to create data contract: {str(e)}")
@@ -43,24 +386,143 @@ def create_data_contract(db: Session, data_contract: DataContractCreate) -> Data
         raise
 
 
-def get_data_contract(db: Session, id: str) -> Optional[DataContract]:
+def bulk_create_data_contracts(
+    db: Session, data_contracts: List[Any], chunk_size: int = settings.BULK_CHUNK_SIZE
+) -> List[DataContractBulkCreateResult]:
     """
-    Retrieves a data contract from the database by its ID.
+    Creates many data contracts at once, reporting the outcome of each of them.
+
+    Every data contract is validated and converted in a single pass. Invalid ones, duplicated IDs and
+    IDs that already exist are reported without aborting the batch. The remaining ones are inserted
+    with one executemany statement and one commit per chunk of ``chunk_size`` rows: if a chunk fails,
+    it is rolled back and all of its data contracts are reported as failed.
+
+    :param Session db: The database session.
+    :param List[Any] data_contracts: The raw data contracts to create, as parsed from the request body.
+    :param int chunk_size: The maximum number of data contracts inserted per transaction.
+    :return List[DataContractBulkCreateResult]: The outcome for each data contract, in the input order.
+    :raises SQLAlchemyError: If there's an error while looking up the existing data contracts.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        results, pending = _prepare_bulk_rows(data_contracts)
+        existing_ids = set()
+        for ids in chunked([row["id"] for _, row in pending], settings.IN_CLAUSE_CHUNK_SIZE):
+            existing_ids.update(db.scalars(select(DataContractModel.id).where(DataContractModel.id.in_(ids))))
+        pending = _skip_existing(results, pending, existing_ids)
+
+        for chunk in chunked(pending, chunk_size):
+            try:
+                db.execute(insert(DataContractModel), [row for _, row in chunk])
+                tag_rows = [tag_row for _, row in chunk for tag_row in _tag_rows(row["id"], row["tags"])]
+                if tag_rows:
+                    db.execute(insert(DataContractTagModel), tag_rows)
+                db.commit()
+                for index, row in chunk:
+                    results[index] = DataContractBulkCreateResult(index=index, id=row["id"], success=True)
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.error(f" ❌ Failed to insert a chunk of {len(chunk)} data contracts: {str(e)}")
+                for index, row in chunk:
+                    results[index] = DataContractBulkCreateResult(
+                        index=index, id=row["id"], success=False, error=f"Failed to insert data contract: {str(e)}"
+                    )
+
+        created = sum(result.success for result in results)
+        logger.info(f" ✅ Bulk created {created} data contracts, {len(results) - created} failed")
+        return results
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f" ❌ Failed to bulk create data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while bulk creating data contracts: {str(e)}")
+        raise
+
+
+def get_data_contract_document(db: Session, id: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Retrieves the stored JSON document of a data contract and its content hash by its ID.
+
+    The document was validated when it was written, so it is returned as is, without being parsed. It is served
+    from ``data_contract_cache`` when it was read recently, and stored in it otherwise.
 
     :param Session db: The database session.
     :param str id: The unique identifier of the data contract to retrieve.
-    :return Optional[DataContract]: The retrieved data contract, or None if not found.
+    :return Optional[Tuple[str, Optional[str]]]: The JSON document of the data contract and its content hash, read
+        together so that the hash describes the document, or None if not found.
     :raises SQLAlchemyError: If there's an error during database operations.
     :raises Exception: If there's any other unexpected error.
     """
+    cached = data_contract_cache.get(id)
+    if cached is not None:
+        return cached
     try:
-        db_data_contract = db.query(DataContractModel).filter_by(id=id).first()
-        if db_data_contract is None:
+        generation = data_contract_cache.generation
+        entry = shared_cache.get_data_contract(id, lambda: _load_document(db, id))
+        if entry is None:
             logger.warning(f" ⚠️ Data contract not found: {id}")
             return None
-        data_contract = db_to_pydantic_model(db_data_contract)
+        if entry[1] is not None:
+            data_contract_cache.put(id, entry, generation)
         logger.info(f" ✅ Data contract retrieved successfully: {id}")
-        return data_contract
+        return entry
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contract: {str(e)}")
+        raise
+
+
+def get_data_contract_content_hash(db: Session, id: str) -> Optional[str]:
+    """
+    Retrieves the content hash of a data contract by its ID, without reading its JSON columns.
+
+    The content hash is served from ``data_contract_cache`` or from the shared cache when the data contract was read
+    recently.
+
+    :param Session db: The database session.
+    :param str id: The unique identifier of the data contract.
+    :return Optional[str]: The content hash of the data contract, or None if not found or not hashed yet.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    cached = data_contract_cache.get(id)
+    if cached is not None:
+        return cached[1]
+    generation = data_contract_cache.generation
+    cached = shared_cache.peek_data_contract(id)
+    if cached is not None:
+        data_contract_cache.put(id, cached, generation)
+        return cached[1]
+    try:
+        return db.scalar(select(DataContractModel.content_hash).where(DataContractModel.id == id))
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve the content hash of data contract {id}: {str(e)}")
+        raise
+
+
+def get_data_contract_summary(
+    db: Session, id: str, fields: Dict[str, Optional[List[str]]]
+) -> Optional[Tuple[DataContractSummary, Optional[str]]]:
+    """
+    Retrieves the requested fields of a data contract and its content hash from the database by its ID.
+
+    :param Session db: The database session.
+    :param str id: The unique identifier of the data contract to retrieve.
+    :param Dict[str, Optional[List[str]]] fields: The projection, as returned by ``parse_fields``.
+    :return Optional[Tuple[DataContractSummary, Optional[str]]]: The retrieved data contract summary and the content
+        hash of the data contract, read in the same query, or None if not found.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        row = db.execute(_select_fields(fields).where(DataContractModel.id == id)).first()
+        if row is None:
+            logger.warning(f" ⚠️ Data contract not found: {id}")
+            return None
+        logger.info(f" ✅ Data contract summary retrieved successfully: {id}")
+        return _row_to_summary(row, fields), row.content_hash
     except SQLAlchemyError as e:
         logger.error(f" ❌ Failed to retrieve data contract: {str(e)}")
         raise
@@ -69,34 +531,92 @@ def get_data_contract(db: Session, id: str) -> Optional[DataContract]:
         raise
 
 
-def update_data_contract(db: Session, id: str, data_contract_update: DataContractUpdate) -> Optional[DataContract]:
+def get_data_contracts_by_ids(db: Session, ids: List[str]) -> Tuple[List[DataContract], List[str]]:
+    """
+    Retrieves many data contracts from the database by their IDs.
+
+    The IDs are looked up with ``IN (...)`` queries, chunked to stay under the database's limit
+    on the number of bound parameters.
+
+    :param Session db: The database session.
+    :param List[str] ids: The unique identifiers of the data contracts to retrieve.
+    :return Tuple[List[DataContract], List[str]]: The retrieved data contracts and the IDs that were not found,
+        both in the requested order and without duplicates.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        unique_ids = list(dict.fromkeys(ids))
+        found: Dict[str, DataContract] = {}
+        for chunk in chunked(unique_ids, settings.IN_CLAUSE_CHUNK_SIZE):
+            statement = select(DataContractModel).where(DataContractModel.id.in_(chunk))
+            for db_data_contract in db.scalars(statement):
+                found[db_data_contract.id] = db_to_pydantic_model(db_data_contract)
+
+        data_contracts = [found[id] for id in unique_ids if id in found]
+        missing_ids = [id for id in unique_ids if id not in found]
+        logger.info(f" ✅ Retrieved {len(data_contracts)} data contracts successfully, {len(missing_ids)} missing")
+        return data_contracts, missing_ids
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contracts: {str(e)}")
+        raise
+
+
+def update_data_contract(
+    db: Session, id: str, data_contract_update: DataContractUpdate, if_match: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
     """
     Updates an existing data contract in the database.
 
+    The data contract has already been validated, so it is serialized once and stored as is. The write only
+    applies if the data contract is still at the version it was read at, and it is retried on the new version
+    otherwise, up to ``settings.WRITE_CONFLICT_RETRIES`` times.
+
     :param Session db: The database session.
     :param str id: The unique identifier of the data contract to update.
     :param DataContractUpdate data_contract_update: The data contract update information.
-    :return Optional[DataContract]: The updated data contract, or None if not found.
+    :param Optional[str] if_match: The If-Match header of the request, if any. The update only applies if it
+        matches the current ETag of the data contract.
+    :return Optional[Dict[str, Any]]: The values of the updated columns, or None if not found.
+    :raises StaleDataError: If the If-Match header does not match, or if the data contract kept being modified
+        concurrently.
     :raises SQLAlchemyError: If there's an error during database operations.
     :raises Exception: If there's any other unexpected error.
     """
     try:
-        updated_data_contract = DataContract.model_validate(data_contract_update.model_dump(exclude_unset=True))
-        updated_data_contract_db = pydantic_to_db_model(updated_data_contract)
+        row = pydantic_to_db_dict(data_contract_update)
+        for _ in range(settings.WRITE_CONFLICT_RETRIES):
+            current = db.execute(
+                select(DataContractModel.version, DataContractModel.content_hash).where(DataContractModel.id == id)
+            ).first()
+            if current is None:
+                logger.warning(f" ⚠️ Data contract not found for update: {id}")
+                return None
+            _check_if_match(id, current, if_match)
 
-        db_data_contract = db.query(DataContractModel).filter_by(id=id).first()
-        if db_data_contract is None:
-            logger.warning(f" ⚠️ Data contract not found for update: {id}")
-            return None
+            db.execute(delete(DataContractTagModel).where(DataContractTagModel.contract_id == id))
+            if db.execute(_update_version(id, current.version, row)).rowcount == 1:
+                break
+            db.rollback()
+        else:
+            raise StaleDataError(f"Data contract {id} kept being modified concurrently")
 
-        for key, value in updated_data_contract_db.__dict__.items():
-            if hasattr(db_data_contract, key) and key[0] != "_":
-                setattr(db_data_contract, key, value)
-            else:
-                logger.warning(f" ⚠️ Attribute {key} not found in DataContractModel")
+        tag_rows = _tag_rows(row["id"], row["tags"])
+        if tag_rows:
+            db.execute(insert(DataContractTagModel), tag_rows)
         db.commit()
-        logger.info(f" ✅ Data contract updated successfully: {id}")
-        return updated_data_contract
+        _invalidate_cached(db, id, row["id"])
+        logger.info(f" ✅ Data contract updated successfully: {id} (version {current.version + 1})")
+        return row
+    except StaleDataError as e:
+        db.rollback()
+        # The data contract was written by someone else, possibly through another worker process
+        data_contract_cache.invalidate(id)
+        logger.warning(f" ⚠️ Data contract update rejected: {str(e)}")
+        raise
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f" ❌ Failed to update data contract: {str(e)}")
@@ -106,20 +626,175 @@ def update_data_contract(db: Session, id: str, data_contract_update: DataContrac
         raise
 
 
-def list_data_contracts(db: Session) -> List[DataContract]:
+def patch_data_contract(db: Session, id: str, patch: Any, if_match: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Applies a JSON merge patch (RFC 7386) to an existing data contract.
+
+    Only the stored document of the data contract is read, only the patched sections are validated, and only
+    their columns are written, along with the new document and its content hash. The write only applies if the
+    data contract is still at the version the patch was merged into, and the patch is merged again into the new
+    version otherwise, up to ``settings.WRITE_CONFLICT_RETRIES`` times.
+
+    :param Session db: The database session.
+    :param str id: The unique identifier of the data contract to patch.
+    :param Any patch: The merge patch, as decoded from the request body.
+    :param Optional[str] if_match: The If-Match header of the request, if any. The patch only applies if it
+        matches the current ETag of the data contract.
+    :return Optional[Dict[str, Any]]: The values of the updated columns, or None if not found.
+    :raises ValueError: If the patch is not an object, changes the ID, or patches an unknown section.
+    :raises RequestValidationError: If a patched section is invalid.
+    :raises StaleDataError: If the If-Match header does not match, or if the data contract kept being modified
+        concurrently.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        for _ in range(settings.WRITE_CONFLICT_RETRIES):
+            rows = db.execute(
+                select(
+                    DataContractModel.id,
+                    DataContractModel.document,
+                    DataContractModel.version,
+                    DataContractModel.content_hash,
+                ).where(DataContractModel.id == id)
+            ).all()
+            if not rows:
+                logger.warning(f" ⚠️ Data contract not found for patch: {id}")
+                return None
+            _check_if_match(id, rows[0], if_match)
+            statement = _select_missing_documents(rows)
+            document = _merge_documents(rows, db.scalars(statement).all() if statement is not None else [])[0]
+            row = merge_patch_to_db_dict(id, document, patch)
+
+            if db.execute(_update_version(id, rows[0].version, row)).rowcount == 1:
+                break
+            db.rollback()
+        else:
+            raise StaleDataError(f"Data contract {id} kept being modified concurrently")
+
+        if "tags" in row:
+            db.execute(delete(DataContractTagModel).where(DataContractTagModel.contract_id == id))
+            tag_rows = _tag_rows(id, row["tags"])
+            if tag_rows:
+                db.execute(insert(DataContractTagModel), tag_rows)
+        db.commit()
+        _invalidate_cached(db, id)
+        logger.info(f" ✅ Data contract patched successfully: {id} ({', '.join(sorted(row))})")
+        return row
+    except (ValueError, RequestValidationError) as e:
+        logger.warning(f" ⚠️ Invalid merge patch for data contract {id}: {str(e)}")
+        raise
+    except StaleDataError as e:
+        db.rollback()
+        # The data contract was written by someone else, possibly through another worker process
+        data_contract_cache.invalidate(id)
+        logger.warning(f" ⚠️ Data contract patch rejected: {str(e)}")
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f" ❌ Failed to patch data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while patching data contract: {str(e)}")
+        raise
+
+
+def list_data_contract_documents(
+    db: Session,
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    after_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[str], List[Optional[str]], Optional[str]]:
+    """
+    Retrieves the stored JSON documents of one page of data contracts and their content hashes, ordered by ID.
+
+    The content hashes are read along with the documents, so that they describe the very documents returned.
+
+    :param Session db: The database session.
+    :param int limit: The maximum number of data contracts to return.
+    :param Optional[str] after_id: The ID of the last data contract of the previous page, if any.
+    :param Optional[Dict[str, Any]] filters: The filters the data contracts must match, as accepted by ``_filter``.
+    :return Tuple[List[str], List[Optional[str]], Optional[str]]: The JSON documents of the page, their content
+        hashes, and the ID to resume after when requesting the next page (None if this is the last page).
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        statement = _filter(
+            select(DataContractModel.id, DataContractModel.document, DataContractModel.content_hash), filters
+        )
+        rows = db.execute(_paginate(statement, limit, after_id)).all()
+
+        next_after_id = rows[limit - 1].id if len(rows) > limit else None
+        rows = rows[:limit]
+        statement = _select_missing_documents(rows)
+        documents = _merge_documents(rows, db.scalars(statement).all() if statement is not None else [])
+        logger.info(f" ✅ Retrieved {len(documents)} data contracts successfully")
+        return documents, [row.content_hash for row in rows], next_after_id
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contracts: {str(e)}")
+        raise
+
+
+def list_data_contract_content_hashes(
+    db: Session,
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    after_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Optional[str]], Optional[str]]:
     """
-    Retrieves all data contracts from the database.
+    Retrieves the content hashes of one page of data contracts, ordered by ID, without reading their JSON columns.
 
     :param Session db: The database session.
-    :return List[DataContract]: A list of all data contracts.
+    :param int limit: The maximum number of data contracts of the page.
+    :param Optional[str] after_id: The ID of the last data contract of the previous page, if any.
+    :param Optional[Dict[str, Any]] filters: The filters the data contracts must match, as accepted by ``_filter``.
+    :return Tuple[List[Optional[str]], Optional[str]]: The content hashes of the page, and the ID to resume after
+        when requesting the next page (None if this is the last page).
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    try:
+        statement = _filter(select(DataContractModel.id, DataContractModel.content_hash), filters)
+        rows = db.execute(_paginate(statement, limit, after_id)).all()
+        next_after_id = rows[limit - 1].id if len(rows) > limit else None
+        return [row.content_hash for row in rows[:limit]], next_after_id
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve the content hashes of data contracts: {str(e)}")
+        raise
+
+
+def list_data_contract_summaries(
+    db: Session,
+    fields: Dict[str, Optional[List[str]]],
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    after_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[DataContractSummary], List[Optional[str]], Optional[str]]:
+    """
+    Retrieves the requested fields of one page of data contracts and their content hashes from the database, ordered
+    by ID.
+
+    :param Session db: The database session.
+    :param Dict[str, Optional[List[str]]] fields: The projection, as returned by ``parse_fields``.
+    :param int limit: The maximum number of data contracts to return.
+    :param Optional[str] after_id: The ID of the last data contract of the previous page, if any.
+    :param Optional[Dict[str, Any]] filters: The filters the data contracts must match, as accepted by ``_filter``.
+    :return Tuple[List[DataContractSummary], List[Optional[str]], Optional[str]]: The data contract summaries of the
+        page, their content hashes, read in the same query, and the ID to resume after when requesting the next page
+        (None if this is the last page).
     :raises SQLAlchemyError: If there's an error during database operations.
     :raises Exception: If there's any other unexpected error.
     """
     try:
-        db_data_contracts = db.query(DataContractModel).all()
-        data_contracts = [db_to_pydantic_model(db_contract) for db_contract in db_data_contracts]
-        logger.info(f" ✅ Retrieved {len(data_contracts)} data contracts successfully")
-        return data_contracts
+        rows = db.execute(_paginate(_filter(_select_fields(fields), filters), limit, after_id)).all()
+
+        next_after_id = rows[limit - 1].id if len(rows) > limit else None
+        summaries = [_row_to_summary(row, fields) for row in rows[:limit]]
+        logger.info(f" ✅ Retrieved {len(summaries)} data contract summaries successfully")
+        return summaries, [row.content_hash for row in rows[:limit]], next_after_id
     except SQLAlchemyError as e:
         logger.error(f" ❌ Failed to retrieve data contracts: {str(e)}")
         raise
@@ -128,6 +803,219 @@ def list_data_contracts(db: Session) -> List[DataContract]:
         raise
 
 
+def backfill_info_columns(db: Session, batch_size: int = settings.EXPORT_BATCH_SIZE) -> int:
+    """
+    Populates the indexed `info_*` columns of the data contracts stored before these columns existed.
+
+    The data contracts are updated in batches of ``batch_size``, each batch being committed on its own.
+
+    :param Session db: The database session.
+    :param int batch_size: The number of data contracts updated per batch.
+    :return int: The number of data contracts updated.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    updated = 0
+    last_id = ""
+    try:
+        while True:
+            rows = db.execute(
+                select(DataContractModel.id, DataContractModel.info)
+                .where(DataContractModel.info_title.is_(None), DataContractModel.id > last_id)
+                .order_by(DataContractModel.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            db.execute(update(DataContractModel), [{"id": row.id, **info_to_db_columns(row.info)} for row in rows])
+            db.commit()
+            updated += len(rows)
+            last_id = rows[-1].id
+        if updated:
+            logger.info(f" ✅ Indexed info columns populated for {updated} data contracts")
+        return updated
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f" ❌ Failed to populate the indexed info columns: {str(e)}")
+        raise
+
+
+def backfill_data_contract_tags(db: Session, batch_size: int = settings.EXPORT_BATCH_SIZE) -> int:
+    """
+    Populates the tag table for the tagged data contracts stored before this table existed.
+
+    :param Session db: The database session.
+    :param int batch_size: The number of data contracts processed per batch.
+    :return int: The number of data contracts whose tags were indexed.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    indexed = 0
+    last_id = ""
+    try:
+        while True:
+            rows = db.execute(
+                select(DataContractModel.id, DataContractModel.tags)
+                .where(
+                    DataContractModel.id > last_id,
+                    DataContractModel.tags.is_not(None),
+                    ~exists().where(DataContractTagModel.contract_id == DataContractModel.id),
+                )
+                .order_by(DataContractModel.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            tag_rows = [tag_row for row in rows for tag_row in _tag_rows(row.id, row.tags)]
+            if tag_rows:
+                db.execute(insert(DataContractTagModel), tag_rows)
+            db.commit()
+            indexed += len(rows)
+            last_id = rows[-1].id
+        if indexed:
+            logger.info(f" ✅ Tags indexed for {indexed} data contracts")
+        return indexed
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f" ❌ Failed to index the data contract tags: {str(e)}")
+        raise
+
+
+def backfill_data_contract_documents(db: Session, batch_size: int = settings.EXPORT_BATCH_SIZE) -> int:
+    """
+    Populates the JSON documents and content hashes of the data contracts stored before these columns existed.
+
+    :param Session db: The database session.
+    :param int batch_size: The number of data contracts updated per batch.
+    :return int: The number of data contracts updated.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    updated = 0
+    last_id = ""
+    try:
+        while True:
+            rows = db.execute(
+                select(DataContractModel.id, DataContractModel.document)
+                .where(
+                    or_(DataContractModel.document.is_(None), DataContractModel.content_hash.is_(None)),
+                    DataContractModel.id > last_id,
+                )
+                .order_by(DataContractModel.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            statement = _select_missing_documents(rows)
+            documents = _merge_documents(rows, db.scalars(statement).all() if statement is not None else [])
+            db.execute(
+                update(DataContractModel),
+                [
+                    {"id": row.id, "document": document, "content_hash": content_hash(document)}
+                    for row, document in zip(rows, documents)
+                ],
+            )
+            db.commit()
+            updated += len(rows)
+            last_id = rows[-1].id
+        if updated:
+            logger.info(f" ✅ JSON documents and content hashes populated for {updated} data contracts")
+        return updated
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f" ❌ Failed to populate the JSON documents: {str(e)}")
+        raise
+
+
+def compress_data_contracts(db: Session, batch_size: int = settings.EXPORT_BATCH_SIZE) -> int:
+    """
+    Rewrites the compressed columns of every data contract, so that rows stored before compression was enabled
+    (or with a different threshold) are stored with the current settings.
+
+    Rows are read and written back column by column, without being converted to data contracts.
+
+    :param Session db: The database session.
+    :param int batch_size: The number of data contracts rewritten per batch.
+    :return int: The number of data contracts rewritten.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    columns = [column.name for column in DataContractModel.__table__.columns if isinstance(column.type, CompressedText)]
+    rewritten = 0
+    last_id = ""
+    try:
+        while True:
+            rows = db.execute(
+                select(DataContractModel.id, *(getattr(DataContractModel, column) for column in columns))
+                .where(DataContractModel.id > last_id)
+                .order_by(DataContractModel.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            db.execute(update(DataContractModel), [dict(row._mapping) for row in rows])
+            db.commit()
+            rewritten += len(rows)
+            last_id = rows[-1].id
+        logger.info(f" ✅ Compressed columns rewritten for {rewritten} data contracts")
+        return rewritten
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f" ❌ Failed to rewrite the compressed columns: {str(e)}")
+        raise
+
+
+def count_data_contract_tags(db: Session) -> List[DataContractTagCount]:
+    """
+    Counts the data contracts carrying each tag, from the tag table.
+
+    :param Session db: The database session.
+    :return List[DataContractTagCount]: The tags with their number of data contracts, most used first.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        rows = db.execute(_count_tags()).all()
+        logger.info(f" ✅ Counted {len(rows)} data contract tags successfully")
+        return [DataContractTagCount(tag=row.tag, count=row.count) for row in rows]
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to count data contract tags: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while counting data contract tags: {str(e)}")
+        raise
+
+
+def iter_data_contract_documents(db: Session, batch_size: int = settings.EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """
+    Iterates over the stored JSON documents of all data contracts of the database, ordered by ID.
+
+    Rows are fetched from the database cursor in batches of ``batch_size``, so memory usage stays
+    flat regardless of the size of the catalog. The documents are returned as stored, without being
+    validated again, as served by the GET and list routes.
+
+    :param Session db: The database session. It must stay open until the iteration is over.
+    :param int batch_size: The number of rows fetched from the database at once.
+    :yield: The JSON documents, one at a time.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        statement = (
+            select(DataContractModel.id, DataContractModel.document)
+            .order_by(DataContractModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        count = 0
+        for rows in db.execute(statement).partitions():
+            missing = _select_missing_documents(rows)
+            yield from _merge_documents(rows, db.scalars(missing).all() if missing is not None else [])
+            count += len(rows)
+        logger.info(f" ✅ Iterated over {count} data contracts successfully")
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to iterate over data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while iterating over data contracts: {str(e)}")
+        raise
+
+
 def delete_data_contract(db: Session, data_contract_delete: DataContractDelete) -> Optional[DataContract]:
     """
     Deletes a data contract from the database.
@@ -145,8 +1033,10 @@ def delete_data_contract(db: Session, data_contract_delete: DataContractDelete)
             return None
 
         deleted_data_contract = db_to_pydantic_model(db_data_contract)
+        db.execute(delete(DataContractTagModel).where(DataContractTagModel.contract_id == data_contract_delete.id))
         db.delete(db_data_contract)
         db.commit()
+        _invalidate_cached(db, data_contract_delete.id)
         logger.info(f" ✅ Data contract deleted successfully: {data_contract_delete.id}")
         return deleted_data_contract
     except SQLAlchemyError as e:
@@ -156,3 +1046,40 @@ def delete_data_contract(db: Session, data_contract_delete: DataContractDelete)
     except Exception as e:
         logger.error(f" ❌ Unexpected error occurred while deleting data contract: {str(e)}")
         raise
+
+
+def delete_data_contracts_by_ids(db: Session, ids: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Deletes many data contracts from the database by their IDs, in a single transaction.
+
+    The IDs are looked up and deleted with ``IN (...)`` statements, chunked to stay under the database's
+    limit on the number of bound parameters.
+
+    :param Session db: The database session.
+    :param List[str] ids: The unique identifiers of the data contracts to delete.
+    :return Tuple[List[str], List[str]]: The IDs that were deleted and the IDs that were not found,
+        both in the requested order and without duplicates.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        unique_ids = list(dict.fromkeys(ids))
+        found_ids = set()
+        for chunk in chunked(unique_ids, settings.IN_CLAUSE_CHUNK_SIZE):
+            found_ids.update(db.scalars(select(DataContractModel.id).where(DataContractModel.id.in_(chunk))))
+            db.execute(delete(DataContractTagModel).where(DataContractTagModel.contract_id.in_(chunk)))
+            db.execute(delete(DataContractModel).where(DataContractModel.id.in_(chunk)))
+        db.commit()
+        _invalidate_cached(db, *unique_ids)
+
+        deleted_ids = [id for id in unique_ids if id in found_ids]
+        missing_ids = [id for id in unique_ids if id not in found_ids]
+        logger.info(f" ✅ Deleted {len(deleted_ids)} data contracts successfully, {len(missing_ids)} missing")
+        return deleted_ids, missing_ids
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f" ❌ Failed to delete data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while deleting data contracts: {str(e)}")
+        raise
@@ -0,0 +1,617 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from ..models.data_contract import DataContract as DataContractModel
+from ..models.data_contract_tag import DataContractTag as DataContractTagModel
+from ..schemas.data_contract.objects.data_contract import DataContract
+from ..schemas.data_contract.objects.data_contract_summary import DataContractSummary
+from ..schemas.data_contract.routes.data_contract_bulk_create import DataContractBulkCreateResult
+from ..schemas.data_contract.routes.data_contract_create import DataContractCreate
+from ..schemas.data_contract.routes.data_contract_delete import DataContractDelete
+from ..schemas.data_contract.routes.data_contract_tags import DataContractTagCount
+from ..schemas.data_contract.routes.data_contract_update import DataContractUpdate
+from ..utils.cache import data_contract_cache
+from ..utils.config import settings
+from ..utils.shared_cache import shared_cache
+from ..utils.tools import chunked, db_to_pydantic_model, merge_patch_to_db_dict, pydantic_to_db_dict
+from .data_contract import (
+    _check_if_match,
+    _count_tags,
+    _filter,
+    _merge_documents,
+    _paginate,
+    _prepare_bulk_rows,
+    _row_to_summary,
+    _select_fields,
+    _select_missing_documents,
+    _skip_existing,
+    _tag_rows,
+    _update_version,
+)
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+
+async def _load_document(db: AsyncSession, id: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Reads the stored JSON document of a data contract and its content hash from the database.
+
+    :param AsyncSession db: The async database session.
+    :param str id: The unique identifier of the data contract.
+    :return Optional[Tuple[str, Optional[str]]]: The document and content hash, or None if not found.
+    """
+    rows = (
+        await db.execute(
+            select(DataContractModel.id, DataContractModel.document, DataContractModel.content_hash).where(
+                DataContractModel.id == id
+            )
+        )
+    ).all()
+    if not rows:
+        return None
+    statement = _select_missing_documents(rows)
+    loaded = (await db.scalars(statement)).all() if statement is not None else []
+    return _merge_documents(rows, loaded)[0], rows[0].content_hash
+
+
+async def _invalidate_cached(*ids: str) -> None:
+    """
+    Drops written data contracts from the in-process cache of every worker, and from the shared cache.
+
+    :param str ids: The unique identifiers of the written data contracts.
+    """
+    data_contract_cache.invalidate(*ids)
+    await shared_cache.ainvalidate(ids)
+
+
+async def create_data_contract(db: AsyncSession, data_contract: DataContractCreate) -> Dict[str, Any]:
+    """
+    Creates a new data contract in the database.
+
+    The data contract has already been validated, so it is serialized once and stored as is. The stored document
+    is returned along with the other column values, so that it can be served without serializing it again.
+
+    :param AsyncSession db: The async database session.
+    :param DataContractCreate data_contract: The data contract to be created.
+    :return Dict[str, Any]: The column values of the created data contract, including its document and content hash.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        row = pydantic_to_db_dict(data_contract)
+        db.add(DataContractModel(**row))
+        db.add_all(DataContractTagModel(**tag_row) for tag_row in _tag_rows(row["id"], row["tags"]))
+        await db.commit()
+        logger.info(f" ✅ Data contract created successfully: {row['id']}")
+        return row
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f" ❌ Failed to create data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while creating data contract: {str(e)}")
+        raise
+
+
+async def bulk_create_data_contracts(
+    db: AsyncSession, data_contracts: List[Any], chunk_size: int = settings.BULK_CHUNK_SIZE
+) -> List[DataContractBulkCreateResult]:
+    """
+    Creates many data contracts at once, reporting the outcome of each of them.
+
+    Every data contract is validated and converted in a single pass. Invalid ones, duplicated IDs and
+    IDs that already exist are reported without aborting the batch. The remaining ones are inserted
+    with one executemany statement and one commit per chunk of ``chunk_size`` rows: if a chunk fails,
+    it is rolled back and all of its data contracts are reported as failed.
+
+    :param AsyncSession db: The async database session.
+    :param List[Any] data_contracts: The raw data contracts to create, as parsed from the request body.
+    :param int chunk_size: The maximum number of data contracts inserted per transaction.
+    :return List[DataContractBulkCreateResult]: The outcome for each data contract, in the input order.
+    :raises SQLAlchemyError: If there's an error while looking up the existing data contracts.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        results, pending = _prepare_bulk_rows(data_contracts)
+        existing_ids = set()
+        for ids in chunked([row["id"] for _, row in pending], settings.IN_CLAUSE_CHUNK_SIZE):
+            existing_ids.update(await db.scalars(select(DataContractModel.id).where(DataContractModel.id.in_(ids))))
+        pending = _skip_existing(results, pending, existing_ids)
+
+        for chunk in chunked(pending, chunk_size):
+            try:
+                await db.execute(insert(DataContractModel), [row for _, row in chunk])
+                tag_rows = [tag_row for _, row in chunk for tag_row in _tag_rows(row["id"], row["tags"])]
+                if tag_rows:
+                    await db.execute(insert(DataContractTagModel), tag_rows)
+                await db.commit()
+                for index, row in chunk:
+                    results[index] = DataContractBulkCreateResult(index=index, id=row["id"], success=True)
+            except SQLAlchemyError as e:
+                await db.rollback()
+                logger.error(f" ❌ Failed to insert a chunk of {len(chunk)} data contracts: {str(e)}")
+                for index, row in chunk:
+                    results[index] = DataContractBulkCreateResult(
+                        index=index, id=row["id"], success=False, error=f"Failed to insert data contract: {str(e)}"
+                    )
+
+        created = sum(result.success for result in results)
+        logger.info(f" ✅ Bulk created {created} data contracts, {len(results) - created} failed")
+        return results
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f" ❌ Failed to bulk create data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while bulk creating data contracts: {str(e)}")
+        raise
+
+
+async def get_data_contract_document(db: AsyncSession, id: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Retrieves the stored JSON document of a data contract and its content hash by its ID.
+
+    The document was validated when it was written, so it is returned as is, without being parsed. It is served
+    from ``data_contract_cache`` when it was read recently, and stored in it otherwise.
+
+    :param AsyncSession db: The async database session.
+    :param str id: The unique identifier of the data contract to retrieve.
+    :return Optional[Tuple[str, Optional[str]]]: The JSON document of the data contract and its content hash, read
+        together so that the hash describes the document, or None if not found.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    cached = data_contract_cache.get(id)
+    if cached is not None:
+        return cached
+    try:
+        generation = data_contract_cache.generation
+        entry = await shared_cache.aget_data_contract(id, lambda: _load_document(db, id))
+        if entry is None:
+            logger.warning(f" ⚠️ Data contract not found: {id}")
+            return None
+        if entry[1] is not None:
+            data_contract_cache.put(id, entry, generation)
+        logger.info(f" ✅ Data contract retrieved successfully: {id}")
+        return entry
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contract: {str(e)}")
+        raise
+
+
+async def get_data_contract_content_hash(db: AsyncSession, id: str) -> Optional[str]:
+    """
+    Retrieves the content hash of a data contract by its ID, without reading its JSON columns.
+
+    The content hash is served from ``data_contract_cache`` or from the shared cache when the data contract was read
+    recently.
+
+    :param AsyncSession db: The async database session.
+    :param str id: The unique identifier of the data contract.
+    :return Optional[str]: The content hash of the data contract, or None if not found or not hashed yet.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    cached = data_contract_cache.get(id)
+    if cached is not None:
+        return cached[1]
+    generation = data_contract_cache.generation
+    cached = await shared_cache.apeek_data_contract(id)
+    if cached is not None:
+        data_contract_cache.put(id, cached, generation)
+        return cached[1]
+    try:
+        return await db.scalar(select(DataContractModel.content_hash).where(DataContractModel.id == id))
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve the content hash of data contract {id}: {str(e)}")
+        raise
+
+
+async def get_data_contract_summary(
+    db: AsyncSession, id: str, fields: Dict[str, Optional[List[str]]]
+) -> Optional[Tuple[DataContractSummary, Optional[str]]]:
+    """
+    Retrieves the requested fields of a data contract and its content hash from the database by its ID.
+
+    :param AsyncSession db: The async database session.
+    :param str id: The unique identifier of the data contract to retrieve.
+    :param Dict[str, Optional[List[str]]] fields: The projection, as returned by ``parse_fields``.
+    :return Optional[Tuple[DataContractSummary, Optional[str]]]: The retrieved data contract summary and the content
+        hash of the data contract, read in the same query, or None if not found.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        row = (await db.execute(_select_fields(fields).where(DataContractModel.id == id))).first()
+        if row is None:
+            logger.warning(f" ⚠️ Data contract not found: {id}")
+            return None
+        logger.info(f" ✅ Data contract summary retrieved successfully: {id}")
+        return _row_to_summary(row, fields), row.content_hash
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contract: {str(e)}")
+        raise
+
+
+async def get_data_contracts_by_ids(db: AsyncSession, ids: List[str]) -> Tuple[List[DataContract], List[str]]:
+    """
+    Retrieves many data contracts from the database by their IDs.
+
+    The IDs are looked up with ``IN (...)`` queries, chunked to stay under the database's limit
+    on the number of bound parameters.
+
+    :param AsyncSession db: The async database session.
+    :param List[str] ids: The unique identifiers of the data contracts to retrieve.
+    :return Tuple[List[DataContract], List[str]]: The retrieved data contracts and the IDs that were not found,
+        both in the requested order and without duplicates.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        unique_ids = list(dict.fromkeys(ids))
+        found: Dict[str, DataContract] = {}
+        for chunk in chunked(unique_ids, settings.IN_CLAUSE_CHUNK_SIZE):
+            statement = select(DataContractModel).where(DataContractModel.id.in_(chunk))
+            for db_data_contract in await db.scalars(statement):
+                found[db_data_contract.id] = db_to_pydantic_model(db_data_contract)
+
+        data_contracts = [found[id] for id in unique_ids if id in found]
+        missing_ids = [id for id in unique_ids if id not in found]
+        logger.info(f" ✅ Retrieved {len(data_contracts)} data contracts successfully, {len(missing_ids)} missing")
+        return data_contracts, missing_ids
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contracts: {str(e)}")
+        raise
+
+
+async def update_data_contract(
+    db: AsyncSession, id: str, data_contract_update: DataContractUpdate, if_match: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Updates an existing data contract in the database.
+
+    The data contract has already been validated, so it is serialized once and stored as is. The write only
+    applies if the data contract is still at the version it was read at, and it is retried on the new version
+    otherwise, up to ``settings.WRITE_CONFLICT_RETRIES`` times.
+
+    :param AsyncSession db: The async database session.
+    :param str id: The unique identifier of the data contract to update.
+    :param DataContractUpdate data_contract_update: The data contract update information.
+    :param Optional[str] if_match: The If-Match header of the request, if any. The update only applies if it
+        matches the current ETag of the data contract.
+    :return Optional[Dict[str, Any]]: The values of the updated columns, or None if not found.
+    :raises StaleDataError: If the If-Match header does not match, or if the data contract kept being modified
+        concurrently.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        row = pydantic_to_db_dict(data_contract_update)
+        for _ in range(settings.WRITE_CONFLICT_RETRIES):
+            current = (
+                await db.execute(
+                    select(DataContractModel.version, DataContractModel.content_hash).where(DataContractModel.id == id)
+                )
+            ).first()
+            if current is None:
+                logger.warning(f" ⚠️ Data contract not found for update: {id}")
+                return None
+            _check_if_match(id, current, if_match)
+
+            await db.execute(delete(DataContractTagModel).where(DataContractTagModel.contract_id == id))
+            if (await db.execute(_update_version(id, current.version, row))).rowcount == 1:
+                break
+            await db.rollback()
+        else:
+            raise StaleDataError(f"Data contract {id} kept being modified concurrently")
+
+        tag_rows = _tag_rows(row["id"], row["tags"])
+        if tag_rows:
+            await db.execute(insert(DataContractTagModel), tag_rows)
+        await db.commit()
+        await _invalidate_cached(id, row["id"])
+        logger.info(f" ✅ Data contract updated successfully: {id} (version {current.version + 1})")
+        return row
+    except StaleDataError as e:
+        await db.rollback()
+        # The data contract was written by someone else, possibly through another worker process
+        data_contract_cache.invalidate(id)
+        logger.warning(f" ⚠️ Data contract update rejected: {str(e)}")
+        raise
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f" ❌ Failed to update data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while updating data contract: {str(e)}")
+        raise
+
+
+async def patch_data_contract(
+    db: AsyncSession, id: str, patch: Any, if_match: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Applies a JSON merge patch (RFC 7386) to an existing data contract.
+
+    Only the stored document of the data contract is read, only the patched sections are validated, and only
+    their columns are written, along with the new document and its content hash. The write only applies if the
+    data contract is still at the version the patch was merged into, and the patch is merged again into the new
+    version otherwise, up to ``settings.WRITE_CONFLICT_RETRIES`` times.
+
+    :param AsyncSession db: The async database session.
+    :param str id: The unique identifier of the data contract to patch.
+    :param Any patch: The merge patch, as decoded from the request body.
+    :param Optional[str] if_match: The If-Match header of the request, if any. The patch only applies if it
+        matches the current ETag of the data contract.
+    :return Optional[Dict[str, Any]]: The values of the updated columns, or None if not found.
+    :raises ValueError: If the patch is not an object, changes the ID, or patches an unknown section.
+    :raises RequestValidationError: If a patched section is invalid.
+    :raises StaleDataError: If the If-Match header does not match, or if the data contract kept being modified
+        concurrently.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        for _ in range(settings.WRITE_CONFLICT_RETRIES):
+            rows = (
+                await db.execute(
+                    select(
+                        DataContractModel.id,
+                        DataContractModel.document,
+                        DataContractModel.version,
+                        DataContractModel.content_hash,
+                    ).where(DataContractModel.id == id)
+                )
+            ).all()
+            if not rows:
+                logger.warning(f" ⚠️ Data contract not found for patch: {id}")
+                return None
+            _check_if_match(id, rows[0], if_match)
+            statement = _select_missing_documents(rows)
+            document = _merge_documents(rows, (await db.scalars(statement)).all() if statement is not None else [])[0]
+            row = merge_patch_to_db_dict(id, document, patch)
+
+            if (await db.execute(_update_version(id, rows[0].version, row))).rowcount == 1:
+                break
+            await db.rollback()
+        else:
+            raise StaleDataError(f"Data contract {id} kept being modified concurrently")
+
+        if "tags" in row:
+            await db.execute(delete(DataContractTagModel).where(DataContractTagModel.contract_id == id))
+            tag_rows = _tag_rows(id, row["tags"])
+            if tag_rows:
+                await db.execute(insert(DataContractTagModel), tag_rows)
+        await db.commit()
+        await _invalidate_cached(id)
+        logger.info(f" ✅ Data contract patched successfully: {id} ({', '.join(sorted(row))})")
+        return row
+    except (ValueError, RequestValidationError) as e:
+        logger.warning(f" ⚠️ Invalid merge patch for data contract {id}: {str(e)}")
+        raise
+    except StaleDataError as e:
+        await db.rollback()
+        # The data contract was written by someone else, possibly through another worker process
+        data_contract_cache.invalidate(id)
+        logger.warning(f" ⚠️ Data contract patch rejected: {str(e)}")
+        raise
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f" ❌ Failed to patch data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while patching data contract: {str(e)}")
+        raise
+
+
+async def list_data_contract_documents(
+    db: AsyncSession,
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    after_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[str], List[Optional[str]], Optional[str]]:
+    """
+    Retrieves the stored JSON documents of one page of data contracts and their content hashes, ordered by ID.
+
+    The content hashes are read along with the documents, so that they describe the very documents returned.
+
+    :param AsyncSession db: The async database session.
+    :param int limit: The maximum number of data contracts to return.
+    :param Optional[str] after_id: The ID of the last data contract of the previous page, if any.
+    :param Optional[Dict[str, Any]] filters: The filters the data contracts must match, as accepted by ``_filter``.
+    :return Tuple[List[str], List[Optional[str]], Optional[str]]: The JSON documents of the page, their content
+        hashes, and the ID to resume after when requesting the next page (None if this is the last page).
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        statement = _filter(
+            select(DataContractModel.id, DataContractModel.document, DataContractModel.content_hash), filters
+        )
+        rows = (await db.execute(_paginate(statement, limit, after_id))).all()
+
+        next_after_id = rows[limit - 1].id if len(rows) > limit else None
+        rows = rows[:limit]
+        statement = _select_missing_documents(rows)
+        documents = _merge_documents(rows, (await db.scalars(statement)).all() if statement is not None else [])
+        logger.info(f" ✅ Retrieved {len(documents)} data contracts successfully")
+        return documents, [row.content_hash for row in rows], next_after_id
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contracts: {str(e)}")
+        raise
+
+
+async def list_data_contract_content_hashes(
+    db: AsyncSession,
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    after_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Optional[str]], Optional[str]]:
+    """
+    Retrieves the content hashes of one page of data contracts, ordered by ID, without reading their JSON columns.
+
+    :param AsyncSession db: The async database session.
+    :param int limit: The maximum number of data contracts of the page.
+    :param Optional[str] after_id: The ID of the last data contract of the previous page, if any.
+    :param Optional[Dict[str, Any]] filters: The filters the data contracts must match, as accepted by ``_filter``.
+    :return Tuple[List[Optional[str]], Optional[str]]: The content hashes of the page, and the ID to resume after
+        when requesting the next page (None if this is the last page).
+    :raises SQLAlchemyError: If there's an error during database operations.
+    """
+    try:
+        statement = _filter(select(DataContractModel.id, DataContractModel.content_hash), filters)
+        rows = (await db.execute(_paginate(statement, limit, after_id))).all()
+        next_after_id = rows[limit - 1].id if len(rows) > limit else None
+        return [row.content_hash for row in rows[:limit]], next_after_id
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve the content hashes of data contracts: {str(e)}")
+        raise
+
+
+async def list_data_contract_summaries(
+    db: AsyncSession,
+    fields: Dict[str, Optional[List[str]]],
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    after_id: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[DataContractSummary], List[Optional[str]], Optional[str]]:
+    """
+    Retrieves the requested fields of one page of data contracts and their content hashes from the database, ordered
+    by ID.
+
+    :param AsyncSession db: The async database session.
+    :param Dict[str, Optional[List[str]]] fields: The projection, as returned by ``parse_fields``.
+    :param int limit: The maximum number of data contracts to return.
+    :param Optional[str] after_id: The ID of the last data contract of the previous page, if any.
+    :param Optional[Dict[str, Any]] filters: The filters the data contracts must match, as accepted by ``_filter``.
+    :return Tuple[List[DataContractSummary], List[Optional[str]], Optional[str]]: The data contract summaries of the
+        page, their content hashes, read in the same query, and the ID to resume after when requesting the next page
+        (None if this is the last page).
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        rows = (await db.execute(_paginate(_filter(_select_fields(fields), filters), limit, after_id))).all()
+
+        next_after_id = rows[limit - 1].id if len(rows) > limit else None
+        summaries = [_row_to_summary(row, fields) for row in rows[:limit]]
+        logger.info(f" ✅ Retrieved {len(summaries)} data contract summaries successfully")
+        return summaries, [row.content_hash for row in rows[:limit]], next_after_id
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to retrieve data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while retrieving data contracts: {str(e)}")
+        raise
+
+
+async def count_data_contract_tags(db: AsyncSession) -> List[DataContractTagCount]:
+    """
+    Counts the data contracts carrying each tag, from the tag table.
+
+    :param AsyncSession db: The async database session.
+    :return List[DataContractTagCount]: The tags with their number of data contracts, most used first.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        rows = (await db.execute(_count_tags())).all()
+        logger.info(f" ✅ Counted {len(rows)} data contract tags successfully")
+        return [DataContractTagCount(tag=row.tag, count=row.count) for row in rows]
+    except SQLAlchemyError as e:
+        logger.error(f" ❌ Failed to count data contract tags: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while counting data contract tags: {str(e)}")
+        raise
+
+
+async def delete_data_contract(db: AsyncSession, data_contract_delete: DataContractDelete) -> Optional[DataContract]:
+    """
+    Deletes a data contract from the database.
+
+    :param AsyncSession db: The async database session.
+    :param DataContractDelete data_contract_delete: The data contract to be deleted.
+    :return Optional[DataContract]: The deleted data contract, or None if not found.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        db_data_contract = await db.scalar(
+            select(DataContractModel).where(DataContractModel.id == data_contract_delete.id)
+        )
+        if db_data_contract is None:
+            logger.warning(f" ⚠️ Data contract not found for deletion: {data_contract_delete.id}")
+            return None
+
+        deleted_data_contract = db_to_pydantic_model(db_data_contract)
+        await db.execute(
+            delete(DataContractTagModel).where(DataContractTagModel.contract_id == data_contract_delete.id)
+        )
+        await db.delete(db_data_contract)
+        await db.commit()
+        await _invalidate_cached(data_contract_delete.id)
+        logger.info(f" ✅ Data contract deleted successfully: {data_contract_delete.id}")
+        return deleted_data_contract
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f" ❌ Failed to delete data contract: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while deleting data contract: {str(e)}")
+        raise
+
+
+async def delete_data_contracts_by_ids(db: AsyncSession, ids: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Deletes many data contracts from the database by their IDs, in a single transaction.
+
+    The IDs are looked up and deleted with ``IN (...)`` statements, chunked to stay under the database's
+    limit on the number of bound parameters.
+
+    :param AsyncSession db: The async database session.
+    :param List[str] ids: The unique identifiers of the data contracts to delete.
+    :return Tuple[List[str], List[str]]: The IDs that were deleted and the IDs that were not found,
+        both in the requested order and without duplicates.
+    :raises SQLAlchemyError: If there's an error during database operations.
+    :raises Exception: If there's any other unexpected error.
+    """
+    try:
+        unique_ids = list(dict.fromkeys(ids))
+        found_ids = set()
+        for chunk in chunked(unique_ids, settings.IN_CLAUSE_CHUNK_SIZE):
+            found_ids.update(await db.scalars(select(DataContractModel.id).where(DataContractModel.id.in_(chunk))))
+            await db.execute(delete(DataContractTagModel).where(DataContractTagModel.contract_id.in_(chunk)))
+            await db.execute(delete(DataContractModel).where(DataContractModel.id.in_(chunk)))
+        await db.commit()
+        await _invalidate_cached(*unique_ids)
+
+        deleted_ids = [id for id in unique_ids if id in found_ids]
+        missing_ids = [id for id in unique_ids if id not in found_ids]
+        logger.info(f" ✅ Deleted {len(deleted_ids)} data contracts successfully, {len(missing_ids)} missing")
+        return deleted_ids, missing_ids
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f" ❌ Failed to delete data contracts: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f" ❌ Unexpected error occurred while deleting data contracts: {str(e)}")
+        raise
@@ -0,0 +1,31 @@
+"""
+Rewrites the stored data contracts with the current compression settings, then reclaims the freed space.
+
+Run it from the backend directory once compression is enabled or its threshold is changed::
+
+    python -m app.database.compress
+"""
+
+import logging
+
+from ..crud.data_contract import compress_data_contracts
+from .manager import db_manager
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """
+    Compresses the existing data contracts of the configured database.
+    """
+    db_manager.setup_engine()
+    db_manager.create_tables()
+    db_manager.upgrade_tables()
+    with db_manager.get_session_factory()() as db:
+        compress_data_contracts(db)
+    db_manager.vacuum()
+    logger.info(" ✅ Database compression completed successfully")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 import logging
 import os
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Dict, Generator, Union
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, make_url, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
@@ -25,6 +28,9 @@ class DatabaseManager:
     _instance = None
     Base: DeclarativeMeta = declarative_base()
 
+    # Async drivers used for each database backend when the async mode is enabled
+    ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super(DatabaseManager, cls).__new__(cls)
@@ -40,13 +46,24 @@ class DatabaseManager:
             self.db_url = db_url
             self.engine = None
             self.SessionLocal = None
+            self.async_engine = None
+            self.AsyncSessionLocal = None
             self.initialized = True
 
     def create_database(self) -> None:
         """
         Creates the database in the current folder if it doesn't exist.
+
+        Only SQLite databases are files: server databases such as PostgreSQL must be provisioned beforehand.
         """
-        db_path = self.db_url.replace("sqlite:///", "")
+        if not self.is_sqlite:
+            logger.info(
+                f" 💡 Skipping database file creation for the '{make_url(self.db_url).get_backend_name()}' backend"
+            )
+            return
+        db_path = make_url(self.db_url).database
+        if db_path in (None, "", ":memory:"):
+            return
         if not os.path.exists(db_path):
             try:
                 open(db_path, "a").close()
@@ -54,12 +71,140 @@ class DatabaseManager:
             except IOError as e:
                 logger.error(f" ❌ Failed to create database file: {str(e)}")
 
+    @property
+    def is_sqlite(self) -> bool:
+        """
+        Whether the database is a SQLite database.
+        """
+        return make_url(self.db_url).get_backend_name() == "sqlite"
+
+    def get_engine_options(self) -> Dict[str, Any]:
+        """
+        Returns the connection pool options of the engines.
+
+        In-memory SQLite databases live in a single connection, so they keep SQLAlchemy's default pool.
+
+        :return Dict[str, Any]: The keyword arguments to pass to the engine factory.
+        """
+        if self.is_sqlite and make_url(self.db_url).database in (None, "", ":memory:"):
+            return {}
+        return {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_pre_ping": True,
+        }
+
+    @staticmethod
+    def get_json_options() -> Dict[str, Any]:
+        """
+        Returns the JSON (de)serializers of the JSON columns of the engines.
+
+        In the fast JSON mode, the JSON columns are encoded and decoded with orjson (from the "fast-json" extra)
+        instead of the standard library.
+
+        :return Dict[str, Any]: The keyword arguments to pass to the engine factory.
+        """
+        if not settings.FAST_JSON:
+            return {}
+        import orjson
+
+        return {"json_serializer": lambda value: orjson.dumps(value).decode("utf-8"), "json_deserializer": orjson.loads}
+
+    @staticmethod
+    def get_sqlite_pragmas() -> Dict[str, Any]:
+        """
+        Returns the PRAGMAs of the production SQLite profile.
+
+        WAL lets readers and writers work concurrently, ``synchronous=NORMAL`` only syncs at checkpoints
+        (which is safe in WAL mode), and the busy timeout makes writers wait for the lock instead of failing
+        with "database is locked". The memory map, page cache and in-memory temporary storage reduce disk reads.
+
+        :return Dict[str, Any]: The PRAGMA values, keyed by PRAGMA name.
+        """
+        return {
+            "journal_mode": settings.SQLITE_JOURNAL_MODE,
+            "synchronous": settings.SQLITE_SYNCHRONOUS,
+            "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+            "mmap_size": settings.SQLITE_MMAP_SIZE,
+            "cache_size": settings.SQLITE_CACHE_SIZE,
+            "temp_store": settings.SQLITE_TEMP_STORE,
+        }
+
+    @classmethod
+    def apply_sqlite_pragmas(cls, dbapi_connection: Any, connection_record: Any) -> None:
+        """
+        Applies the production SQLite profile to a new DBAPI connection.
+
+        Registered as a listener of the engines' "connect" event.
+
+        :param Any dbapi_connection: The new DBAPI connection.
+        :param Any connection_record: The pool record of the connection.
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in cls.get_sqlite_pragmas().items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+    def log_engine_settings(self, engine: Engine) -> None:
+        """
+        Logs the effective settings of an engine, as reported by the database.
+
+        :param Engine engine: The engine to inspect.
+        """
+        options = ", ".join(f"{k}={v}" for k, v in self.get_engine_options().items())
+        pool = f"pool={type(engine.pool).__name__}({options})"
+        if not self.is_sqlite:
+            logger.info(f" ✅ Database engine ready: {pool}")
+            return
+        with engine.connect() as connection:
+            effective = {
+                pragma: connection.exec_driver_sql(f"PRAGMA {pragma}").scalar() for pragma in self.get_sqlite_pragmas()
+            }
+        logger.info(f" ✅ SQLite engine ready: {', '.join(f'{k}={v}' for k, v in effective.items())}, {pool}")
+
     def setup_engine(self) -> None:
         """
         Sets up the database engine and session factory.
+
+        SQLite connections are configured with the production profile of ``get_sqlite_pragmas``, and JSON columns
+        use the serializers of ``get_json_options``.
         """
-        self.engine = create_engine(self.db_url, echo=False)
+        self.engine = create_engine(self.db_url, echo=False, **self.get_engine_options(), **self.get_json_options())
+        if self.is_sqlite:
+            event.listen(self.engine, "connect", self.apply_sqlite_pragmas)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.log_engine_settings(self.engine)
+
+    def get_async_url(self) -> str:
+        """
+        Returns the database URL using the async driver of the database backend.
+
+        :return str: The async database URL, e.g. "sqlite+aiosqlite:///./mycelium.db".
+        :raises ValueError: If no async driver is known for the database backend.
+        """
+        url = make_url(self.db_url)
+        backend = url.get_backend_name()
+        if backend not in self.ASYNC_DRIVERS:
+            raise ValueError(f"No async driver available for the '{backend}' database backend")
+        return url.set(drivername=self.ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+    def setup_async_engine(self) -> None:
+        """
+        Sets up the async database engine and session factory.
+
+        Once set up, the routes served through ``get_session`` use async sessions, so that
+        database round trips no longer block the event loop.
+        """
+        self.async_engine = create_async_engine(
+            self.get_async_url(), echo=False, **self.get_engine_options(), **self.get_json_options()
+        )
+        if self.is_sqlite:
+            event.listen(self.async_engine.sync_engine, "connect", self.apply_sqlite_pragmas)
+        self.AsyncSessionLocal = async_sessionmaker(self.async_engine, autoflush=False, expire_on_commit=False)
+        logger.info(f" ✅ Async database engine set up with the '{self.async_engine.dialect.driver}' driver")
 
     def create_tables(self) -> None:
         """
@@ -77,6 +222,75 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f" ❌ Failed to create database tables: {str(e)}")
 
+    def upgrade_tables(self) -> None:
+        """
+        Adds the columns and indexes that were added to the SQLAlchemy models after their table was created.
+
+        ``create_tables`` only creates the missing tables, so existing databases are upgraded here. Only nullable
+        columns, and non-nullable columns with a server default, can be added this way: the values of the other new
+        columns are to be populated by the caller.
+        """
+        if not self.engine:
+            raise RuntimeError("Database engine not initialized. Call setup_engine() first.")
+
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in self.Base.metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing_columns:
+                        continue
+                    if not column.nullable and column.server_default is None:
+                        logger.warning(f" ⚠️ Cannot add the non-nullable column {table.name}.{column.name}")
+                        continue
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    if column.server_default is not None:
+                        default = column.server_default.arg
+                        column_type += f" DEFAULT '{default}'" if isinstance(default, str) else f" DEFAULT {default}"
+                    if not column.nullable:
+                        column_type += " NOT NULL"
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    logger.info(f" ✅ Column added: {table.name}.{column.name}")
+                for index in table.indexes:
+                    index.create(bind=connection, checkfirst=True)
+
+    def vacuum(self) -> None:
+        """
+        Rebuilds the SQLite database file, so that the pages freed by rewritten rows are returned to the filesystem.
+
+        Other backends reclaim space on their own, so this is a no-op for them.
+        """
+        if not self.engine:
+            raise RuntimeError("Database engine not initialized. Call setup_engine() first.")
+        if not self.is_sqlite:
+            return
+
+        def database_size(connection: Any) -> int:
+            return (
+                connection.exec_driver_sql("PRAGMA page_count").scalar()
+                * connection.exec_driver_sql("PRAGMA page_size").scalar()
+            )
+
+        # VACUUM cannot run inside a transaction
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            size_before = database_size(connection)
+            connection.exec_driver_sql("VACUUM")
+            size_after = database_size(connection)
+        logger.info(f" ✅ Database vacuumed: {size_before / 1024:.0f} KiB -> {size_after / 1024:.0f} KiB")
+
+    def get_session_factory(self) -> sessionmaker:
+        """
+        Returns the session factory, for work that outlives the request scope (e.g. streamed responses).
+
+        :return sessionmaker: The SQLAlchemy session factory.
+        """
+        if not self.SessionLocal:
+            raise RuntimeError("Database engine not initialized. Call setup_engine() first.")
+
+        return self.SessionLocal
+
     def get_db(self) -> Generator[Session, None, None]:
         """
         Creates a new database session and yields it.
@@ -96,5 +310,37 @@ class DatabaseManager:
             db.close()
             logger.info(" 💡 Database session closed")
 
+    async def get_async_db(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Creates a new async database session and yields it.
+
+        :yield: A SQLAlchemy AsyncSession object.
+        """
+        if not self.AsyncSessionLocal:
+            raise RuntimeError("Async database engine not initialized. Call setup_async_engine() first.")
+
+        db = self.AsyncSessionLocal()
+        try:
+            logger.info(" 💡 Async database session created")
+            yield db
+        except OperationalError as e:
+            logger.error(f" ❌ Database operation failed: {str(e)}")
+        finally:
+            await db.close()
+            logger.info(" 💡 Async database session closed")
+
+    async def get_session(self) -> AsyncGenerator[Union[Session, AsyncSession], None]:
+        """
+        Yields an async session if the async engine is set up, and a regular session otherwise.
+
+        :yield: A SQLAlchemy AsyncSession or Session object.
+        """
+        if self.AsyncSessionLocal:
+            async with asynccontextmanager(self.get_async_db)() as db:
+                yield db
+        else:
+            with contextmanager(self.get_db)() as db:
+                yield db
+
 
 db_manager = DatabaseManager()
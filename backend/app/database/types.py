@@ -0,0 +1,110 @@
+import json
+import zlib
+from typing import Any, Optional
+
+from sqlalchemy import LargeBinary, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from ..utils.config import settings
+
+# Prefix of the compressed values. Stored text and JSON never start with a NUL byte, so values written
+# uncompressed (below the threshold, or before compression was enabled) are told apart without a flag column
+COMPRESSED_MARKER = b"\x00z"
+
+
+def compress_value(data: bytes, threshold: int, level: int) -> bytes:
+    """
+    Compresses a serialized value with zlib once it reaches the size threshold.
+
+    :param bytes data: The UTF-8 encoded value.
+    :param int threshold: The size in bytes from which the value is compressed.
+    :param int level: The zlib compression level.
+    :return bytes: The compressed value prefixed with the marker, or the value as is if it is smaller than the
+        threshold or does not shrink.
+    """
+    if len(data) < threshold:
+        return data
+    compressed = COMPRESSED_MARKER + zlib.compress(data, level)
+    return compressed if len(compressed) < len(data) else data
+
+
+def decompress_value(data: Any) -> str:
+    """
+    Decodes a value read from the database, decompressing it if it carries the marker.
+
+    :param Any data: The stored value, as bytes, or as text for rows written before compression was enabled.
+    :return str: The decoded value.
+    """
+    if isinstance(data, str):
+        return data
+    data = bytes(data)
+    if data.startswith(COMPRESSED_MARKER):
+        data = zlib.decompress(data[len(COMPRESSED_MARKER) :])
+    return data.decode("utf-8")
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column stored zlib-compressed once it reaches ``settings.COMPRESSION_THRESHOLD`` bytes.
+
+    Values are stored as BLOBs and decompressed transparently when rows are loaded. PostgreSQL already
+    compresses large values through TOAST, so the column is a plain text column there.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, threshold: Optional[int] = None, level: Optional[int] = None):
+        """
+        :param Optional[int] threshold: The size in bytes from which values are compressed.
+        :param Optional[int] level: The zlib compression level.
+        """
+        super().__init__()
+        self.threshold = settings.COMPRESSION_THRESHOLD if threshold is None else threshold
+        self.level = settings.COMPRESSION_LEVEL if level is None else level
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(Text())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Optional[str], dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return compress_value(value.encode("utf-8"), self.threshold, self.level)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[str]:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return decompress_value(value)
+
+
+class CompressedJSON(CompressedText):
+    """
+    JSON column stored zlib-compressed once its serialized form reaches ``settings.COMPRESSION_THRESHOLD`` bytes.
+
+    Values are serialized with the JSON serializer of the engine, so FAST_JSON applies to them too. On PostgreSQL
+    the column is a JSONB column, so it can still be indexed and queried.
+    """
+
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        serialized = (getattr(dialect, "_json_serializer", None) or json.dumps)(value)
+        if isinstance(serialized, str):
+            serialized = serialized.encode("utf-8")
+        return compress_value(serialized, self.threshold, self.level)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return (getattr(dialect, "_json_deserializer", None) or json.loads)(decompress_value(value))
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..utils.config import settings
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+T = TypeVar("T")
+
+# Key of the session info holding the callbacks to run once the group of writes is committed
+AFTER_COMMIT = "after_commit"
+
+# A write waiting in the queue: the operation, its arguments, and the future of its result
+Write = Tuple[Callable[..., Any], Tuple[Any, ...], Future]
+
+
+def after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """
+    Runs a callback once the writes of a session are committed, such as the invalidation of the cached values.
+
+    In the sessions of the write queue, committing only releases the savepoint of the write: the callback is run
+    after the group of writes it belongs to is committed. In the other sessions, it is run right away.
+
+    :param Session db: The database session the writes were committed by.
+    :param Callable[[], None] callback: The callback.
+    """
+    callbacks = db.info.get(AFTER_COMMIT)
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+class WriteQueue:
+    """
+    Single writer committing the writes of concurrent requests in groups (group commit).
+
+    The requests submit their writes as operations taking a database session, such as the CRUD functions. A
+    dedicated thread drains the queue, runs the writes received within a small window of each other in one
+    transaction, and commits them at once: with SQLite, which serializes writers, the write throughput scales with
+    the size of the groups instead of the rate of lock handovers and syncs.
+
+    Each write runs in a session joining the transaction through a savepoint, so that its ``commit`` and
+    ``rollback`` only release or roll back its own savepoint: a failing write does not fail the others, and the
+    CRUD functions run unchanged. The result of each write, or its error, is only returned once the group is
+    committed.
+    """
+
+    def __init__(self):
+        self.queue: "queue.Queue[Optional[Write]]" = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.engine: Optional[Engine] = None
+        self.window = 0.0
+        self.max_batch = 1
+        self.writes = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the writer thread is running, the writes being submitted to it rather than committed by each request.
+        """
+        return self.thread is not None
+
+    def start(
+        self,
+        engine: Engine,
+        window_ms: float = settings.GROUP_COMMIT_WINDOW_MS,
+        max_batch: int = settings.GROUP_COMMIT_MAX_BATCH,
+    ) -> None:
+        """
+        Starts the writer thread.
+
+        :param Engine engine: The engine of the database to write to.
+        :param float window_ms: How long to wait for more writes after the first write of a group, in milliseconds.
+        :param int max_batch: The maximum number of writes committed at once.
+        :raises RuntimeError: If the writer thread is already running.
+        """
+        if self.running:
+            raise RuntimeError("The write queue is already running")
+        self.engine = engine
+        self.window = window_ms / 1000
+        self.max_batch = max(max_batch, 1)
+        self.writes = self.batches = self.largest_batch = 0
+        self.thread = threading.Thread(target=self._run, name="write-queue", daemon=True)
+        self.thread.start()
+        logger.info(f" ✅ Write queue started: window={window_ms}ms, max_batch={self.max_batch}")
+
+    def stop(self) -> None:
+        """
+        Commits the writes already submitted, and stops the writer thread.
+        """
+        if not self.running:
+            return
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+        logger.info(f" ✅ Write queue stopped: {self.writes} writes committed in {self.batches} groups")
+
+    def submit(self, operation: Callable[..., T], *args: Any) -> "Future[T]":
+        """
+        Submits a write to the writer thread.
+
+        :param Callable[..., T] operation: The write, called with a database session and ``args``. It commits its
+            changes as usual, which only releases its savepoint.
+        :param Any args: The arguments of the write, after the database session.
+        :return Future[T]: The future result of the write, resolved once its group is committed.
+        :raises RuntimeError: If the writer thread is not running.
+        """
+        if not self.running:
+            raise RuntimeError("The write queue is not running. Call start() first.")
+        future: "Future[T]" = Future()
+        self.queue.put((operation, args, future))
+        return future
+
+    async def run(self, operation: Callable[..., T], *args: Any) -> T:
+        """
+        Submits a write to the writer thread and waits for its result, without blocking the event loop.
+
+        :param Callable[..., T] operation: The write, called with a database session and ``args``.
+        :param Any args: The arguments of the write, after the database session.
+        :return T: The result of the write, once its group is committed.
+        :raises Exception: The error raised by the write, or by the commit of its group.
+        """
+        return await asyncio.wrap_future(self.submit(operation, *args))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the statistics of the write queue.
+
+        :return Dict[str, Any]: The number of writes and groups committed, the average and largest group size, and
+            the number of writes waiting in the queue.
+        """
+        return {
+            "writes": self.writes,
+            "batches": self.batches,
+            "average_batch": self.writes / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "queued": self.queue.qsize(),
+        }
+
+    def _run(self) -> None:
+        """
+        Commits the writes of the queue group by group, until the queue is stopped.
+        """
+        stopping = False
+        while not stopping:
+            write = self.queue.get()
+            if write is None:
+                return
+            batch, stopping = self._collect(write)
+            self._commit(batch)
+
+    def _collect(self, write: Write) -> Tuple[List[Write], bool]:
+        """
+        Collects the writes of a group: the writes received within the window of the first one, up to the maximum
+        group size.
+
+        :param Write write: The first write of the group.
+        :return Tuple[List[Write], bool]: The writes of the group, and whether the queue was stopped meanwhile.
+        """
+        batch = [write]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                write = self.queue.get(timeout=timeout) if timeout > 0 else self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if write is None:
+                return batch, True
+            batch.append(write)
+        return batch, False
+
+    def _commit(self, batch: List[Write]) -> None:
+        """
+        Runs a group of writes in one transaction, each in a savepoint of its own, commits it, and resolves the
+        futures of the writes.
+
+        With SQLite, the transaction is started with ``BEGIN IMMEDIATE``: the write lock is taken up front, and the
+        savepoints are nested in the transaction instead of starting (and releasing, committing) their own.
+
+        :param List[Write] batch: The writes of the group.
+        """
+        outcomes: List[Tuple[Future, Any, Optional[Exception]]] = []
+        callbacks: List[Callable[[], None]] = []
+        try:
+            with self.engine.connect() as connection:
+                transaction = connection.begin()
+                if connection.dialect.name == "sqlite":
+                    connection.exec_driver_sql("BEGIN IMMEDIATE")
+                for operation, args, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    write_callbacks: List[Callable[[], None]] = []
+                    with Session(
+                        bind=connection,
+                        autoflush=False,
+                        join_transaction_mode="create_savepoint",
+                        info={AFTER_COMMIT: write_callbacks},
+                    ) as db:
+                        try:
+                            outcomes.append((future, operation(db, *args), None))
+                            callbacks.extend(write_callbacks)
+                        except Exception as e:
+                            outcomes.append((future, None, e))
+                transaction.commit()
+        except Exception as e:
+            logger.error(f" ❌ Failed to commit a group of {len(batch)} writes: {str(e)}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f" ❌ Failed to run a callback after a group commit: {str(e)}")
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+        self.writes += len(outcomes)
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(outcomes))
+
+
+write_queue = WriteQueue()
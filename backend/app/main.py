@@ -1,14 +1,25 @@
 import importlib
 import logging
-import os
 from typing import Any, Dict, List, Tuple
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from .crud.data_contract import (
+    backfill_data_contract_documents,
+    backfill_data_contract_tags,
+    backfill_info_columns,
+)
 from .database.manager import db_manager
+from .database.writer import write_queue
+from .registry import MODEL_MODULES, ROUTER_MODULES, scan_modules
+from .utils.cache import data_contract_cache
+from .utils.compression import CompressionMiddleware
 from .utils.config import settings
+from .utils.openapi import load_or_build_openapi
+from .utils.shared_cache import shared_cache
+from .utils.tools import get_json_response_class
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -21,14 +32,19 @@ class AppManager:
 
     def __init__(self):
         self.setup_database()
+        self.configure_shared_cache()
         self.app = FastAPI(
             title="Mycelium API",
             description="An API for managing data contracts and related operations.",
             version="1.0.0",
+            default_response_class=get_json_response_class(),
         )
         self.configure_cors()
+        self.configure_compression()
         self.include_routers()
         self.setup_health_check()
+        self.setup_openapi()
+        self.setup_write_queue()
 
     def setup_database(self) -> None:
         """
@@ -38,12 +54,35 @@ class AppManager:
         try:
             db_manager.create_database()
             db_manager.setup_engine()
+            if settings.DATABASE_ASYNC:
+                db_manager.setup_async_engine()
             self.import_models()
             db_manager.create_tables()
+            db_manager.upgrade_tables()
+            with db_manager.get_session_factory()() as db:
+                backfill_info_columns(db)
+                backfill_data_contract_tags(db)
+                backfill_data_contract_documents(db)
             logger.info(" ✅ Database setup completed successfully")
         except Exception as e:
             logger.error(f" ❌ Error setting up the database: {e}")
 
+    def configure_shared_cache(self) -> None:
+        """
+        Connects the cache shared by the workers to Redis when REDIS_URL is set, and listens for the data contracts
+        written by the other workers.
+        """
+        if not settings.REDIS_URL:
+            logger.info(" 💡 Shared cache is disabled")
+            return
+        try:
+            shared_cache.setup(settings.REDIS_URL)
+            shared_cache.listen(data_contract_cache)
+            logger.info(" ✅ Shared cache configured successfully")
+        except Exception as e:
+            shared_cache.close()
+            logger.error(f" ❌ Error configuring the shared cache: {e}")
+
     def import_models(self) -> None:
         """
         Imports all model classes from the 'models' directory.
@@ -54,11 +93,8 @@ class AppManager:
         imported models to generate the database schema.
         """
         try:
-            models_dir = os.path.join(os.path.dirname(__file__), "models")
-            for filename in os.listdir(models_dir):
-                if filename.endswith(".py") and not filename.startswith("__"):
-                    module_name = f".models.{filename[:-3]}"
-                    importlib.import_module(module_name, package=__package__)
+            for name in MODEL_MODULES if settings.STATIC_REGISTRY else scan_modules("models"):
+                importlib.import_module(f".models.{name}", package=__package__)
             logger.info(" ✅ All models imported successfully")
         except Exception as e:
             logger.error(f" ❌ Error importing models: {e}")
@@ -79,21 +115,32 @@ class AppManager:
         except Exception as e:
             logger.error(f" ❌ Error configuring CORS middleware: {e}")
 
+    def configure_compression(self) -> None:
+        """
+        Configures the response compression middleware for the FastAPI application, unless it is disabled.
+        """
+        if not settings.RESPONSE_COMPRESSION:
+            logger.info(" 💡 Response compression is disabled")
+            return
+        try:
+            self.app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE)
+            logger.info(" ✅ Compression middleware configured successfully")
+        except Exception as e:
+            logger.error(f" ❌ Error configuring compression middleware: {e}")
+
     def import_routers(self) -> List[Tuple[APIRouter, str]]:
         """
-        Dynamically imports and returns a list of routers from the 'routers' directory.
+        Imports and returns the routers of the registry, or of the 'routers' directory when STATIC_REGISTRY is
+        disabled.
 
         :return List[Tuple[APIRouter, str]]: A list of tuples containing imported routers and their names.
         """
         routers = []
         try:
-            routers_dir = os.path.join(os.path.dirname(__file__), "routers")
-            for filename in os.listdir(routers_dir):
-                if filename.endswith(".py") and not filename.startswith("__"):
-                    module_name = f".routers.{filename[:-3]}"
-                    module = importlib.import_module(module_name, package=__package__)
-                    if hasattr(module, "router"):
-                        routers.append((module.router, filename[:-3]))
+            for name in ROUTER_MODULES if settings.STATIC_REGISTRY else scan_modules("routers"):
+                module = importlib.import_module(f".routers.{name}", package=__package__)
+                if hasattr(module, "router"):
+                    routers.append((module.router, name))
             return routers
         except Exception as e:
             import traceback
@@ -114,6 +161,35 @@ class AppManager:
         except Exception as e:
             logger.error(f" ❌ Error including routers: {e}")
 
+    def setup_openapi(self) -> None:
+        """
+        Sets the OpenAPI schema at startup rather than on the first request to the documentation: loaded from
+        OPENAPI_CACHE_DIR when a previous process of the same build cached it, or else generated (and cached) when
+        OPENAPI_CACHE_DIR is set or OPENAPI_EAGER is enabled.
+        """
+        try:
+            if settings.OPENAPI_CACHE_DIR:
+                load_or_build_openapi(self.app, settings.OPENAPI_CACHE_DIR)
+            elif settings.OPENAPI_EAGER:
+                self.app.openapi()
+                logger.info(" ✅ OpenAPI schema generated successfully")
+        except Exception as e:
+            logger.error(f" ❌ Error setting up the OpenAPI schema: {e}")
+
+    def setup_write_queue(self) -> None:
+        """
+        Starts the writer thread committing the writes of the data contracts in groups when GROUP_COMMIT is enabled,
+        and stops it on shutdown once the writes already submitted are committed.
+        """
+        if not settings.GROUP_COMMIT:
+            logger.info(" 💡 Group commit is disabled")
+            return
+        try:
+            write_queue.start(db_manager.engine)
+            self.app.add_event_handler("shutdown", write_queue.stop)
+        except Exception as e:
+            logger.error(f" ❌ Error starting the write queue: {e}")
+
     def setup_health_check(self) -> None:
         """
         Sets up the health check endpoint for the application.
@@ -1,9 +1,17 @@
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import JSON, String
+from sqlalchemy import JSON, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..database.manager import db_manager
+from ..database.types import CompressedJSON, CompressedText
+
+# JSON documents are stored as JSONB on PostgreSQL, so they can be indexed and queried without re-parsing
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+# Filtered text columns use byte order on PostgreSQL, so that prefix ranges are evaluated through their B-tree index
+IndexedText = String().with_variant(String(collation="C"), "postgresql")
 
 
 class DataContract(db_manager.Base):
@@ -15,19 +23,40 @@ class DataContract(db_manager.Base):
     """
 
     __tablename__ = "data_contracts"
+    __table_args__ = (
+        # GIN indexes only exist on PostgreSQL, other backends skip them
+        Index("ix_data_contracts_info_gin", "info", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_data_contracts_servers_gin", "servers", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_data_contracts_tags_gin", "tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
-    data_contract_specification: Mapped[str] = mapped_column(String, nullable=False)
-    info: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
-    servers: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
-    terms: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
-    models: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
-    definitions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
-    examples: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSON)
-    service_level: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
-    quality: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
-    links: Mapped[Optional[Dict[str, str]]] = mapped_column(JSON)
-    tags: Mapped[Optional[List[str]]] = mapped_column(JSON)
+    data_contract_specification: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # Copies of the scalar fields of `info`, so that the catalog can be filtered through indexes
+    info_title: Mapped[Optional[str]] = mapped_column(IndexedText, index=True)
+    info_version: Mapped[Optional[str]] = mapped_column(IndexedText, index=True)
+    info_owner: Mapped[Optional[str]] = mapped_column(IndexedText, index=True)
+    info_status: Mapped[Optional[str]] = mapped_column(IndexedText, index=True)
+    info: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=False)
+    servers: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDocument)
+    terms: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDocument)
+    # The sections that hold large schemas and inline example data, and the whole document, are compressed
+    # on SQLite so that more rows fit in each page of the database file and of its cache
+    models: Mapped[Optional[Dict[str, Any]]] = mapped_column(CompressedJSON())
+    definitions: Mapped[Optional[Dict[str, Any]]] = mapped_column(CompressedJSON())
+    examples: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(CompressedJSON())
+    service_level: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDocument)
+    quality: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDocument)
+    links: Mapped[Optional[Dict[str, str]]] = mapped_column(JSONDocument)
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSONDocument)
+    # Canonical JSON of the whole data contract, as served by the API. It is only written by the validated
+    # write paths, so it can be sent as is without being parsed nor validated again
+    document: Mapped[Optional[str]] = mapped_column(CompressedText())
+    # SHA-256 of the document, served as its ETag so that unchanged data contracts are not sent again
+    content_hash: Mapped[Optional[str]] = mapped_column(String)
+    # Incremented by every write, which only applies if the version is still the one it read, so that concurrent
+    # writes of a data contract are detected instead of overwriting each other
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
 
     def __repr__(self) -> str:
         """
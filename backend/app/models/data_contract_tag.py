@@ -0,0 +1,30 @@
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database.manager import db_manager
+
+
+class DataContractTag(db_manager.Base):
+    """
+    Represents the tag of a Data Contract in the database.
+
+    This model normalizes the `tags` of the data contracts into one row per (data contract, tag) pair,
+    so that the data contracts can be looked up by tag through an index rather than by decoding every
+    JSON list. It maps to the 'data_contract_tags' table in the database, and is kept in sync with the
+    `tags` column by the data contract CRUD operations.
+    """
+
+    __tablename__ = "data_contract_tags"
+    __table_args__ = (Index("ix_data_contract_tags_tag_contract_id", "tag", "contract_id"),)
+
+    contract_id: Mapped[str] = mapped_column(
+        String, ForeignKey("data_contracts.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(String, primary_key=True)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the DataContractTag object.
+        :return str: A string representation of the DataContractTag object.
+        """
+        return f"<DataContractTag(contract_id='{self.contract_id}', tag='{self.tag}')>"
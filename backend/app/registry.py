@@ -0,0 +1,22 @@
+import os
+from typing import Final, List, Tuple
+
+# Modules of the 'models' and 'routers' packages imported at startup. With STATIC_REGISTRY (the default), these
+# lists are imported as is instead of listing the package directories, so new modules must be added here
+MODEL_MODULES: Final[Tuple[str, ...]] = ("data_contract", "data_contract_tag")
+ROUTER_MODULES: Final[Tuple[str, ...]] = ("auth", "cache", "data_contract")
+
+
+def scan_modules(package: str) -> List[str]:
+    """
+    Lists the modules of a package of the application, as imported when STATIC_REGISTRY is disabled.
+
+    :param str package: The name of the package, relative to the application (e.g. "routers").
+    :return List[str]: The names of its modules, in alphabetical order.
+    """
+    package_dir = os.path.join(os.path.dirname(__file__), package)
+    return sorted(
+        filename[:-3]
+        for filename in os.listdir(package_dir)
+        if filename.endswith(".py") and not filename.startswith("__")
+    )
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, HTTPException, status
+
+from ..schemas.cache.routes.cache_stats import CacheStats, CacheStatsResponse
+from ..utils.cache import compact_document_cache, data_contract_cache
+
+router = APIRouter(tags=["Cache"])
+
+
+@router.get(
+    "/",
+    response_model=CacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get cache statistics",
+    description="Retrieves the hit, miss and eviction counters of the in-process caches.",
+    response_description="Successfully retrieved cache statistics",
+    responses={
+        200: {
+            "content": {"application/json": {"example": CacheStatsResponse.get_example()}},
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Failed to retrieve cache statistics: Internal server error"}
+                }
+            },
+        },
+    },
+)
+async def get_cache_stats_route() -> CacheStatsResponse:
+    """
+    Retrieves the statistics of the in-process caches.
+
+    Each worker process has its own caches, so the statistics are those of the worker serving the request.
+
+    :return CacheStatsResponse: A response containing a success message and the statistics of the caches.
+    :raises HTTPException:
+        - 500 Internal Server Error: If there's an unexpected error while reading the statistics.
+    """
+    try:
+        return CacheStatsResponse(
+            message=" ✅ Cache statistics retrieved successfully",
+            data={
+                "data_contracts": CacheStats(**data_contract_cache.stats()),
+                "compact_documents": CacheStats(**compact_document_cache.stats()),
+            },
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f" ❌ Failed to retrieve cache statistics: {str(e)}",
+        )
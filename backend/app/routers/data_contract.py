@@ -1,14 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Type, TypeVar, Union
 
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+from ..crud import data_contract_async
 from ..crud.data_contract import (
+    bulk_create_data_contracts,
+    count_data_contract_tags,
     create_data_contract,
     delete_data_contract,
-    get_data_contract,
-    list_data_contracts,
+    delete_data_contracts_by_ids,
+    get_data_contract_content_hash,
+    get_data_contract_document,
+    get_data_contract_summary,
+    get_data_contracts_by_ids,
+    iter_data_contract_documents,
+    list_data_contract_content_hashes,
+    list_data_contract_documents,
+    list_data_contract_summaries,
+    patch_data_contract,
     update_data_contract,
 )
 from ..database.manager import db_manager
+from ..database.writer import write_queue
+from ..schemas.data_contract.objects.data_contract import DataContract
+from ..schemas.data_contract.routes.data_contract_batch_delete import (
+    DataContractBatchDelete,
+    DataContractBatchDeleteResponse,
+)
+from ..schemas.data_contract.routes.data_contract_batch_get import (
+    DataContractBatchGet,
+    DataContractBatchGetResponse,
+)
+from ..schemas.data_contract.routes.data_contract_bulk_create import DataContractBulkCreateResponse
 from ..schemas.data_contract.routes.data_contract_create import (
     DataContractCreate,
     DataContractCreateResponse,
@@ -17,15 +48,179 @@ from ..schemas.data_contract.routes.data_contract_delete import (
     DataContractDelete,
     DataContractDeleteResponse,
 )
-from ..schemas.data_contract.routes.data_contract_get import DataContractGetResponse
-from ..schemas.data_contract.routes.data_contract_list import DataContractListResponse
+from ..schemas.data_contract.routes.data_contract_get import (
+    DataContractGetResponse,
+    DataContractSummaryGetResponse,
+)
+from ..schemas.data_contract.routes.data_contract_list import (
+    DataContractListResponse,
+    DataContractSummaryListResponse,
+)
+from ..schemas.data_contract.routes.data_contract_tags import DataContractTagsResponse
 from ..schemas.data_contract.routes.data_contract_update import (
     DataContractUpdate,
     DataContractUpdateResponse,
 )
+from ..utils.compression import json_response
+from ..utils.config import settings
+from ..utils.shared_cache import shared_cache
+from ..utils.tools import (
+    RawJSON,
+    compact_document,
+    decode_cursor,
+    decoded_etag,
+    dump_json_envelope,
+    encode_cursor,
+    etag_header,
+    etag_matches,
+    get_json_response_class,
+    make_etag,
+    parse_fields,
+    parse_tags,
+)
 
 router = APIRouter(tags=["Data Contract"])
 
+FIELDS_QUERY_DESCRIPTION = (
+    "A comma-separated list of fields to return, such as `info.title,info.version,info.owner`. "
+    "When set, a lightweight summary holding only the ID and the requested fields is returned."
+)
+
+COMPACT_QUERY_DESCRIPTION = (
+    "When true, the optional fields of the returned data contracts that have no value are omitted, instead of "
+    "being returned as null."
+)
+
+IF_MATCH_HEADER_DESCRIPTION = (
+    "The ETag of the data contract the write is based on. When set, the write is rejected with a 412 response "
+    "if the data contract was modified since, instead of overwriting the other modification."
+)
+
+PRECONDITION_FAILED_RESPONSE: Dict[str, Any] = {
+    "description": "Precondition failed: the data contract was modified since the ETag given in If-Match",
+    "content": {"application/json": {"example": {"detail": " ❌ Data contract was modified concurrently"}}},
+}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Request body of the routes reading a data contract with ``json_body``. The input models of these routes share
+# the schema of DataContract, which is always part of the OpenAPI components through the response models.
+DATA_CONTRACT_BODY_OPENAPI: Dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/{DataContract.__name__}"}}},
+    }
+}
+
+
+# Request body of the PATCH route, read as a JSON merge patch rather than through a Pydantic model
+MERGE_PATCH_BODY_OPENAPI: Dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            media_type: {"schema": {"type": "object"}, "example": {"tags": ["orders"], "info": {"owner": "Sales Team"}}}
+            for media_type in ("application/merge-patch+json", "application/json")
+        },
+    }
+}
+
+
+def json_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Builds a dependency reading the request body as a ``model``, in a single pass.
+
+    The raw body bytes are parsed and validated at once by ``model_validate_json``, instead of being
+    decoded to Python objects first and validated afterwards. Routes using it document their body
+    through ``openapi_extra``, as FastAPI does not see it.
+
+    :param Type[ModelT] model: The Pydantic model of the request body.
+    :return Callable[[Request], Awaitable[ModelT]]: The dependency.
+    """
+
+    async def read_json_body(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            # Reported like FastAPI's own body validation errors
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+
+    return read_json_body
+
+
+def not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """
+    Answers a conditional GET whose If-None-Match header matches the current ETag of the resource.
+
+    :param Request request: The incoming request.
+    :param Optional[str] etag: The current ETag of the resource, if any.
+    :return Optional[Response]: A 304 Not Modified response, or None if the resource is to be sent.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if not etag_matches(if_none_match, etag):
+        return None
+    # The ETag of the representation the client holds, which is the one of its compressed body if it was compressed
+    held = [
+        candidate.strip()
+        for candidate in if_none_match.split(",")
+        if decoded_etag(candidate.strip().removeprefix("W/")) == etag
+    ]
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": held[0] if held else etag})
+
+
+def document_etag(content_hash: Optional[str], projection: Optional[Dict] = None, compact: bool = False) -> str:
+    """
+    Builds the ETag of a data contract, as served by the routes returning it.
+
+    :param Optional[str] content_hash: The content hash of the data contract.
+    :param Optional[Dict] projection: The requested fields, if any.
+    :param bool compact: Whether the data contract is served in compact mode.
+    :return str: The ETag, which differs for each representation of the same content.
+    """
+    return make_etag([content_hash], json.dumps([projection, compact]) if projection is not None or compact else "")
+
+
+def model_response(response: BaseModel, compact: bool, status_code: int = status.HTTP_200_OK) -> Any:
+    """
+    Returns the response of a route returning a model, omitting its null fields in compact mode.
+
+    :param BaseModel response: The response model.
+    :param bool compact: Whether the response is served in compact mode.
+    :param int status_code: The status code of the response.
+    :return Any: The response model, serialized by FastAPI, or the compact response.
+    """
+    if not compact:
+        return response
+    return get_json_response_class()(
+        content=response.model_dump(mode="json", by_alias=True, exclude_none=True), status_code=status_code
+    )
+
+
+def updated_response(
+    message: str, row: Dict[str, Any], compact: bool = False, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Builds the response of a write, holding the stored document of the data contract and its new ETag.
+
+    The ETag is the one of the full data contract even in compact mode, so that it can be sent in the If-Match
+    header of the next write.
+
+    :param str message: The success message of the response.
+    :param Dict[str, Any] row: The values of the written columns, as returned by the create and update functions.
+    :param bool compact: Whether the data contract is served in compact mode.
+    :param int status_code: The status code of the response.
+    :return Response: The response.
+    """
+    document = compact_document(row["document"]) if compact else row["document"]
+    content = dump_json_envelope({"message": message, "data": RawJSON(document)})
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+        headers=etag_header(document_etag(row["content_hash"])),
+    )
+
 
 @router.post(
     "/",
@@ -34,6 +229,7 @@ router = APIRouter(tags=["Data Contract"])
     summary="Create a new data contract",
     description="Creates a new data contract and stores it in the database.",
     response_description="Successfully created data contract",
+    openapi_extra=DATA_CONTRACT_BODY_OPENAPI,
     responses={
         201: {
             "content": {"application/json": {"example": DataContractCreateResponse.get_example()}},
@@ -45,35 +241,43 @@ router = APIRouter(tags=["Data Contract"])
         500: {
             "description": "Internal server error",
             "content": {
-                "application/json": {
-                    "example": {"detail": " ❌ Failed to create data contract: Internal server error"}
-                }
+                "application/json": {"example": {"detail": " ❌ Failed to create data contract: Internal server error"}}
             },
         },
     },
     tags=["Data Contract"],
 )
 async def create_data_contract_route(
-    data_contract: DataContractCreate,
-    db: Session = Depends(db_manager.get_db),
+    data_contract: DataContractCreate = Depends(json_body(DataContractCreate)),
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
 ) -> DataContractCreateResponse:
     """
     Creates a new data contract and stores it in the database.
 
-    This endpoint accepts a DataContractCreate object, validates it, and attempts to create
-    a new data contract in the database. If successful, it returns the created contract.
+    This endpoint accepts a DataContractCreate object, parses and validates it from the raw request body
+    in a single pass, and attempts to create a new data contract in the database. If successful, it returns the stored
+    document of the created contract, without serializing it again, and its ETag.
     If an error occurs during the process, it raises an appropriate HTTP exception.
 
     :param DataContractCreate data_contract: The data contract to be created, validated against the DataContractCreate model.
-    :param Session db: The database session, automatically provided by FastAPI's dependency injection.
+    :param bool compact: Whether the null fields of the created data contract are omitted from the response.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
     :return DataContractCreateResponse: A response containing a success message and the created data contract.
     :raises HTTPException:
         - 400 Bad Request: If the input data is invalid.
         - 500 Internal Server Error: If there's an unexpected error during contract creation.
     """
     try:
-        created_contract = create_data_contract(db, data_contract)
-        return DataContractCreateResponse(message=" ✅ Data contract created successfully", data=created_contract)
+        if write_queue.running:
+            row = await write_queue.run(create_data_contract, data_contract)
+        elif isinstance(db, AsyncSession):
+            row = await data_contract_async.create_data_contract(db, data_contract)
+        else:
+            row = create_data_contract(db, data_contract)
+        return updated_response(
+            " ✅ Data contract created successfully", row, compact, status_code=status.HTTP_201_CREATED
+        )
     except ValueError as ve:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=f" ❌ Invalid data contract schema: {str(ve)}"
@@ -84,17 +288,315 @@ async def create_data_contract_route(
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=DataContractBulkCreateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Create many data contracts",
+    description="Creates many data contracts in batched transactions and reports the outcome of each of them.",
+    response_description="Successfully processed the bulk creation",
+    responses={
+        200: {
+            "content": {"application/json": {"example": DataContractBulkCreateResponse.get_example()}},
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Failed to bulk create data contracts: Internal server error"}
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def bulk_create_data_contracts_route(
+    data_contracts: List[Any] = Body(
+        ...,
+        max_length=settings.MAX_BULK_SIZE,
+        description="The data contracts to create, each one following the DataContractCreate schema.",
+        examples=[[DataContractCreate.get_example()]],
+    ),
+    chunk_size: int = Query(
+        settings.BULK_CHUNK_SIZE,
+        ge=1,
+        le=settings.MAX_BULK_SIZE,
+        description="The maximum number of data contracts inserted per transaction.",
+    ),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
+) -> DataContractBulkCreateResponse:
+    """
+    Creates many data contracts and stores them in the database.
+
+    This endpoint accepts a list of data contracts. Each of them is validated against the DataContractCreate
+    model, and the valid ones are inserted in batched transactions. An invalid or conflicting data contract does
+    not abort the batch: the response reports the outcome of every data contract, in the request order.
+
+    :param List[Any] data_contracts: The data contracts to create.
+    :param int chunk_size: The maximum number of data contracts inserted per transaction.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
+    :return DataContractBulkCreateResponse: A response containing a summary message and the outcome of each data contract.
+    :raises HTTPException:
+        - 500 Internal Server Error: If there's an unexpected error during the bulk creation.
+    """
+    try:
+        if isinstance(db, AsyncSession):
+            results = await data_contract_async.bulk_create_data_contracts(db, data_contracts, chunk_size=chunk_size)
+        else:
+            results = bulk_create_data_contracts(db, data_contracts, chunk_size=chunk_size)
+        created = sum(result.success for result in results)
+        return DataContractBulkCreateResponse(
+            message=f" ✅ {created} data contracts created, {len(results) - created} failed",
+            created=created,
+            failed=len(results) - created,
+            data=results,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f" ❌ Failed to bulk create data contracts: {str(e)}",
+        )
+
+
+@router.post(
+    "/batch_get",
+    response_model=DataContractBatchGetResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get many data contracts",
+    description="Retrieves many data contracts from the database by their IDs.",
+    response_description="Successfully retrieved data contracts",
+    responses={
+        200: {
+            "content": {"application/json": {"example": DataContractBatchGetResponse.get_example()}},
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Failed to retrieve data contracts: Internal server error"}
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def batch_get_data_contracts_route(
+    data_contract_batch_get: DataContractBatchGet,
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
+) -> DataContractBatchGetResponse:
+    """
+    Retrieves many data contracts from the database by their IDs.
+
+    This endpoint accepts a list of data contract IDs and retrieves the corresponding data contracts
+    in a single round trip. IDs that do not match any data contract are returned separately.
+    If an error occurs during the process, it raises an appropriate HTTP exception.
+
+    :param DataContractBatchGet data_contract_batch_get: The IDs of the data contracts to retrieve.
+    :param bool compact: Whether the null fields of the data contracts are omitted from the response.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
+    :return DataContractBatchGetResponse: A response containing a summary message, the retrieved data contracts
+        and the missing IDs.
+    :raises HTTPException:
+        - 500 Internal Server Error: If there's an unexpected error during contracts retrieval.
+    """
+    try:
+        if isinstance(db, AsyncSession):
+            contracts, missing_ids = await data_contract_async.get_data_contracts_by_ids(
+                db, data_contract_batch_get.ids
+            )
+        else:
+            contracts, missing_ids = get_data_contracts_by_ids(db, data_contract_batch_get.ids)
+        response = DataContractBatchGetResponse(
+            message=f" ✅ {len(contracts)} data contracts retrieved, {len(missing_ids)} missing",
+            data=contracts,
+            missing=missing_ids,
+        )
+        return model_response(response, compact)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f" ❌ Failed to retrieve data contracts: {str(e)}",
+        )
+
+
+@router.post(
+    "/batch_delete",
+    response_model=DataContractBatchDeleteResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Delete many data contracts",
+    description="Deletes many data contracts from the database by their IDs, in a single transaction.",
+    response_description="Successfully deleted data contracts",
+    responses={
+        200: {
+            "content": {"application/json": {"example": DataContractBatchDeleteResponse.get_example()}},
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Failed to delete data contracts: Internal server error"}
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def batch_delete_data_contracts_route(
+    data_contract_batch_delete: DataContractBatchDelete,
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
+) -> DataContractBatchDeleteResponse:
+    """
+    Deletes many data contracts from the database by their IDs.
+
+    This endpoint accepts a list of data contract IDs and deletes the corresponding data contracts
+    in a single transaction. IDs that do not match any data contract are returned separately.
+    If an error occurs during the process, it raises an appropriate HTTP exception.
+
+    :param DataContractBatchDelete data_contract_batch_delete: The IDs of the data contracts to delete.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
+    :return DataContractBatchDeleteResponse: A response containing a summary message, the deleted IDs
+        and the missing IDs.
+    :raises HTTPException:
+        - 500 Internal Server Error: If there's an unexpected error during contracts deletion.
+    """
+    try:
+        if isinstance(db, AsyncSession):
+            deleted_ids, missing_ids = await data_contract_async.delete_data_contracts_by_ids(
+                db, data_contract_batch_delete.ids
+            )
+        else:
+            deleted_ids, missing_ids = delete_data_contracts_by_ids(db, data_contract_batch_delete.ids)
+        return DataContractBatchDeleteResponse(
+            message=f" ✅ {len(deleted_ids)} data contracts deleted, {len(missing_ids)} missing",
+            deleted=deleted_ids,
+            missing=missing_ids,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f" ❌ Failed to delete data contracts: {str(e)}",
+        )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export all data contracts",
+    description="Streams every data contract of the catalog as newline-delimited JSON (one data contract per line).",
+    response_description="Successfully started the data contracts export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"data_contract_specification": "0.9.3", "id": "urn:datacontract:checkout:orders-latest"}\n'
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def export_data_contracts_route(
+    format: Literal["ndjson"] = Query("ndjson", description="The export format."),
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    session_factory: sessionmaker = Depends(db_manager.get_session_factory),
+) -> StreamingResponse:
+    """
+    Streams every data contract of the catalog as newline-delimited JSON.
+
+    Data contracts are read from the database in batches and written to the response one line at
+    a time, so the first bytes are sent right away and memory usage stays flat whatever the size
+    of the catalog. Each line is the stored document of a data contract, as served by GET and list,
+    or its compact document in compact mode. As the response outlives the request scope, the export
+    uses its own session.
+
+    :param Literal["ndjson"] format: The export format. Only "ndjson" is supported.
+    :param bool compact: Whether the null fields of the data contracts are omitted from the export.
+    :param sessionmaker session_factory: The session factory, automatically provided by FastAPI's dependency injection.
+    :return StreamingResponse: The streamed export, one JSON document per line.
+    """
+
+    def export_ndjson() -> Iterator[bytes]:
+        db = session_factory()
+        try:
+            for document in iter_data_contract_documents(db, batch_size=settings.EXPORT_BATCH_SIZE):
+                line = RawJSON(compact_document(document) if compact else document)
+                yield line.encode("utf-8") + b"\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(export_ndjson(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/tags",
+    response_model=DataContractTagsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Count the data contract tags",
+    description="Retrieves every tag of the catalog with the number of data contracts carrying it.",
+    response_description="Successfully retrieved data contract tags",
+    responses={
+        200: {
+            "content": {"application/json": {"example": DataContractTagsResponse.get_example()}},
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"detail": " ❌ Failed to retrieve data contract tags: Internal server error"}
+                }
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def count_data_contract_tags_route(
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
+) -> DataContractTagsResponse:
+    """
+    Retrieves every tag of the catalog with the number of data contracts carrying it.
+
+    The tags are counted by the database from the tag table, most used first, so that the UI can
+    display them without loading the data contracts.
+    If an error occurs during the process, it raises an appropriate HTTP exception.
+
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
+    :return DataContractTagsResponse: A response containing a success message and the tag counts.
+    :raises HTTPException:
+        - 500 Internal Server Error: If there's an unexpected error during tag retrieval.
+    """
+    try:
+        if isinstance(db, AsyncSession):
+            tag_counts = await data_contract_async.count_data_contract_tags(db)
+        else:
+            tag_counts = count_data_contract_tags(db)
+        return DataContractTagsResponse(message=" ✅ Data contract tags retrieved successfully", data=tag_counts)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f" ❌ Failed to retrieve data contract tags: {str(e)}",
+        )
+
+
 @router.get(
     "/{id}",
     response_model=DataContractGetResponse,
     status_code=status.HTTP_200_OK,
     summary="Get a data contract",
-    description="Retrieves a data contract from the database by its ID.",
+    description="Retrieves a data contract from the database by its ID, optionally restricted to some fields.",
     response_description="Successfully retrieved data contract",
     responses={
         200: {
             "content": {"application/json": {"example": DataContractGetResponse.get_example()}},
         },
+        304: {
+            "description": "Not modified: the If-None-Match header matches the current ETag",
+        },
+        400: {
+            "description": "Invalid fields",
+            "content": {"application/json": {"example": {"detail": " ❌ Unknown field: info.name"}}},
+        },
         404: {
             "description": "Data contract not found",
             "content": {"application/json": {"example": {"detail": " ❌ Data contract not found"}}},
@@ -110,26 +612,83 @@ async def create_data_contract_route(
     },
     tags=["Data Contract"],
 )
-async def get_data_contract_route(id: str, db: Session = Depends(db_manager.get_db)) -> DataContractGetResponse:
+async def get_data_contract_route(
+    request: Request,
+    id: str,
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
+) -> DataContractGetResponse:
     """
     Retrieves a data contract from the database by its ID.
 
     This endpoint accepts a data contract ID, attempts to retrieve the corresponding
-    data contract from the database. If successful, it returns the retrieved contract.
+    data contract from the database. If successful, it returns the retrieved contract, whose
+    stored JSON document is written into the response as is, without being validated again.
+    The response carries the content hash of the contract as its ETag: when the If-None-Match
+    header matches it, a 304 Not Modified response is returned without reading the contract.
+    Large responses are compressed, and their compressed bodies are cached by ETag.
+    When `fields` is set, only the requested fields are read from the database and a
+    DataContractSummaryGetResponse is returned instead. When `compact` is set, the optional fields without
+    a value are omitted: the compact documents are cached by content hash, and have their own ETag.
     If the contract is not found or an error occurs, it raises an appropriate HTTP exception.
 
+    :param Request request: The incoming request, whose Accept-Encoding selects the compression of the response.
     :param str id: The unique identifier of the data contract to retrieve. Example: "urn:datacontract:checkout:orders-latest"
-    :param Session db: The database session, automatically provided by FastAPI's dependency injection.
+    :param Optional[str] fields: The comma-separated list of fields to return, if any.
+    :param bool compact: Whether the null fields of the data contract are omitted from the response.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
     :return DataContractGetResponse: A response containing a success message and the retrieved data contract.
     :raises HTTPException:
+        - 400 Bad Request: If the requested fields are invalid.
         - 404 Not Found: If the data contract with the given ID is not found.
         - 500 Internal Server Error: If there's an unexpected error during contract retrieval.
     """
     try:
-        retrieved_contract = get_data_contract(db, id)
-        if retrieved_contract is None:
+        projection = parse_fields(fields) if fields is not None else None
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f" ❌ {str(ve)}")
+
+    try:
+        if isinstance(db, AsyncSession):
+            content_hash = await data_contract_async.get_data_contract_content_hash(db, id)
+        else:
+            content_hash = get_data_contract_content_hash(db, id)
+        etag = document_etag(content_hash, projection, compact)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        if projection is not None:
+            if isinstance(db, AsyncSession):
+                loaded = await data_contract_async.get_data_contract_summary(db, id, projection)
+            else:
+                loaded = get_data_contract_summary(db, id, projection)
+            if loaded is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f" ❌ Data contract not found: {id}")
+            summary, content_hash = loaded
+            response = DataContractSummaryGetResponse(message=" ✅ Data contract retrieved successfully", data=summary)
+            return get_json_response_class()(
+                content=response.model_dump(mode="json", exclude_unset=True, exclude_none=compact),
+                headers=etag_header(document_etag(content_hash, projection, compact)),
+            )
+
+        if isinstance(db, AsyncSession):
+            loaded = await data_contract_async.get_data_contract_document(db, id)
+        elif shared_cache.enabled:
+            # Waiting for another worker to load the document into the shared cache would block the event loop
+            loaded = await run_in_threadpool(get_data_contract_document, db, id)
+        else:
+            loaded = get_data_contract_document(db, id)
+        if loaded is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f" ❌ Data contract not found: {id}")
-        return DataContractGetResponse(message=" ✅ Data contract retrieved successfully", data=retrieved_contract)
+        # The ETag of the document actually read, in case it was written since its hash was read
+        document, content_hash = loaded
+        etag = document_etag(content_hash, projection, compact)
+        if compact:
+            document = compact_document(document)
+        content = dump_json_envelope({"message": " ✅ Data contract retrieved successfully", "data": RawJSON(document)})
+        return json_response(request, content, etag=etag)
     except HTTPException:
         raise
     except Exception as e:
@@ -142,13 +701,21 @@ async def get_data_contract_route(id: str, db: Session = Depends(db_manager.get_
     "/",
     response_model=DataContractListResponse,
     status_code=status.HTTP_200_OK,
-    summary="List all data contracts",
-    description="Retrieves all data contracts from the database.",
+    summary="List data contracts",
+    description="Retrieves one page of data contracts from the database, using cursor-based pagination "
+    "and optionally restricted to some fields.",
     response_description="Successfully retrieved data contracts",
     responses={
         200: {
             "content": {"application/json": {"example": DataContractListResponse.get_example()}},
         },
+        304: {
+            "description": "Not modified: the If-None-Match header matches the current ETag",
+        },
+        400: {
+            "description": "Invalid pagination cursor or fields",
+            "content": {"application/json": {"example": {"detail": " ❌ Invalid pagination cursor"}}},
+        },
         500: {
             "description": "Internal server error",
             "content": {
@@ -160,22 +727,148 @@ async def get_data_contract_route(id: str, db: Session = Depends(db_manager.get_
     },
     tags=["Data Contract"],
 )
-async def list_data_contracts_route(db: Session = Depends(db_manager.get_db)) -> DataContractListResponse:
+async def list_data_contracts_route(
+    request: Request,
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
+        description="The maximum number of data contracts to return.",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="The `next_cursor` returned by the previous page. Omit it to start from the first page.",
+    ),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    owner: Optional[str] = Query(None, description="Only return the data contracts with this exact owner."),
+    title_prefix: Optional[str] = Query(
+        None, description="Only return the data contracts whose title starts with this case-sensitive prefix."
+    ),
+    version: Optional[str] = Query(
+        None,
+        description="Only return the data contracts with this exact version, or within a version range such as "
+        "`2.x` or `2.*` (any version starting with `2.`).",
+    ),
+    tag: Optional[str] = Query(None, description="Only return the data contracts carrying this tag."),
+    tags_all: Optional[str] = Query(
+        None, description="A comma-separated list of tags: only return the data contracts carrying all of them."
+    ),
+    tags_any: Optional[str] = Query(
+        None, description="A comma-separated list of tags: only return the data contracts carrying any of them."
+    ),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
+) -> DataContractListResponse:
     """
-    Retrieves all data contracts from the database.
+    Retrieves one page of data contracts from the database.
 
-    This endpoint attempts to retrieve all data contracts from the database.
-    If successful, it returns a list of all contracts.
+    This endpoint returns at most `limit` data contracts, ordered by ID. When more data contracts
+    are available, the response contains a `next_cursor` to pass back to retrieve the next page.
+    The stored JSON documents of the data contracts are written into the response as is.
+    When `fields` is set, only the requested fields are read from the database and a
+    DataContractSummaryListResponse is returned instead. When `compact` is set, the optional fields without a
+    value are omitted from the data contracts. The `owner`, `title_prefix`, `version` and tag
+    filters are evaluated by the database through indexed columns and the tag table.
+    The ETag of the page is derived from the content hashes of its data contracts, which are read
+    first: when the If-None-Match header matches it, a 304 Not Modified response is returned.
+    Otherwise, pages of whole data contracts are served from the shared cache when it is set up.
     If an error occurs during the process, it raises an appropriate HTTP exception.
 
-    :param Session db: The database session, automatically provided by FastAPI's dependency injection.
-    :return DataContractListResponse: A response containing a success message and the list of data contracts.
+    :param Request request: The incoming request, whose If-None-Match header is checked against the page ETag.
+    :param int limit: The maximum number of data contracts to return.
+    :param Optional[str] cursor: The cursor returned by the previous page, if any.
+    :param Optional[str] fields: The comma-separated list of fields to return, if any.
+    :param bool compact: Whether the null fields of the data contracts are omitted from the response.
+    :param Optional[str] owner: The exact owner of the data contracts to return, if any.
+    :param Optional[str] title_prefix: The prefix of the titles of the data contracts to return, if any.
+    :param Optional[str] version: The exact version or version range of the data contracts to return, if any.
+    :param Optional[str] tag: A tag the data contracts to return must carry, if any.
+    :param Optional[str] tags_all: The comma-separated tags the data contracts to return must all carry, if any.
+    :param Optional[str] tags_any: The comma-separated tags the data contracts to return must carry one of, if any.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
+    :return DataContractListResponse: A response containing a success message, the page of data contracts
+        and the cursor of the next page.
     :raises HTTPException:
+        - 400 Bad Request: If the pagination cursor or the requested fields are invalid.
         - 500 Internal Server Error: If there's an unexpected error during contract retrieval.
     """
     try:
-        contracts = list_data_contracts(db)
-        return DataContractListResponse(message=" ✅ Data contracts retrieved successfully", data=contracts)
+        after_id = decode_cursor(cursor) if cursor is not None else None
+        projection = parse_fields(fields) if fields is not None else None
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f" ❌ {str(ve)}")
+    filters = {
+        "owner": owner,
+        "title_prefix": title_prefix,
+        "version": version,
+        "tags_all": ([tag] if tag else []) + parse_tags(tags_all),
+        "tags_any": parse_tags(tags_any),
+    }
+
+    try:
+        if isinstance(db, AsyncSession):
+            content_hashes, next_after_id = await data_contract_async.list_data_contract_content_hashes(
+                db, limit=limit, after_id=after_id, filters=filters
+            )
+        else:
+            content_hashes, next_after_id = list_data_contract_content_hashes(
+                db, limit=limit, after_id=after_id, filters=filters
+            )
+
+        def page_etag(content_hashes: List[Optional[str]], next_after_id: Optional[str]) -> Optional[str]:
+            return make_etag(content_hashes, json.dumps([projection, next_after_id, compact]))
+
+        etag = page_etag(content_hashes, next_after_id)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        if projection is not None:
+            if isinstance(db, AsyncSession):
+                summaries, content_hashes, next_after_id = await data_contract_async.list_data_contract_summaries(
+                    db, projection, limit=limit, after_id=after_id, filters=filters
+                )
+            else:
+                summaries, content_hashes, next_after_id = list_data_contract_summaries(
+                    db, projection, limit=limit, after_id=after_id, filters=filters
+                )
+            response = DataContractSummaryListResponse(
+                message=" ✅ Data contracts retrieved successfully",
+                data=summaries,
+                next_cursor=encode_cursor(next_after_id) if next_after_id is not None else None,
+            )
+            return get_json_response_class()(
+                content=response.model_dump(mode="json", exclude_unset=True, exclude_none=compact),
+                headers=etag_header(page_etag(content_hashes, next_after_id)),
+            )
+
+        def build_page(
+            documents: List[str], content_hashes: List[Optional[str]], next_after_id: Optional[str]
+        ) -> Tuple[bytes, Optional[str]]:
+            if compact:
+                documents = [compact_document(document) for document in documents]
+            content = dump_json_envelope(
+                {
+                    "message": " ✅ Data contracts retrieved successfully",
+                    "data": RawJSON("[" + ",".join(documents) + "]"),
+                    "next_cursor": encode_cursor(next_after_id) if next_after_id is not None else None,
+                }
+            )
+            # The ETag of the data contracts actually read, in case they were written since their hashes were read
+            return content, page_etag(content_hashes, next_after_id)
+
+        async def load_page() -> Tuple[bytes, Optional[str]]:
+            if isinstance(db, AsyncSession):
+                return build_page(
+                    *await data_contract_async.list_data_contract_documents(
+                        db, limit=limit, after_id=after_id, filters=filters
+                    )
+                )
+            return build_page(*list_data_contract_documents(db, limit=limit, after_id=after_id, filters=filters))
+
+        # The ETag identifies the content of the page, so its body can be shared across workers without invalidation
+        content, etag = await shared_cache.aget_list_page(etag, load_page)
+        return Response(content=content, media_type="application/json", headers=etag_header(etag))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -190,6 +883,7 @@ async def list_data_contracts_route(db: Session = Depends(db_manager.get_db)) ->
     summary="Update a data contract",
     description="Updates an existing data contract in the database.",
     response_description="Successfully updated data contract",
+    openapi_extra=DATA_CONTRACT_BODY_OPENAPI,
     responses={
         200: {
             "content": {"application/json": {"example": DataContractUpdateResponse.get_example()}},
@@ -198,12 +892,11 @@ async def list_data_contracts_route(db: Session = Depends(db_manager.get_db)) ->
             "description": "Data contract not found",
             "content": {"application/json": {"example": {"detail": " ❌ Data contract not found"}}},
         },
+        412: PRECONDITION_FAILED_RESPONSE,
         500: {
             "description": "Internal server error",
             "content": {
-                "application/json": {
-                    "example": {"detail": " ❌ Failed to update data contract: Internal server error"}
-                }
+                "application/json": {"example": {"detail": " ❌ Failed to update data contract: Internal server error"}}
             },
         },
     },
@@ -211,37 +904,141 @@ async def list_data_contracts_route(db: Session = Depends(db_manager.get_db)) ->
 )
 async def update_data_contract_route(
     id: str,
-    data_contract_update: DataContractUpdate,
-    db: Session = Depends(db_manager.get_db),
+    data_contract_update: DataContractUpdate = Depends(json_body(DataContractUpdate)),
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    if_match: Optional[str] = Header(None, description=IF_MATCH_HEADER_DESCRIPTION),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
 ) -> DataContractUpdateResponse:
     """
     Updates an existing data contract in the database.
 
     This endpoint accepts a data contract ID and update information, attempts to update the corresponding
-    data contract in the database. If successful, it returns the updated contract.
+    data contract in the database. If successful, it returns the updated contract, with its new ETag.
+    When the If-Match header is set, the update only applies if the data contract still has that ETag:
+    concurrent updates are detected through the version of the data contract, without locking it.
     If the contract is not found or an error occurs, it raises an appropriate HTTP exception.
 
     :param str id: The unique identifier of the data contract to update.
     :param DataContractUpdate data_contract_update: The update information for the data contract.
-    :param Session db: The database session, automatically provided by FastAPI's dependency injection.
+    :param bool compact: Whether the null fields of the updated data contract are omitted from the response.
+    :param Optional[str] if_match: The ETag the update is based on, if any.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
     :return DataContractUpdateResponse: A response containing a success message and the updated data contract.
     :raises HTTPException:
         - 404 Not Found: If the data contract with the given ID is not found.
+        - 412 Precondition Failed: If the data contract was modified since the ETag given in If-Match.
         - 500 Internal Server Error: If there's an unexpected error during contract update.
     """
     try:
-        updated_contract = update_data_contract(db, id, data_contract_update)
-        if updated_contract is None:
+        if write_queue.running:
+            row = await write_queue.run(update_data_contract, id, data_contract_update, if_match)
+        elif isinstance(db, AsyncSession):
+            row = await data_contract_async.update_data_contract(db, id, data_contract_update, if_match)
+        else:
+            row = update_data_contract(db, id, data_contract_update, if_match)
+        if row is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f" ❌ Data contract not found: {id}")
-        return DataContractUpdateResponse(message=" ✅ Data contract updated successfully", data=updated_contract)
+        return updated_response(" ✅ Data contract updated successfully", row, compact)
     except HTTPException:
         raise
+    except StaleDataError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=f" ❌ Data contract was modified concurrently: {id}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f" ❌ Failed to update data contract: {str(e)}"
         )
 
 
+@router.patch(
+    "/{id}",
+    response_model=DataContractUpdateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Patch a data contract",
+    description="Applies a JSON merge patch (RFC 7386) to an existing data contract.",
+    response_description="Successfully patched data contract",
+    openapi_extra=MERGE_PATCH_BODY_OPENAPI,
+    responses={
+        200: {
+            "content": {"application/json": {"example": DataContractUpdateResponse.get_example()}},
+        },
+        400: {
+            "description": "Invalid merge patch",
+            "content": {"application/json": {"example": {"detail": " ❌ Unknown field: owner"}}},
+        },
+        404: {
+            "description": "Data contract not found",
+            "content": {"application/json": {"example": {"detail": " ❌ Data contract not found"}}},
+        },
+        412: PRECONDITION_FAILED_RESPONSE,
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {"example": {"detail": " ❌ Failed to patch data contract: Internal server error"}}
+            },
+        },
+    },
+    tags=["Data Contract"],
+)
+async def patch_data_contract_route(
+    request: Request,
+    id: str,
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    if_match: Optional[str] = Header(None, description=IF_MATCH_HEADER_DESCRIPTION),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
+) -> DataContractUpdateResponse:
+    """
+    Applies a JSON merge patch (RFC 7386) to an existing data contract.
+
+    The body is an object keyed by top-level section, such as `{"tags": ["orders"], "info": {"owner": "Sales"}}`:
+    objects are merged into the stored ones, and null values remove the corresponding members. Only the patched
+    sections are validated and written, so a small patch of a large contract stays cheap.
+    If successful, it returns the patched contract, with its new ETag. When the If-Match header is set, the patch
+    only applies if the data contract still has that ETag.
+
+    :param Request request: The incoming request, whose body is the merge patch.
+    :param str id: The unique identifier of the data contract to patch.
+    :param bool compact: Whether the null fields of the patched data contract are omitted from the response.
+    :param Optional[str] if_match: The ETag the patch is based on, if any.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
+    :return DataContractUpdateResponse: A response containing a success message and the patched data contract.
+    :raises HTTPException:
+        - 400 Bad Request: If the body is not a JSON object, changes the ID, or patches an unknown section.
+        - 404 Not Found: If the data contract with the given ID is not found.
+        - 412 Precondition Failed: If the data contract was modified since the ETag given in If-Match.
+        - 422 Unprocessable Entity: If a patched section is invalid.
+        - 500 Internal Server Error: If there's an unexpected error during contract patch.
+    """
+    try:
+        patch = json.loads(await request.body())
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f" ❌ Invalid merge patch: {str(ve)}")
+
+    try:
+        if write_queue.running:
+            row = await write_queue.run(patch_data_contract, id, patch, if_match)
+        elif isinstance(db, AsyncSession):
+            row = await data_contract_async.patch_data_contract(db, id, patch, if_match)
+        else:
+            row = patch_data_contract(db, id, patch, if_match)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f" ❌ Data contract not found: {id}")
+        return updated_response(" ✅ Data contract patched successfully", row, compact)
+    except (HTTPException, RequestValidationError):
+        raise
+    except StaleDataError:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=f" ❌ Data contract was modified concurrently: {id}"
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f" ❌ {str(ve)}")
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f" ❌ Failed to patch data contract: {str(e)}"
+        )
+
+
 @router.delete(
     "/{id}",
     response_model=DataContractDeleteResponse,
@@ -260,9 +1057,7 @@ async def update_data_contract_route(
         500: {
             "description": "Internal server error",
             "content": {
-                "application/json": {
-                    "example": {"detail": " ❌ Failed to delete data contract: Internal server error"}
-                }
+                "application/json": {"example": {"detail": " ❌ Failed to delete data contract: Internal server error"}}
             },
         },
     },
@@ -270,7 +1065,8 @@ async def update_data_contract_route(
 )
 async def delete_data_contract_route(
     id: str = "urn:datacontract:checkout:orders-latest",
-    db: Session = Depends(db_manager.get_db),
+    compact: bool = Query(False, description=COMPACT_QUERY_DESCRIPTION),
+    db: Union[Session, AsyncSession] = Depends(db_manager.get_session),
 ) -> DataContractDeleteResponse:
     """
     Deletes an existing data contract from the database.
@@ -280,7 +1076,8 @@ async def delete_data_contract_route(
     If the contract is not found or an error occurs, it raises an appropriate HTTP exception.
 
     :param str id: The unique identifier of the data contract to delete.
-    :param Session db: The database session, automatically provided by FastAPI's dependency injection.
+    :param bool compact: Whether the null fields of the deleted data contract are omitted from the response.
+    :param Union[Session, AsyncSession] db: The database session (async when the async engine is set up), automatically provided by FastAPI's dependency injection.
     :return DataContractDeleteResponse: A response containing a success message and the deleted data contract.
     :raises HTTPException:
         - 404 Not Found: If the data contract with the given ID is not found.
@@ -288,10 +1085,16 @@ async def delete_data_contract_route(
     """
     try:
         data_contract_delete = DataContractDelete(id=id)
-        deleted_contract = delete_data_contract(db, data_contract_delete)
+        if write_queue.running:
+            deleted_contract = await write_queue.run(delete_data_contract, data_contract_delete)
+        elif isinstance(db, AsyncSession):
+            deleted_contract = await data_contract_async.delete_data_contract(db, data_contract_delete)
+        else:
+            deleted_contract = delete_data_contract(db, data_contract_delete)
         if deleted_contract is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f" ❌ Data contract not found: {id}")
-        return DataContractDeleteResponse(message=" ✅ Data contract deleted successfully", data=deleted_contract)
+        response = DataContractDeleteResponse(message=" ✅ Data contract deleted successfully", data=deleted_contract)
+        return model_response(response, compact)
     except HTTPException:
         raise
     except Exception as e:
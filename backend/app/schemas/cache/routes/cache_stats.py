@@ -0,0 +1,64 @@
+from typing import Dict
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class CacheStats(BaseModelWithExample):
+    """
+    Represents the statistics of an in-process cache.
+    """
+
+    entries: int = Field(
+        ...,
+        example=120,
+        description="The number of cached entries.",
+    )
+    size: int = Field(
+        ...,
+        example=5242880,
+        description="The total size of the cached values, in bytes.",
+    )
+    max_bytes: int = Field(
+        ...,
+        example=67108864,
+        description="The maximum total size of the cached values, in bytes.",
+    )
+    hits: int = Field(
+        ...,
+        example=9500,
+        description="The number of lookups served from the cache.",
+    )
+    misses: int = Field(
+        ...,
+        example=480,
+        description="The number of lookups that were not cached or had expired.",
+    )
+    evictions: int = Field(
+        ...,
+        example=12,
+        description="The number of entries removed to make room for new ones.",
+    )
+    expirations: int = Field(
+        ...,
+        example=300,
+        description="The number of entries found expired on lookup.",
+    )
+
+
+class CacheStatsResponse(BaseModelWithExample):
+    """
+    Represents the response for the statistics of the in-process caches.
+    """
+
+    message: str = Field(
+        ...,
+        example=" ✅ Cache statistics retrieved successfully",
+        description="A message indicating the statistics were retrieved.",
+    )
+    data: Dict[str, CacheStats] = Field(
+        ...,
+        example={"data_contracts": CacheStats.get_example()},
+        description="The statistics of the caches of the worker process serving the request, by cache name.",
+    )
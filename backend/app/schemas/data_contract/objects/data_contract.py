@@ -8,7 +8,7 @@ from .example_object import ExampleObject
 from .info_object import InfoObject
 from .model_object import ModelObject
 from .quality_object import QualityObject
-from .server_object import ServerObject
+from .server_object import S3ServerObject, Server
 from .service_level_object import ServiceLevelObject
 from .term_object import TermObject
 
@@ -34,10 +34,10 @@ class DataContract(BaseModelWithExample):
         description="REQUIRED. Specifies the metadata of the data contract.",
         example=InfoObject.get_example(),
     )
-    servers: Optional[Dict[str, ServerObject]] = Field(
+    servers: Optional[Dict[str, Server]] = Field(
         None,
         description="Specifies the servers of the data contract.",
-        example={"production": ServerObject.get_example()},
+        example={"production": S3ServerObject.get_example()},
     )
     terms: Optional[TermObject] = Field(
         None,
@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractSummary(BaseModelWithExample):
+    """
+    Represents a sparse view of a Data Contract, restricted to the requested fields.
+
+    Only the ID is always present. The other sections are returned as stored, without being
+    validated against their full schema, and nested sections only contain the requested keys.
+    """
+
+    id: str = Field(
+        ...,
+        description="REQUIRED. An organization-wide unique technical identifier.",
+        example="urn:datacontract:checkout:orders-latest",
+    )
+    data_contract_specification: Optional[str] = Field(
+        None,
+        description="Specifies the Data Contract Specification being used.",
+        example="0.9.3",
+    )
+    info: Optional[Dict[str, Any]] = Field(
+        None,
+        description="The requested keys of the metadata of the data contract.",
+        example={"title": "Orders Latest", "version": "1.0.0", "owner": "Checkout Team"},
+    )
+    servers: Optional[Dict[str, Any]] = Field(None, description="The servers of the data contract.")
+    terms: Optional[Dict[str, Any]] = Field(None, description="The terms and conditions of the data contract.")
+    models: Optional[Dict[str, Any]] = Field(None, description="The logical data model.")
+    definitions: Optional[Dict[str, Any]] = Field(None, description="The definitions.")
+    examples: Optional[List[Dict[str, Any]]] = Field(None, description="The example data sets.")
+    service_level: Optional[Dict[str, Any]] = Field(None, description="The service level of the provided data.")
+    quality: Optional[Dict[str, Any]] = Field(None, description="The quality attributes and checks.")
+    links: Optional[Dict[str, str]] = Field(None, description="Additional external documentation links.")
+    tags: Optional[List[str]] = Field(None, description="Custom metadata to provide additional context.")
@@ -1,4 +1,4 @@
-from typing import Literal, Union
+from typing import Annotated, Literal, Union
 
 from pydantic import Field
 
@@ -100,21 +100,33 @@ class CustomQualityObject(BaseModelWithExample):
     )
 
 
+# A quality specification. It is validated straight by the model of its type, looked up from the "type" key by
+# pydantic-core rather than by trying every model in turn. The specifications without a type are validated as
+# SodaCL, or as Great Expectations for dictionaries, the only models accepting them
+QualitySpecification = Annotated[
+    Union[
+        Annotated[
+            Union[SodaCLQualityObject, MonteCarloQualityObject, GreatExpectationsQualityObject, CustomQualityObject],
+            Field(discriminator="type"),
+        ],
+        SodaCLQualityObject,
+        GreatExpectationsQualityObject,
+    ],
+    Field(union_mode="left_to_right"),
+]
+
+
 class QualityObject(BaseModelWithExample):
     """
     Represents the quality object containing quality attributes and checks.
 
     :param str type: REQUIRED. The type of the schema (e.g., 'SodaCL', 'montecarlo', 'great-expectations', 'custom').
-    :param Union[SodaCLQualityObject, MonteCarloQualityObject, GreatExpectationsQualityObject, CustomQualityObject] specification: REQUIRED. The specification of the quality attributes.
+    :param QualitySpecification specification: REQUIRED. The specification of the quality attributes, of one of the
+        types above.
     """
 
     type: str = Field(..., description="REQUIRED. The type of the schema.", example="SodaCL")
-    specification: Union[
-        SodaCLQualityObject,
-        MonteCarloQualityObject,
-        GreatExpectationsQualityObject,
-        CustomQualityObject,
-    ] = Field(
+    specification: QualitySpecification = Field(
         ...,
         description="REQUIRED. The specification of the quality attributes.",
         example=SodaCLQualityObject.get_example(),
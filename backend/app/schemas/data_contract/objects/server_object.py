@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Annotated, Dict, Literal, Optional, Type, Union
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, field_validator
 
 from ....utils.example_model import BaseModelWithExample
 
@@ -9,10 +9,14 @@ class ServerObject(BaseModelWithExample):
     """
     Represents a server object in a data contract.
 
-    This class defines the structure and properties of a server,
-    including its type, description, environment, and other type-specific fields.
+    This class defines the fields common to every server type. The servers of the known types are validated by the
+    model of their type below, holding only the fields of that type, and the servers of other types by
+    OtherServerObject. The keys a model does not define are kept as they are, as they were by the flat server
+    model holding the fields of every type.
     """
 
+    model_config = ConfigDict(extra="allow")
+
     type: str = Field(
         ...,
         description="REQUIRED. The type of the data product technology that implements the data contract.",
@@ -29,7 +33,13 @@ class ServerObject(BaseModelWithExample):
         example="prod",
     )
 
-    # Fields for S3 Server Object
+
+class S3ServerObject(ServerObject):
+    """
+    Represents a server on Amazon S3 or an S3-compatible object storage.
+    """
+
+    type: Literal["s3"] = Field(..., description="REQUIRED. The type of the server, always 's3'.", example="s3")
     location: Optional[str] = Field(
         None,
         description="S3 URL, starting with s3://",
@@ -51,7 +61,15 @@ class ServerObject(BaseModelWithExample):
         example="new_line",
     )
 
-    # Fields for BigQuery Server Object
+
+class BigQueryServerObject(ServerObject):
+    """
+    Represents a Google BigQuery dataset.
+    """
+
+    type: Literal["bigquery"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'bigquery'.", example="bigquery"
+    )
     project: Optional[str] = Field(
         None,
         description="The GCP project name.",
@@ -63,7 +81,15 @@ class ServerObject(BaseModelWithExample):
         example="orders_dataset",
     )
 
-    # Fields for Redshift Server Object
+
+class RedshiftServerObject(ServerObject):
+    """
+    Represents an Amazon Redshift cluster.
+    """
+
+    type: Literal["redshift"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'redshift'.", example="redshift"
+    )
     account: Optional[str] = Field(
         None,
         description="The Redshift account.",
@@ -100,50 +126,248 @@ class ServerObject(BaseModelWithExample):
         example="my-redshift-cluster.abcdefg.us-west-2.redshift.amazonaws.com:5439",
     )
 
-    # Fields for Azure Server Object
-    # Note: 'location' field is reused from S3 Server Object
 
-    # Fields for SQL-Server Server Object
+class AzureServerObject(ServerObject):
+    """
+    Represents files on Azure Blob Storage or Azure Data Lake Storage.
+    """
+
+    type: Literal["azure"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'azure'.", example="azure"
+    )
+    location: Optional[str] = Field(
+        None,
+        description="Fully qualified path to the files, starting with az:// or abfss://",
+        example="az://my_storage_account_name.blob.core.windows.net/my_container/path/*.parquet",
+    )
+    format: Optional[str] = Field(
+        None,
+        description="Format of files, such as parquet, delta, json, csv",
+        example="parquet",
+    )
+    delimiter: Optional[str] = Field(
+        None,
+        description="(Only for format = json) How multiple json documents are delimited within one file",
+        example="new_line",
+    )
+
+
+class SqlServerServerObject(ServerObject):
+    """
+    Represents a Microsoft SQL Server database.
+    """
+
+    type: Literal["sqlserver"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'sqlserver'.", example="sqlserver"
+    )
+    host: Optional[str] = Field(
+        None,
+        description="The host of the database server.",
+        example="localhost",
+    )
+    port: Optional[int] = Field(
+        None,
+        description="The port of the database server.",
+        example=1433,
+    )
+    database: Optional[str] = Field(
+        None,
+        description="The database name.",
+        example="orders_db",
+    )
+    schema_name: Optional[str] = Field(
+        None,
+        description="The schema name.",
+        example="dbo",
+    )
     driver: Optional[str] = Field(
         None,
         description="The name of the supported driver.",
         example="ODBC Driver 17 for SQL Server",
     )
 
-    # Fields for Snowflake Server Object
-    # Note: 'account', 'database', and 'schema' fields are reused from Redshift Server Object
 
-    # Fields for Databricks Server Object
+class SnowflakeServerObject(ServerObject):
+    """
+    Represents a Snowflake database.
+    """
+
+    type: Literal["snowflake"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'snowflake'.", example="snowflake"
+    )
+    account: Optional[str] = Field(
+        None,
+        description="The Snowflake account.",
+        example="abcdefg-xn12345",
+    )
+    database: Optional[str] = Field(
+        None,
+        description="The database name.",
+        example="ORDERS_DB",
+    )
+    schema_name: Optional[str] = Field(
+        None,
+        description="The schema name.",
+        example="ORDERS_PII_V2",
+    )
+
+
+class DatabricksServerObject(ServerObject):
+    """
+    Represents a Databricks catalog.
+    """
+
+    type: Literal["databricks"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'databricks'.", example="databricks"
+    )
+    host: Optional[str] = Field(
+        None,
+        description="The Databricks host.",
+        example="dbc-abcdefgh-1234.cloud.databricks.com",
+    )
     catalog: Optional[str] = Field(
         None,
         description="The name of the Hive or Unity catalog.",
         example="my_catalog",
     )
+    schema_name: Optional[str] = Field(
+        None,
+        description="The schema name in the catalog.",
+        example="orders",
+    )
 
-    # Fields for Postgres Server Object
-    # Note: 'host', 'port', 'database', and 'schema' fields are reused from previous objects
 
-    # Fields for Oracle Server Object
+class PostgresServerObject(ServerObject):
+    """
+    Represents a PostgreSQL database.
+    """
+
+    type: Literal["postgres"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'postgres'.", example="postgres"
+    )
+    host: Optional[str] = Field(
+        None,
+        description="The host of the database server.",
+        example="localhost",
+    )
+    port: Optional[int] = Field(
+        None,
+        description="The port of the database server.",
+        example=5432,
+    )
+    database: Optional[str] = Field(
+        None,
+        description="The database name.",
+        example="orders_db",
+    )
+    schema_name: Optional[str] = Field(
+        None,
+        description="The schema name.",
+        example="public",
+    )
+
+
+class OracleServerObject(ServerObject):
+    """
+    Represents an Oracle database.
+    """
+
+    type: Literal["oracle"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'oracle'.", example="oracle"
+    )
+    host: Optional[str] = Field(
+        None,
+        description="The host of the database server.",
+        example="localhost",
+    )
+    port: Optional[int] = Field(
+        None,
+        description="The port of the database server.",
+        example=1521,
+    )
     service_name: Optional[str] = Field(
         None,
         description="The name of the Oracle service.",
         example="ORCL",
     )
 
-    # Fields for Kafka Server Object
+
+class KafkaServerObject(ServerObject):
+    """
+    Represents a Kafka topic.
+    """
+
+    type: Literal["kafka"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'kafka'.", example="kafka"
+    )
+    host: Optional[str] = Field(
+        None,
+        description="The bootstrap server of the Kafka cluster.",
+        example="pkc-abcde.eu-central-1.aws.confluent.cloud:9092",
+    )
     topic: Optional[str] = Field(
         None,
         description="The Kafka topic name.",
         example="orders_topic",
     )
+    format: Optional[str] = Field(
+        None,
+        description="Format of the messages, such as json or avro",
+        example="json",
+    )
+
+
+class PubSubServerObject(ServerObject):
+    """
+    Represents a Google Pub/Sub topic.
+    """
+
+    type: Literal["pubsub"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'pubsub'.", example="pubsub"
+    )
+    project: Optional[str] = Field(
+        None,
+        description="The GCP project name.",
+        example="my-gcp-project",
+    )
+    topic: Optional[str] = Field(
+        None,
+        description="The Pub/Sub topic name.",
+        example="orders_topic",
+    )
 
-    # Fields for Pub/Sub Server Object
-    # Note: 'project' and 'topic' fields are reused from previous objects
 
-    # Fields for sftp Server Object
-    # Note: 'location', 'format', and 'delimiter' fields are reused from S3 Server Object
+class SftpServerObject(ServerObject):
+    """
+    Represents files on an SFTP server.
+    """
 
-    # Fields for AWS Kinesis Data Streams Server Object
+    type: Literal["sftp"] = Field(..., description="REQUIRED. The type of the server, always 'sftp'.", example="sftp")
+    location: Optional[str] = Field(
+        None,
+        description="SFTP URL, starting with sftp://",
+        example="sftp://123.123.12.123/{model}/*.json",
+    )
+    format: Optional[str] = Field(
+        None,
+        description="Format of files, such as parquet, delta, json, csv",
+        example="csv",
+    )
+    delimiter: Optional[str] = Field(
+        None,
+        description="(Only for format = json) How multiple json documents are delimited within one file",
+        example="new_line",
+    )
+
+
+class KinesisServerObject(ServerObject):
+    """
+    Represents an AWS Kinesis data stream.
+    """
+
+    type: Literal["kinesis"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'kinesis'.", example="kinesis"
+    )
     stream: Optional[str] = Field(
         None,
         description="The name of the Kinesis data stream.",
@@ -154,13 +378,109 @@ class ServerObject(BaseModelWithExample):
         description="AWS region, e.g., eu-west-1.",
         example="eu-west-1",
     )
+    format: Optional[str] = Field(
+        None,
+        description="Format of the records, such as json or avro",
+        example="json",
+    )
 
-    # Fields for Trino Server Object
-    # Note: 'host', 'port', 'catalog', and 'schema' fields are reused from previous objects
 
-    # Fields for Local Server Object
+class TrinoServerObject(ServerObject):
+    """
+    Represents a Trino catalog.
+    """
+
+    type: Literal["trino"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'trino'.", example="trino"
+    )
+    host: Optional[str] = Field(
+        None,
+        description="The host of the Trino server.",
+        example="localhost",
+    )
+    port: Optional[int] = Field(
+        None,
+        description="The port of the Trino server.",
+        example=8080,
+    )
+    catalog: Optional[str] = Field(
+        None,
+        description="The name of the catalog.",
+        example="hive",
+    )
+    schema_name: Optional[str] = Field(
+        None,
+        description="The schema name in the catalog.",
+        example="orders",
+    )
+
+
+class LocalServerObject(ServerObject):
+    """
+    Represents local files.
+    """
+
+    type: Literal["local"] = Field(
+        ..., description="REQUIRED. The type of the server, always 'local'.", example="local"
+    )
     path: Optional[str] = Field(
         None,
         description="The relative or absolute path to the data file(s).",
         example="/data/orders/*.json",
     )
+    format: Optional[str] = Field(
+        None,
+        description="Format of files, such as parquet, delta, json, csv",
+        example="json",
+    )
+
+
+# Models of the known server types, keyed by type
+SERVER_OBJECTS: Dict[str, Type[ServerObject]] = {
+    "s3": S3ServerObject,
+    "bigquery": BigQueryServerObject,
+    "redshift": RedshiftServerObject,
+    "azure": AzureServerObject,
+    "sqlserver": SqlServerServerObject,
+    "snowflake": SnowflakeServerObject,
+    "databricks": DatabricksServerObject,
+    "postgres": PostgresServerObject,
+    "oracle": OracleServerObject,
+    "kafka": KafkaServerObject,
+    "pubsub": PubSubServerObject,
+    "sftp": SftpServerObject,
+    "kinesis": KinesisServerObject,
+    "trino": TrinoServerObject,
+    "local": LocalServerObject,
+}
+
+
+class OtherServerObject(ServerObject):
+    """
+    Represents a server of a type without a model of its own, keeping all its fields.
+    """
+
+    @field_validator("type")
+    @classmethod
+    def check_type(cls, value: str) -> str:
+        """
+        Rejects the known server types, so that an invalid server of a known type is not accepted as another one.
+
+        :param str value: The type of the server.
+        :return str: The type of the server.
+        :raises ValueError: If the type has a model of its own.
+        """
+        if value in SERVER_OBJECTS:
+            raise ValueError(f"servers of type '{value}' must be valid {SERVER_OBJECTS[value].__name__} objects")
+        return value
+
+
+# A server of any type. The known types are validated straight by the model of their type, looked up from the
+# "type" key by pydantic-core rather than by trying every model in turn, and the other types by OtherServerObject
+Server = Annotated[
+    Union[
+        Annotated[Union[tuple(SERVER_OBJECTS.values())], Field(discriminator="type")],
+        OtherServerObject,
+    ],
+    Field(union_mode="left_to_right"),
+]
@@ -0,0 +1,40 @@
+from typing import List
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractBatchDelete(BaseModelWithExample):
+    """
+    Represents the input model for deleting many data contracts by their IDs.
+    """
+
+    ids: List[str] = Field(
+        ...,
+        min_length=1,
+        example=["urn:datacontract:checkout:orders-latest", "urn:datacontract:checkout:payments"],
+        description="The unique identifiers of the data contracts to delete.",
+    )
+
+
+class DataContractBatchDeleteResponse(BaseModelWithExample):
+    """
+    Represents the response for a batch data contract deletion.
+    """
+
+    message: str = Field(
+        ...,
+        example=" ✅ 1 data contracts deleted, 1 missing",
+        description="A message summarizing the outcome of the batch deletion.",
+    )
+    deleted: List[str] = Field(
+        ...,
+        example=["urn:datacontract:checkout:orders-latest"],
+        description="The IDs of the deleted data contracts, in the request order.",
+    )
+    missing: List[str] = Field(
+        ...,
+        example=["urn:datacontract:checkout:payments"],
+        description="The requested IDs that do not match any data contract.",
+    )
@@ -0,0 +1,43 @@
+from typing import List
+
+from pydantic import ConfigDict, Field
+
+from ....utils.example_model import BaseModelWithExample
+from ..objects.data_contract import DataContract
+
+
+class DataContractBatchGet(BaseModelWithExample):
+    """
+    Represents the input model for retrieving many data contracts by their IDs.
+    """
+
+    ids: List[str] = Field(
+        ...,
+        min_length=1,
+        example=["urn:datacontract:checkout:orders-latest", "urn:datacontract:checkout:payments"],
+        description="The unique identifiers of the data contracts to retrieve.",
+    )
+
+
+class DataContractBatchGetResponse(BaseModelWithExample):
+    """
+    Represents the response for a batch data contract retrieval.
+    """
+
+    message: str = Field(
+        ...,
+        example=" ✅ 1 data contracts retrieved, 1 missing",
+        description="A message summarizing the outcome of the batch retrieval.",
+    )
+    data: List[DataContract] = Field(
+        ...,
+        example=[DataContract.get_example()],
+        description="The retrieved data contracts, in the request order.",
+    )
+    missing: List[str] = Field(
+        ...,
+        example=["urn:datacontract:checkout:payments"],
+        description="The requested IDs that do not match any data contract.",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -0,0 +1,59 @@
+from typing import List, Optional
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractBulkCreateResult(BaseModelWithExample):
+    """
+    Represents the outcome of the creation of one data contract of a bulk request.
+    """
+
+    index: int = Field(
+        ...,
+        example=0,
+        description="The position of the data contract in the request body.",
+    )
+    id: Optional[str] = Field(
+        None,
+        example="urn:datacontract:checkout:orders-latest",
+        description="The ID of the data contract, if it could be read from the request.",
+    )
+    success: bool = Field(
+        ...,
+        example=True,
+        description="Whether the data contract was created.",
+    )
+    error: Optional[str] = Field(
+        None,
+        example=None,
+        description="The reason why the data contract was not created, if it failed.",
+    )
+
+
+class DataContractBulkCreateResponse(BaseModelWithExample):
+    """
+    Represents the response for a bulk data contract creation.
+    """
+
+    message: str = Field(
+        ...,
+        example=" ✅ 1 data contracts created, 0 failed",
+        description="A message summarizing the outcome of the bulk creation.",
+    )
+    created: int = Field(
+        ...,
+        example=1,
+        description="The number of data contracts created.",
+    )
+    failed: int = Field(
+        ...,
+        example=0,
+        description="The number of data contracts that could not be created.",
+    )
+    data: List[DataContractBulkCreateResult] = Field(
+        ...,
+        example=[DataContractBulkCreateResult.get_example()],
+        description="The outcome of each data contract of the request, in the request order.",
+    )
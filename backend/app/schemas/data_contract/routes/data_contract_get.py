@@ -2,6 +2,7 @@ from pydantic import ConfigDict, Field
 
 from ....utils.example_model import BaseModelWithExample
 from ..objects.data_contract import DataContract
+from ..objects.data_contract_summary import DataContractSummary
 
 
 class DataContractGetResponse(BaseModelWithExample):
@@ -21,3 +22,20 @@ class DataContractGetResponse(BaseModelWithExample):
     )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class DataContractSummaryGetResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract retrieval restricted to some fields.
+    """
+
+    message: str = Field(
+        ...,
+        example=" ✅ Data contract retrieved successfully",
+        description="A success message indicating the data contract was retrieved.",
+    )
+    data: DataContractSummary = Field(
+        ...,
+        example=DataContractSummary.get_example(),
+        description="The retrieved data contract summary.",
+    )
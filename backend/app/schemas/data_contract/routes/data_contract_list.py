@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import ConfigDict, Field
 
 from ....utils.example_model import BaseModelWithExample
 from ..objects.data_contract import DataContract
+from ..objects.data_contract_summary import DataContractSummary
 
 
 class DataContractListResponse(BaseModelWithExample):
@@ -21,5 +22,32 @@ class DataContractListResponse(BaseModelWithExample):
         example=DataContract.get_example(),
         description="The list of retrieved data contracts.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        example="dXJuOmRhdGFjb250cmFjdDpjaGVja291dDpvcmRlcnMtbGF0ZXN0",
+        description="The cursor to pass to retrieve the next page, or null if this is the last page.",
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class DataContractSummaryListResponse(BaseModelWithExample):
+    """
+    Represents the response for a successful data contract list retrieval restricted to some fields.
+    """
+
+    message: str = Field(
+        ...,
+        example=" ✅ Data contracts retrieved successfully",
+        description="A success message indicating the data contracts were retrieved.",
+    )
+    data: List[DataContractSummary] = Field(
+        ...,
+        example=[DataContractSummary.get_example()],
+        description="The list of retrieved data contract summaries.",
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        example="dXJuOmRhdGFjb250cmFjdDpjaGVja291dDpvcmRlcnMtbGF0ZXN0",
+        description="The cursor to pass to retrieve the next page, or null if this is the last page.",
+    )
@@ -0,0 +1,39 @@
+from typing import List
+
+from pydantic import Field
+
+from ....utils.example_model import BaseModelWithExample
+
+
+class DataContractTagCount(BaseModelWithExample):
+    """
+    Represents a tag and the number of data contracts carrying it.
+    """
+
+    tag: str = Field(
+        ...,
+        example="orders",
+        description="The tag.",
+    )
+    count: int = Field(
+        ...,
+        example=12,
+        description="The number of data contracts carrying the tag.",
+    )
+
+
+class DataContractTagsResponse(BaseModelWithExample):
+    """
+    Represents the response for the tag cardinality of the data contracts.
+    """
+
+    message: str = Field(
+        ...,
+        example=" ✅ Data contract tags retrieved successfully",
+        description="A message indicating the tags were retrieved.",
+    )
+    data: List[DataContractTagCount] = Field(
+        ...,
+        example=[{"tag": "orders", "count": 12}, {"tag": "checkout", "count": 7}],
+        description="The tags of the data contracts with their number of data contracts, most used first.",
+    )
@@ -0,0 +1,130 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .config import settings
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache whose entries expire ``ttl`` seconds after they were stored.
+
+    The cache is bounded by the total size of its values. Writers call ``invalidate`` once their change is
+    committed, and readers filling the cache pass the ``generation`` they read before loading the value, so that
+    a value loaded before a concurrent invalidation is not stored after it.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, sizeof: Callable[[Any], int] = len):
+        """
+        :param int max_bytes: The maximum total size of the cached values, in bytes. 0 disables the cache.
+        :param float ttl: The number of seconds after which an entry expires.
+        :param Callable[[Any], int] sizeof: Returns the size of a value, in bytes.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value of a key, if it is cached and has not expired.
+
+        :param Hashable key: The key.
+        :return Optional[Any]: The cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Stores a value, evicting the least recently used entries to stay within ``max_bytes``.
+
+        :param Hashable key: The key.
+        :param Any value: The value.
+        :param int generation: The ``generation`` of the cache before the value was loaded. The value is not stored
+            if an invalidation happened since, as it may predate it.
+        """
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Removes the entries of the given keys, and discards the values being loaded concurrently.
+
+        :param Hashable keys: The keys whose values changed.
+        """
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets its statistics.
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self.size = self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the statistics of the cache.
+
+        :return Dict[str, int]: The number of entries, their total size, the size bound, and the hit, miss,
+            eviction and expiration counters.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+
+# Compact JSON documents of the data contracts, keyed by the content hash of their stored document. As a document
+# has a single compact form, the entries never go stale and are only evicted by size
+compact_document_cache = LRUCache(settings.COMPACT_DOCUMENT_CACHE_MAX_BYTES, float("inf"))
+
+# Stored JSON documents of the data contracts and their content hashes, keyed by ID. Each worker process has its
+# own cache, and only sees the writes of the other processes once its entries expire
+data_contract_cache = LRUCache(
+    settings.DATA_CONTRACT_CACHE_MAX_BYTES, settings.DATA_CONTRACT_CACHE_TTL, sizeof=lambda entry: len(entry[0])
+)
@@ -0,0 +1,262 @@
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+from .tools import encoded_etag, etag_header
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional extra
+    brotli = None
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Picks the content encoding of a response from the Accept-Encoding header of its request.
+
+    Brotli is preferred when the "brotli" extra is installed, gzip is used otherwise. The codings whose quality
+    value is 0 (or cannot be parsed) are rejected.
+
+    :param str accept_encoding: The value of the Accept-Encoding header.
+    :return Optional[str]: "br", "gzip", or None if the client accepts neither.
+    """
+    accepted = set()
+    for coding in accept_encoding.split(","):
+        name, *parameters = coding.split(";")
+        quality = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """
+    Compresses a whole response body.
+
+    :param bytes body: The response body.
+    :param str encoding: The content encoding, as returned by ``negotiate_encoding``.
+    :return bytes: The compressed body.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.GZIP_LEVEL)
+
+
+def make_compressor(encoding: str) -> Callable[[bytes, bool], bytes]:
+    """
+    Creates a streaming compressor, compressing a response body chunk by chunk.
+
+    :param str encoding: The content encoding, as returned by ``negotiate_encoding``.
+    :return Callable[[bytes, bool], bytes]: Compresses the next chunk of the body, given whether more chunks
+        follow. The compressed bytes of each chunk are flushed, so that streamed responses are not held back.
+    """
+    if encoding == "br":
+        brotli_compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+
+        def compress_brotli(body: bytes, more_body: bool) -> bytes:
+            compressed = brotli_compressor.process(body)
+            return compressed + (brotli_compressor.flush() if more_body else brotli_compressor.finish())
+
+        return compress_brotli
+
+    # A window of 16 + 15 bits writes the gzip header and trailer around the deflate stream
+    gzip_compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress_gzip(body: bytes, more_body: bool) -> bytes:
+        return gzip_compressor.compress(body) + gzip_compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+
+    return compress_gzip
+
+
+class CompressionResponder:
+    """
+    Compresses the response of an ASGI application, including streamed ones.
+
+    It works on the ASGI messages directly rather than extending Starlette's responders, whose API changed across
+    Starlette versions.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, encoding: str) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoding = encoding
+        self.compress = make_compressor(encoding)
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        """
+        Holds the start of the response until its first body chunk tells whether to compress it, then compresses
+        every chunk of the body.
+
+        Small responses sent in one chunk, and responses that already carry a Content-Encoding, are sent as is. The
+        strong ETags of the compressed responses get the content encoding as a suffix.
+
+        :param Message message: The ASGI message sent by the application.
+        """
+        if message["type"] == "http.response.start":
+            self.initial_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            self.passthrough = self.passthrough or (not more_body and len(body) < self.minimum_size)
+            if not self.passthrough:
+                body = self.compress(body, more_body)
+                headers = MutableHeaders(raw=self.initial_message["headers"])
+                headers["Content-Encoding"] = self.encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["ETag"], self.encoding)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+            await self.send(self.initial_message)
+        elif not self.passthrough:
+            body = self.compress(body, more_body)
+        await self.send({**message, "body": body})
+
+
+class CompressionMiddleware:
+    """
+    Compresses the responses larger than ``minimum_size`` bytes with brotli or gzip, as accepted by the client.
+
+    Responses that already carry a Content-Encoding, such as the precompressed data contracts, are sent as is.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await CompressionResponder(self.app, self.minimum_size, encoding)(scope, receive, send)
+
+
+class PrecompressedCache:
+    """
+    Thread-safe LRU cache of compressed response bodies, keyed by the content hash (or ETag) of the body and the
+    encoding.
+
+    The cache is bounded by the total size of the compressed bodies it holds.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        :param int max_bytes: The maximum total size of the cached bodies, in bytes.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compress(self, body: bytes, encoding: str, content_key: Optional[str] = None) -> bytes:
+        """
+        Returns the compressed body, compressing it only if the same content was not compressed recently.
+
+        :param bytes body: The response body.
+        :param str encoding: The content encoding.
+        :param Optional[str] content_key: A key identifying the exact body, such as its ETag. The SHA-256 of the
+            body is computed when it is not given.
+        :return bytes: The compressed body.
+        """
+        key = (content_key or hashlib.sha256(body).hexdigest(), encoding)
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compressed
+            self.misses += 1
+
+        compressed = compress_body(body, encoding)
+        if len(compressed) > self.max_bytes:
+            return compressed
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = compressed
+                self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+        return compressed
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets its statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = self.hits = self.misses = 0
+
+
+precompressed_cache = PrecompressedCache(settings.PRECOMPRESSED_CACHE_MAX_BYTES)
+
+
+def json_response(request: Request, content: bytes, etag: Optional[str] = None) -> Response:
+    """
+    Builds a JSON response whose compressed body is served from ``precompressed_cache``.
+
+    Bodies smaller than ``settings.RESPONSE_COMPRESSION_MIN_SIZE``, or requested by clients that accept no
+    supported encoding, are sent uncompressed.
+
+    :param Request request: The request being answered.
+    :param bytes content: The JSON response body.
+    :param Optional[str] etag: The ETag of the response, if any. It is used as the cache key of the body, and sent
+        with the content encoding as a suffix when the body is compressed.
+    :return Response: The response.
+    """
+    headers = {"ETag": etag} if etag is not None else {}
+    if not settings.RESPONSE_COMPRESSION or len(content) < settings.RESPONSE_COMPRESSION_MIN_SIZE:
+        return Response(content=content, media_type="application/json", headers=headers)
+    headers["Vary"] = "Accept-Encoding"
+    encoding = negotiate_encoding(request.headers.get("Accept-Encoding", ""))
+    if encoding is None:
+        return Response(content=content, media_type="application/json", headers=headers)
+    return Response(
+        content=precompressed_cache.get_or_compress(content, encoding, content_key=etag),
+        media_type="application/json",
+        headers={**headers, **etag_header(etag and encoded_etag(etag, encoding)), "Content-Encoding": encoding},
+    )
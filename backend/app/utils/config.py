@@ -26,11 +26,59 @@ class Settings:
         self.AUTHENTIK_CLIENT_SECRET: Final[str] = self._get_required_env("AUTHENTIK_CLIENT_SECRET")
         self.SECRET_KEY: Final[str] = self._get_required_env("SECRET_KEY")
 
+        # Optional environment variables
+        self.DATABASE_ASYNC: Final[bool] = self._get_bool_env("DATABASE_ASYNC", False)
+        self.FAST_JSON: Final[bool] = self._get_bool_env("FAST_JSON", False)
+        self.DB_POOL_SIZE: Final[int] = int(self._get_optional_env("DB_POOL_SIZE", "5"))
+        self.DB_MAX_OVERFLOW: Final[int] = int(self._get_optional_env("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT: Final[int] = int(self._get_optional_env("DB_POOL_TIMEOUT", "30"))
+        self.SQLITE_JOURNAL_MODE: Final[str] = self._get_optional_env("SQLITE_JOURNAL_MODE", "WAL")
+        self.SQLITE_SYNCHRONOUS: Final[str] = self._get_optional_env("SQLITE_SYNCHRONOUS", "NORMAL")
+        self.SQLITE_BUSY_TIMEOUT_MS: Final[int] = int(self._get_optional_env("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+        self.SQLITE_MMAP_SIZE: Final[int] = int(self._get_optional_env("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+        # Negative values are expressed in KiB rather than in pages
+        self.SQLITE_CACHE_SIZE: Final[int] = int(self._get_optional_env("SQLITE_CACHE_SIZE", str(-64 * 1024)))
+        self.SQLITE_TEMP_STORE: Final[str] = self._get_optional_env("SQLITE_TEMP_STORE", "MEMORY")
+        self.COMPRESSION_THRESHOLD: Final[int] = int(self._get_optional_env("COMPRESSION_THRESHOLD", "1024"))
+        self.COMPRESSION_LEVEL: Final[int] = int(self._get_optional_env("COMPRESSION_LEVEL", "6"))
+        self.RESPONSE_COMPRESSION: Final[bool] = self._get_bool_env("RESPONSE_COMPRESSION", True)
+        self.RESPONSE_COMPRESSION_MIN_SIZE: Final[int] = int(
+            self._get_optional_env("RESPONSE_COMPRESSION_MIN_SIZE", "1024")
+        )
+        self.GZIP_LEVEL: Final[int] = int(self._get_optional_env("GZIP_LEVEL", "6"))
+        self.BROTLI_QUALITY: Final[int] = int(self._get_optional_env("BROTLI_QUALITY", "5"))
+        self.PRECOMPRESSED_CACHE_MAX_BYTES: Final[int] = int(
+            self._get_optional_env("PRECOMPRESSED_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+        )
+        self.DATA_CONTRACT_CACHE_MAX_BYTES: Final[int] = int(
+            self._get_optional_env("DATA_CONTRACT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+        )
+        self.DATA_CONTRACT_CACHE_TTL: Final[float] = float(self._get_optional_env("DATA_CONTRACT_CACHE_TTL", "30"))
+        self.COMPACT_DOCUMENT_CACHE_MAX_BYTES: Final[int] = int(
+            self._get_optional_env("COMPACT_DOCUMENT_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+        )
+        self.REDIS_URL: Final[str] = self._get_optional_env("REDIS_URL", "")
+        self.SHARED_CACHE_TTL: Final[float] = float(self._get_optional_env("SHARED_CACHE_TTL", "300"))
+        self.SHARED_CACHE_LOCK_TIMEOUT: Final[float] = float(self._get_optional_env("SHARED_CACHE_LOCK_TIMEOUT", "5"))
+        self.STATIC_REGISTRY: Final[bool] = self._get_bool_env("STATIC_REGISTRY", True)
+        self.OPENAPI_CACHE_DIR: Final[str] = self._get_optional_env("OPENAPI_CACHE_DIR", "")
+        self.OPENAPI_EAGER: Final[bool] = self._get_bool_env("OPENAPI_EAGER", False)
+        self.GROUP_COMMIT: Final[bool] = self._get_bool_env("GROUP_COMMIT", False)
+        self.GROUP_COMMIT_WINDOW_MS: Final[float] = float(self._get_optional_env("GROUP_COMMIT_WINDOW_MS", "2"))
+        self.GROUP_COMMIT_MAX_BATCH: Final[int] = int(self._get_optional_env("GROUP_COMMIT_MAX_BATCH", "64"))
+
         # Hardcoded constants
         self.ALLOWED_ORIGINS: List[str] = ["*"]
         self.LOG_LEVEL: Final[str] = "INFO"
         self.ALGORITHM: Final[str] = "HS256"
         self.AUTHENTIK_URL: Final[str] = f"http://{self.AUTHENTIK_HOST}:{self.AUTHENTIK_PORT}"
+        self.DEFAULT_PAGE_SIZE: Final[int] = 100
+        self.MAX_PAGE_SIZE: Final[int] = 1000
+        self.EXPORT_BATCH_SIZE: Final[int] = 500
+        self.BULK_CHUNK_SIZE: Final[int] = 500
+        self.MAX_BULK_SIZE: Final[int] = 10000
+        self.IN_CLAUSE_CHUNK_SIZE: Final[int] = 500
+        self.WRITE_CONFLICT_RETRIES: Final[int] = 3
 
     def _get_required_env(self, key: str) -> str:
         """
@@ -45,5 +93,25 @@ class Settings:
             raise ValueError(f" ❌ Required environment variable {key} is not set")
         return value
 
+    def _get_optional_env(self, key: str, default: str) -> str:
+        """
+        Get an optional environment variable.
+
+        :param str key: The environment variable key
+        :param str default: The value to use if the environment variable is not set
+        :return str: The environment variable value, or the default value
+        """
+        return getenv(key, default)
+
+    def _get_bool_env(self, key: str, default: bool) -> bool:
+        """
+        Get an optional boolean environment variable.
+
+        :param str key: The environment variable key
+        :param bool default: The value to use if the environment variable is not set
+        :return bool: True if the environment variable is set to "1", "true" or "yes" (case-insensitive)
+        """
+        return self._get_optional_env(key, str(default)).strip().lower() in ("1", "true", "yes")
+
 
 settings = Settings()
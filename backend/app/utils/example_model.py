@@ -1,12 +1,87 @@
-from typing import Any, Dict
+import copy
+from typing import Any, Dict, NoReturn
 
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+
+class FrozenDict(dict):
+    """
+    Read-only dictionary, shared by everything that reads an example.
+
+    Being a ``dict``, it is serialized and validated as one. ``copy.deepcopy`` returns a mutable copy made of plain
+    dictionaries and lists, to build a payload from an example.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Examples are shared and read-only, use copy.deepcopy to modify one")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self) -> int:
+        try:
+            return hash(tuple(self.items()))
+        except TypeError:
+            # A value freeze() cannot make hashable, such as a set: hash it by identity instead
+            return id(self)
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Converts a value to a deeply read-only one, made of JSON-compatible values as in the OpenAPI schema.
+
+    :param Any value: The value, such as a dictionary, a list or a model instance.
+    :return Any: The same value, with its dictionaries as FrozenDict, its lists as tuples, and its models and other
+        objects as their JSON representation. The values already frozen, such as the examples of other models, are
+        shared rather than copied.
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, BaseModel):
+        return freeze(value.model_dump(mode="json", by_alias=True))
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return to_jsonable_python(value)
+
+
+# Examples of the models, built on the first call to their get_example and shared afterwards
+_examples: Dict[type, FrozenDict] = {}
 
 
 class BaseModelWithExample(BaseModel):
 
     @classmethod
     def get_example(cls) -> Dict[str, Any]:
+        """
+        Return the example data of the model, built once and shared by all the schemas and routes using it.
+
+        The example is converted to JSON-compatible values, as in the OpenAPI schema, and deeply read-only: use
+        ``copy.deepcopy`` to get a copy that can be modified. The nested models are dumped by alias, so they are read
+        as dictionaries rather than through attributes: use ``cls.model_validate(cls.get_example())`` to get a model
+        instance.
+
+        :return Dict[str, Any]: A FrozenDict of the example data, keyed by field name, with its nested dictionaries as
+            FrozenDict, its lists as tuples and its models as their JSON representation.
+        """
+        example = _examples.get(cls)
+        if example is None:
+            example = _examples[cls] = freeze(cls.build_example())
+        return example
+
+    @classmethod
+    def build_example(cls) -> Dict[str, Any]:
         """
         Create a dictionary with example data for all fields in the model.
 
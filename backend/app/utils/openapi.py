@@ -0,0 +1,77 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from importlib.metadata import version
+from typing import Any, Dict
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_source_hash() -> str:
+    """
+    Hashes the source code of the application and the versions of the libraries generating its OpenAPI schema, so
+    that a schema cached by a previous build is only reused by the same code.
+
+    :return str: The hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for package in ("fastapi", "pydantic"):
+        digest.update(f"{package}=={version(package)}\n".encode())
+    for root, dirs, files in os.walk(APP_DIR):
+        dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+        for filename in sorted(files):
+            if filename.endswith(".py"):
+                path = os.path.join(root, filename)
+                digest.update(os.path.relpath(path, APP_DIR).encode() + b"\0")
+                with open(path, "rb") as file:
+                    digest.update(file.read() + b"\0")
+    return digest.hexdigest()
+
+
+def get_openapi_cache_path(cache_dir: str) -> str:
+    """
+    Returns the path of the cached OpenAPI schema of the current source code.
+
+    :param str cache_dir: The directory of the cached schemas.
+    :return str: The path of the cached schema, which may not exist yet.
+    """
+    return os.path.join(cache_dir, f"openapi-{get_source_hash()[:16]}.json")
+
+
+def load_or_build_openapi(app: FastAPI, cache_dir: str) -> Dict[str, Any]:
+    """
+    Sets the OpenAPI schema of an application, from the schema cached for its source code if there is one, or else
+    by generating it and caching it for the next processes.
+
+    FastAPI generates the schema on the first request to the documentation, which walks every route and model. Once
+    set, ``app.openapi()`` returns it without generating it again.
+
+    :param FastAPI app: The application, with all its routes included.
+    :param str cache_dir: The directory of the cached schemas, created if needed.
+    :return Dict[str, Any]: The OpenAPI schema.
+    """
+    path = get_openapi_cache_path(cache_dir)
+    try:
+        with open(path, "rb") as file:
+            app.openapi_schema = json.loads(file.read())
+        logger.info(f" ✅ OpenAPI schema loaded from {path}")
+        return app.openapi_schema
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        logger.warning(f" ⚠️ Ignoring the invalid cached OpenAPI schema {path}: {e}")
+
+    schema = app.openapi()
+    os.makedirs(cache_dir, exist_ok=True)
+    # Written to a temporary file first, so that the workers starting concurrently never read a partial schema
+    with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as file:
+        json.dump(schema, file, separators=(",", ":"))
+    os.replace(file.name, path)
+    logger.info(f" ✅ OpenAPI schema cached to {path}")
+    return schema
@@ -0,0 +1,377 @@
+import asyncio
+import inspect
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional, Sequence, Tuple, TypeVar, Union
+
+from .cache import LRUCache
+from .config import settings
+
+# Imported by SharedCache.setup, as the client takes tens of milliseconds to import and most deployments do not set
+# REDIS_URL
+redis = None
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+T = TypeVar("T")
+
+# Prefix of every key, to be bumped when the format of the cached values changes
+KEY_PREFIX = "mycelium:v1:"
+# Channel on which the IDs of the written data contracts are published, so that each worker drops them from its
+# in-process cache
+INVALIDATION_CHANNEL = f"{KEY_PREFIX}data_contract:invalidated"
+# Interval at which the requests waiting for another one to load a value look for it again, in seconds
+LOCK_POLL_INTERVAL = 0.02
+# Length of a content hash, which prefixes the cached documents
+CONTENT_HASH_LENGTH = 64
+
+
+def _encode_entry(entry: Optional[Tuple[str, Optional[str]]]) -> Optional[bytes]:
+    """
+    Encodes a stored document and its content hash as a single value, or returns None if it is not to be cached.
+    """
+    if entry is None or entry[1] is None:
+        return None
+    document, content_hash = entry
+    return (content_hash + document).encode("utf-8")
+
+
+def _decode_entry(data: bytes) -> Tuple[str, str]:
+    """
+    Decodes a value encoded by ``_encode_entry``.
+    """
+    value = data.decode("utf-8")
+    return value[CONTENT_HASH_LENGTH:], value[:CONTENT_HASH_LENGTH]
+
+
+class SharedCache:
+    """
+    Cache shared by the worker processes and the replicas of the application, on a Redis server.
+
+    Data contracts are cached under keys holding their version, a counter incremented by every write through
+    ``invalidate``. A document loaded before a write is thus stored under a key that is no longer read, instead of
+    overwriting the invalidation. The versions never expire: a counter starting over would read the values still
+    cached under its previous versions again. List pages are cached under their ETag, which changes with their
+    content, so they never need to be invalidated. When a value is missing, a single request loads it from the
+    database while the others wait for it, so that a popular key expiring does not send a burst of identical queries
+    to the database.
+
+    The cache is disabled until ``setup`` is called, and every method then falls back to loading the value. Redis
+    errors are logged and fall back to the database too.
+    """
+
+    def __init__(self):
+        self.client: Optional[Any] = None
+        self.async_client: Optional[Any] = None
+        self.ttl = settings.SHARED_CACHE_TTL
+        self.lock_timeout = settings.SHARED_CACHE_LOCK_TIMEOUT
+        self.listener: Optional[Any] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
+    def setup(
+        self, url: Optional[str] = None, client: Optional[Any] = None, async_client: Optional[Any] = None
+    ) -> None:
+        """
+        Connects the cache to a Redis server.
+
+        :param Optional[str] url: The URL of the Redis server, such as "redis://localhost:6379/0".
+        :param Optional[Any] client: A Redis client to use instead of connecting to ``url``.
+        :param Optional[Any] async_client: An asyncio Redis client to use instead of connecting to ``url``.
+        :raises RuntimeError: If the "redis" extra is not installed.
+        """
+        global redis
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError as e:  # pragma: no cover - redis is an optional extra
+            raise RuntimeError('The shared cache requires the "redis" extra') from e
+        self.close()
+        self.client = client if client is not None else redis.Redis.from_url(url)
+        self.async_client = async_client if async_client is not None else redis.asyncio.Redis.from_url(url)
+
+    def listen(self, local_cache: LRUCache) -> None:
+        """
+        Drops the data contracts written by any worker from the in-process cache of this worker, in a background
+        thread.
+
+        :param LRUCache local_cache: The in-process cache of the data contracts.
+        """
+
+        def drop(message: dict) -> None:
+            local_cache.invalidate(*json.loads(message["data"]))
+
+        def report(error: Exception, pubsub: Any, thread: Any) -> None:
+            logger.error(f" ❌ Shared cache invalidation listener stopped: {str(error)}")
+            thread.stop()
+
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{INVALIDATION_CHANNEL: drop})
+        self.listener = pubsub.run_in_thread(sleep_time=1, daemon=True, exception_handler=report)
+
+    def close(self) -> None:
+        """
+        Stops the invalidation listener and disables the cache.
+        """
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        self.client = self.async_client = None
+
+    def get_or_load(
+        self, key: str, load: Callable[[], T], encode: Callable[[T], Optional[bytes]], decode: Callable[[bytes], T]
+    ) -> T:
+        """
+        Returns the cached value of a key, loading and storing it if it is missing.
+
+        Only one caller loads a missing value at a time: the others wait for it, up to ``lock_timeout`` seconds,
+        sleeping in between. It must therefore not be called from the event loop: use ``aget_or_load`` there, or run
+        the caller in a thread pool.
+
+        :param str key: The key of the value.
+        :param Callable[[], T] load: Loads the value.
+        :param Callable[[T], Optional[bytes]] encode: Encodes the value, or returns None if it is not to be cached.
+        :param Callable[[bytes], T] decode: Decodes a cached value.
+        :return T: The value.
+        """
+        if self.client is None:
+            return load()
+        lock_key, token = f"{key}:lock", uuid.uuid4().hex
+        try:
+            data = self.client.get(key)
+            deadline = time.monotonic() + self.lock_timeout
+            while data is None and not self.client.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)):
+                if time.monotonic() >= deadline:
+                    logger.warning(f" ⚠️ Timed out waiting for {key} to be loaded")
+                    return load()
+                time.sleep(LOCK_POLL_INTERVAL)
+                data = self.client.get(key)
+            if data is not None:
+                return decode(data)
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Shared cache unavailable, reading from the database: {str(e)}")
+            return load()
+
+        try:
+            value = load()
+            data = encode(value)
+            if data is not None:
+                self.client.set(key, data, px=int(self.ttl * 1000))
+            return value
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Failed to store {key} in the shared cache: {str(e)}")
+            return value
+        finally:
+            try:
+                if self.client.get(lock_key) == token.encode():
+                    self.client.delete(lock_key)
+            except redis.RedisError:
+                pass
+
+    async def aget_or_load(
+        self,
+        key: Optional[str],
+        load: Callable[[], Union[T, Awaitable[T]]],
+        encode: Callable[[T], Optional[bytes]],
+        decode: Callable[[bytes], T],
+    ) -> T:
+        """
+        Returns the cached value of a key, loading and storing it if it is missing, without blocking the event loop.
+
+        :param Optional[str] key: The key of the value, or None to load it without caching it.
+        :param Callable[[], Union[T, Awaitable[T]]] load: Loads the value, synchronously or not.
+        :param Callable[[T], Optional[bytes]] encode: Encodes the value, or returns None if it is not to be cached.
+        :param Callable[[bytes], T] decode: Decodes a cached value.
+        :return T: The value.
+        """
+
+        async def load_value() -> T:
+            value = load()
+            return await value if inspect.isawaitable(value) else value
+
+        if self.async_client is None or key is None:
+            return await load_value()
+        lock_key, token = f"{key}:lock", uuid.uuid4().hex
+        try:
+            data = await self.async_client.get(key)
+            deadline = time.monotonic() + self.lock_timeout
+            while data is None and not await self.async_client.set(
+                lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+            ):
+                if time.monotonic() >= deadline:
+                    logger.warning(f" ⚠️ Timed out waiting for {key} to be loaded")
+                    return await load_value()
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                data = await self.async_client.get(key)
+            if data is not None:
+                return decode(data)
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Shared cache unavailable, reading from the database: {str(e)}")
+            return await load_value()
+
+        try:
+            value = await load_value()
+            data = encode(value)
+            if data is not None:
+                await self.async_client.set(key, data, px=int(self.ttl * 1000))
+            return value
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Failed to store {key} in the shared cache: {str(e)}")
+            return value
+        finally:
+            try:
+                if await self.async_client.get(lock_key) == token.encode():
+                    await self.async_client.delete(lock_key)
+            except redis.RedisError:
+                pass
+
+    def get_data_contract(
+        self, id: str, load: Callable[[], Optional[Tuple[str, Optional[str]]]]
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Returns the stored document of a data contract and its content hash, from the cache or from ``load``.
+
+        :param str id: The unique identifier of the data contract.
+        :param Callable[[], Optional[Tuple[str, Optional[str]]]] load: Reads the document and content hash of the
+            data contract from the database, or returns None if it does not exist.
+        :return Optional[Tuple[str, Optional[str]]]: The document and content hash, or None if not found.
+        """
+        if self.client is None:
+            return load()
+        try:
+            version = self.client.get(self._version_key(id))
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Shared cache unavailable, reading from the database: {str(e)}")
+            return load()
+        return self.get_or_load(self._data_contract_key(id, version), load, _encode_entry, _decode_entry)
+
+    async def aget_data_contract(
+        self, id: str, load: Callable[[], Awaitable[Optional[Tuple[str, Optional[str]]]]]
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Returns the stored document of a data contract and its content hash, from the cache or from ``load``.
+
+        :param str id: The unique identifier of the data contract.
+        :param Callable[[], Awaitable[Optional[Tuple[str, Optional[str]]]]] load: Reads the document and content
+            hash of the data contract from the database, or returns None if it does not exist.
+        :return Optional[Tuple[str, Optional[str]]]: The document and content hash, or None if not found.
+        """
+        if self.async_client is None:
+            return await load()
+        try:
+            version = await self.async_client.get(self._version_key(id))
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Shared cache unavailable, reading from the database: {str(e)}")
+            return await load()
+        return await self.aget_or_load(self._data_contract_key(id, version), load, _encode_entry, _decode_entry)
+
+    def peek_data_contract(self, id: str) -> Optional[Tuple[str, str]]:
+        """
+        Returns the cached document of a data contract and its content hash, without loading them if missing.
+
+        :param str id: The unique identifier of the data contract.
+        :return Optional[Tuple[str, str]]: The document and content hash, or None if not cached.
+        """
+        if self.client is None:
+            return None
+        try:
+            data = self.client.get(self._data_contract_key(id, self.client.get(self._version_key(id))))
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Shared cache unavailable, reading from the database: {str(e)}")
+            return None
+        return _decode_entry(data) if data is not None else None
+
+    async def apeek_data_contract(self, id: str) -> Optional[Tuple[str, str]]:
+        """
+        Returns the cached document of a data contract and its content hash, without loading them if missing.
+
+        :param str id: The unique identifier of the data contract.
+        :return Optional[Tuple[str, str]]: The document and content hash, or None if not cached.
+        """
+        if self.async_client is None:
+            return None
+        try:
+            version = await self.async_client.get(self._version_key(id))
+            data = await self.async_client.get(self._data_contract_key(id, version))
+        except redis.RedisError as e:
+            logger.warning(f" ⚠️ Shared cache unavailable, reading from the database: {str(e)}")
+            return None
+        return _decode_entry(data) if data is not None else None
+
+    async def aget_list_page(
+        self,
+        etag: Optional[str],
+        load: Callable[[], Union[Tuple[bytes, Optional[str]], Awaitable[Tuple[bytes, Optional[str]]]]],
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        Returns the body of a list page and its ETag, from the cache or from ``load``.
+
+        A loaded page is only cached under ``etag`` if it was built from the same content: when a write lands between
+        the read of the ETag and the read of the page, the page has another ETag, and it is returned without being
+        cached.
+
+        :param Optional[str] etag: The ETag of the page, which identifies its content. Pages without an ETag are
+            not cached.
+        :param Callable[[], Union[Tuple[bytes, Optional[str]], Awaitable[Tuple[bytes, Optional[str]]]]] load: Builds
+            the body of the page and computes its ETag from the data contracts it holds, synchronously or not.
+        :return Tuple[bytes, Optional[str]]: The body of the page and its ETag.
+        """
+        key = f"{KEY_PREFIX}data_contract_page:{etag}" if etag is not None else None
+
+        def encode(page: Tuple[bytes, Optional[str]]) -> Optional[bytes]:
+            return page[0] if page[1] == etag else None
+
+        return await self.aget_or_load(key, load, encode, lambda data: (data, etag))
+
+    def invalidate(self, ids: Sequence[str]) -> None:
+        """
+        Moves the written data contracts to a new version, and notifies the workers of every replica.
+
+        Called once the write is committed. A failure is logged, and the other workers then serve the previous
+        version until it expires.
+
+        :param Sequence[str] ids: The unique identifiers of the written data contracts.
+        """
+        if self.client is None or not ids:
+            return
+        try:
+            with self.client.pipeline(transaction=False) as pipeline:
+                for id in ids:
+                    pipeline.incr(self._version_key(id))
+                pipeline.publish(INVALIDATION_CHANNEL, json.dumps(list(ids)))
+                pipeline.execute()
+        except redis.RedisError as e:
+            logger.error(f" ❌ Failed to invalidate {len(ids)} data contracts in the shared cache: {str(e)}")
+
+    async def ainvalidate(self, ids: Sequence[str]) -> None:
+        """
+        Moves the written data contracts to a new version, and notifies the workers of every replica.
+
+        :param Sequence[str] ids: The unique identifiers of the written data contracts.
+        """
+        if self.async_client is None or not ids:
+            return
+        try:
+            async with self.async_client.pipeline(transaction=False) as pipeline:
+                for id in ids:
+                    pipeline.incr(self._version_key(id))
+                pipeline.publish(INVALIDATION_CHANNEL, json.dumps(list(ids)))
+                await pipeline.execute()
+        except redis.RedisError as e:
+            logger.error(f" ❌ Failed to invalidate {len(ids)} data contracts in the shared cache: {str(e)}")
+
+    @staticmethod
+    def _version_key(id: str) -> str:
+        return f"{KEY_PREFIX}data_contract_version:{id}"
+
+    @staticmethod
+    def _data_contract_key(id: str, version: Optional[bytes]) -> str:
+        return f"{KEY_PREFIX}data_contract:{id}:{int(version or 0)}"
+
+
+shared_cache = SharedCache()
@@ -1,9 +1,292 @@
-from typing import Any, Dict
+import base64
+import binascii
+import hashlib
+import json
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Iterator, List, Optional, Sequence, Type, TypeVar
 
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
+from sqlalchemy import JSON
+
+from ..database.types import CompressedJSON
 from ..models.data_contract import DataContract as DBDataContract
 from ..schemas.data_contract.objects.data_contract import (
     DataContract as PydanticDataContract,
 )
+from .cache import compact_document_cache
+from .config import settings
+
+T = TypeVar("T")
+
+# Content encodings whose name suffixes the ETags of the compressed representations
+ETAG_ENCODINGS = ("br", "gzip")
+
+# Optional sections of a data contract, stored as NULL when they are empty
+EMPTY_AS_NULL_SECTIONS = ("servers", "terms", "models", "definitions", "examples", "service_level", "quality", "links")
+
+
+def info_to_db_columns(info: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Extracts the indexed copies of the scalar fields of an info object.
+
+    :param Dict[str, Any] info: The info object, in JSON mode.
+    :return Dict[str, Optional[str]]: The values of the `info_*` columns, keyed by column name.
+    """
+    return {
+        "info_title": info.get("title"),
+        "info_version": info.get("version"),
+        "info_owner": info.get("owner"),
+        "info_status": info.get("status"),
+    }
+
+
+def pydantic_to_document(pydantic_model: PydanticDataContract) -> str:
+    """
+    Serializes a Pydantic DataContract model to its canonical JSON document, as served by the API.
+
+    :param PydanticDataContract pydantic_model: The Pydantic model to serialize.
+    :return str: The JSON document, using the field aliases like FastAPI's responses.
+    """
+    return pydantic_model.model_dump_json(by_alias=True)
+
+
+def compact_document(document: str) -> str:
+    """
+    Serializes a stored JSON document without the optional fields that have no value, as served in compact mode.
+
+    Only the null fields of the models are omitted: the null values inside free-form data, such as example rows,
+    are kept. The compact documents are cached by content hash, as validating a document again is costly.
+
+    :param str document: The canonical JSON document, as returned by ``pydantic_to_document``.
+    :return str: The compact JSON document, using the field aliases like the stored one.
+    """
+    key = content_hash(document)
+    compact = compact_document_cache.get(key)
+    if compact is None:
+        generation = compact_document_cache.generation
+        compact = PydanticDataContract.model_validate_json(document).model_dump_json(by_alias=True, exclude_none=True)
+        compact_document_cache.put(key, compact, generation)
+    return compact
+
+
+def content_hash(document: str) -> str:
+    """
+    Computes the content hash of a JSON document, as stored alongside it and served as its ETag.
+
+    :param str document: The canonical JSON document, as returned by ``pydantic_to_document``.
+    :return str: The hexadecimal SHA-256 digest of the document.
+    """
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def make_etag(content_hashes: Sequence[Optional[str]], variant: str = "") -> Optional[str]:
+    """
+    Builds the strong ETag of a response holding one or several data contracts.
+
+    The ETag of a single, whole data contract is its content hash. Other responses (pages, sparse fieldsets)
+    hash the content hashes of their data contracts together with a description of their shape.
+
+    :param Sequence[Optional[str]] content_hashes: The content hashes of the data contracts, in response order.
+    :param str variant: What else the response depends on, such as the requested fields or the next cursor.
+    :return Optional[str]: The quoted ETag, or None if a data contract has no content hash yet.
+    """
+    if any(value is None for value in content_hashes):
+        return None
+    if len(content_hashes) == 1 and not variant:
+        return f'"{content_hashes[0]}"'
+    digest = hashlib.sha256(variant.encode("utf-8"))
+    for value in content_hashes:
+        digest.update(value.encode("ascii"))
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_header(etag: Optional[str]) -> Dict[str, str]:
+    """
+    Builds the ETag header of a response.
+
+    :param Optional[str] etag: The ETag of the response, if any.
+    :return Dict[str, str]: The header, or no header if the response has no ETag.
+    """
+    return {"ETag": etag} if etag is not None else {}
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Builds the ETag of the compressed representation of a response.
+
+    A strong ETag identifies the exact bytes of a representation, so the ones of the compressed bodies get the
+    content encoding as a suffix (RFC 9110, section 8.8.3). Weak ETags are kept as they are.
+
+    :param str etag: The ETag of the uncompressed response.
+    :param str encoding: The content encoding of the compressed body, such as "gzip" or "br".
+    :return str: The ETag of the compressed body.
+    """
+    if etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def decoded_etag(etag: str) -> str:
+    """
+    Returns the ETag of the uncompressed representation a possibly compressed one was built from.
+
+    :param str etag: An ETag, as returned by ``encoded_etag`` or not.
+    :return str: The ETag without the suffix of its content encoding, if any.
+    """
+    for encoding in ETAG_ENCODINGS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """
+    Tells whether an If-None-Match header matches the current ETag of a resource.
+
+    The ETags of the compressed representations match the ETag they were built from.
+
+    :param Optional[str] if_none_match: The value of the If-None-Match header, if any.
+    :param Optional[str] etag: The current ETag of the resource, if any.
+    :return bool: True if the client already holds the current representation.
+    """
+    if not if_none_match or etag is None:
+        return False
+    candidates = {decoded_etag(candidate.strip().removeprefix("W/")) for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def if_match_satisfied(if_match: Optional[str], etag: Optional[str]) -> bool:
+    """
+    Tells whether the If-Match header of a write matches the current ETag of an existing resource.
+
+    Unlike If-None-Match, If-Match uses the strong comparison, so weak ETags never match. The ETags of the
+    compressed representations match the ETag they were built from, as they hold the same content.
+
+    :param Optional[str] if_match: The value of the If-Match header, if any.
+    :param Optional[str] etag: The current ETag of the resource, if any.
+    :return bool: True if the write may be applied, which is always the case without an If-Match header.
+    """
+    if if_match is None:
+        return True
+    candidates = {decoded_etag(candidate.strip()) for candidate in if_match.split(",")}
+    return "*" in candidates or (etag is not None and etag in candidates)
+
+
+def pydantic_to_db_dict(pydantic_model: PydanticDataContract) -> Dict[str, Any]:
+    """
+    Converts a Pydantic DataContract model to the column values of a SQLAlchemy DataContract row.
+
+    The model is serialized once, to its JSON document, and the column values are decoded from that document, so
+    the sections are stored like they are served, with the field aliases (such as ``$ref``).
+
+    :param PydanticDataContract pydantic_model: The Pydantic model to convert.
+    :return Dict[str, Any]: The column values, keyed by column name.
+    """
+    serialized = pydantic_to_document(pydantic_model)
+    decoded = json.loads(serialized)
+    # The document is keyed by the serialization aliases of the fields, the columns by their names
+    document = {
+        name: decoded[field.serialization_alias or field.alias or name]
+        for name, field in PydanticDataContract.model_fields.items()
+    }
+    return dict(
+        id=document["id"],
+        data_contract_specification=document["data_contract_specification"],
+        info=document["info"],
+        **info_to_db_columns(document["info"]),
+        **{section: document[section] or None for section in EMPTY_AS_NULL_SECTIONS},
+        tags=document["tags"],
+        document=serialized,
+        content_hash=content_hash(serialized),
+    )
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Applies a JSON merge patch (RFC 7386) to a JSON value.
+
+    :param Any target: The JSON value to patch. It is not modified.
+    :param Any patch: The merge patch. Null members remove the corresponding members of the target.
+    :return Any: The patched JSON value.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+@lru_cache(maxsize=None)
+def section_adapter(section: str) -> TypeAdapter:
+    """
+    Returns the validator of one top-level section of a data contract.
+
+    :param str section: The name of the section.
+    :return TypeAdapter: The adapter validating and serializing the section on its own.
+    """
+    field = PydanticDataContract.model_fields[section]
+    return TypeAdapter(Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation)
+
+
+def merge_patch_to_db_dict(id: str, document: str, patch: Any) -> Dict[str, Any]:
+    """
+    Applies a JSON merge patch to the stored document of a data contract.
+
+    Only the patched sections are validated, and only their columns are returned, along with the new document
+    and its content hash, so that a small patch of a large data contract is cheap to apply and to write.
+
+    :param str id: The ID of the data contract.
+    :param str document: The stored JSON document of the data contract.
+    :param Any patch: The merge patch, which must be a JSON object keyed by section.
+    :return Dict[str, Any]: The values of the columns to update, keyed by column name.
+    :raises ValueError: If the patch is not an object, changes the ID, or patches an unknown section.
+    :raises RequestValidationError: If a patched section is invalid.
+    """
+    if not isinstance(patch, dict):
+        raise ValueError("The merge patch must be a JSON object")
+    # Sections can be patched by name or by validation alias, like in the create and update bodies
+    sections = {
+        choice: name
+        for name, field in PydanticDataContract.model_fields.items()
+        for choice in [name, *getattr(field.validation_alias, "choices", [])]
+    }
+    patched = json.loads(document)
+    row: Dict[str, Any] = {}
+    errors: List[Dict[str, Any]] = []
+    for key, value in patch.items():
+        section = sections.get(key)
+        if section is None:
+            raise ValueError(f"Unknown field: {key}")
+        if section == "id":
+            if value != id:
+                raise ValueError("The ID of a data contract cannot be changed")
+            continue
+        try:
+            validated = section_adapter(section).validate_python(merge_patch(patched.get(section), value))
+        except ValidationError as e:
+            errors.extend({**error, "loc": ("body", key, *error["loc"])} for error in e.errors(include_url=False))
+            continue
+        # Stored with the field aliases, like the columns written by ``pydantic_to_db_dict``
+        patched[section] = row[section] = section_adapter(section).dump_python(validated, mode="json", by_alias=True)
+        if section in EMPTY_AS_NULL_SECTIONS:
+            row[section] = row[section] or None
+        if section == "info":
+            row.update(info_to_db_columns(row["info"]))
+    if errors:
+        raise RequestValidationError(errors)
+    # Serialized by pydantic like in ``pydantic_to_document`` (same float and string formatting), so that the document
+    # and its content hash do not depend on the write path
+    row["document"] = to_json(patched).decode("utf-8")
+    row["content_hash"] = content_hash(row["document"])
+    return row
 
 
 def pydantic_to_db_model(pydantic_model: PydanticDataContract) -> DBDataContract:
@@ -13,35 +296,7 @@ def pydantic_to_db_model(pydantic_model: PydanticDataContract) -> DBDataContract
     :param PydanticDataContract pydantic_model: The Pydantic model to convert.
     :return DBDataContract: The corresponding SQLAlchemy model.
     """
-    db_model = DBDataContract(
-        id=pydantic_model.id,
-        data_contract_specification=pydantic_model.data_contract_specification,
-        info=pydantic_model.info.model_dump(mode="json"),
-        servers=(
-            {k: v.model_dump(mode="json") for k, v in pydantic_model.servers.items()}
-            if pydantic_model.servers
-            else None
-        ),
-        terms=pydantic_model.terms.model_dump(mode="json") if pydantic_model.terms else None,
-        models=(
-            {k: v.model_dump(mode="json") for k, v in pydantic_model.models.items()} if pydantic_model.models else None
-        ),
-        definitions=(
-            {k: v.model_dump(mode="json") for k, v in pydantic_model.definitions.items()}
-            if pydantic_model.definitions
-            else None
-        ),
-        examples=(
-            [example.model_dump(mode="json") for example in pydantic_model.examples]
-            if pydantic_model.examples
-            else None
-        ),
-        service_level=(pydantic_model.service_level.model_dump(mode="json") if pydantic_model.service_level else None),
-        quality=pydantic_model.quality.model_dump(mode="json") if pydantic_model.quality else None,
-        links={str(k): str(v) for k, v in pydantic_model.links.items()} if pydantic_model.links else None,
-        tags=pydantic_model.tags,
-    )
-    return db_model
+    return DBDataContract(**pydantic_to_db_dict(pydantic_model))
 
 
 def db_to_pydantic_model(db_model: DBDataContract) -> PydanticDataContract:
@@ -51,7 +306,7 @@ def db_to_pydantic_model(db_model: DBDataContract) -> PydanticDataContract:
     :param DBDataContract db_model: The SQLAlchemy model to convert.
     :return PydanticDataContract: The corresponding Pydantic model.
     """
-    db_dict: Dict[str, Any] = {c.name: getattr(db_model, c.name) for c in db_model.__table__.columns}
+    db_dict: Dict[str, Any] = {name: getattr(db_model, name) for name in PydanticDataContract.model_fields}
 
     # Convert servers back to a dictionary if it exists
     if db_dict.get("servers"):
@@ -59,3 +314,124 @@ def db_to_pydantic_model(db_model: DBDataContract) -> PydanticDataContract:
 
     # Use Pydantic's model_validate to create the Pydantic model
     return PydanticDataContract.model_validate(db_dict)
+
+
+def get_json_response_class() -> Type[JSONResponse]:
+    """
+    Returns the class of the JSON responses: orjson-backed in the fast JSON mode, stdlib-backed otherwise.
+
+    :return Type[JSONResponse]: The response class.
+    """
+    return ORJSONResponse if settings.FAST_JSON else JSONResponse
+
+
+class RawJSON(str):
+    """
+    A JSON fragment that ``dump_json_envelope`` embeds as is, without decoding nor re-encoding it.
+    """
+
+
+def dump_json_envelope(content: Dict[str, Any]) -> bytes:
+    """
+    Serializes a response envelope whose members may be already serialized JSON fragments.
+
+    :param Dict[str, Any] content: The members of the envelope. ``RawJSON`` values are embedded as is,
+        other values are serialized to JSON.
+    :return bytes: The UTF-8 encoded JSON object.
+    """
+    members = (
+        f"{json.dumps(key)}:{value if isinstance(value, RawJSON) else json.dumps(value, ensure_ascii=False)}"
+        for key, value in content.items()
+    )
+    return ("{" + ",".join(members) + "}").encode("utf-8")
+
+
+def encode_cursor(last_id: str) -> str:
+    """
+    Encodes the ID of the last returned data contract into an opaque pagination cursor.
+
+    :param str last_id: The ID of the last data contract of the current page.
+    :return str: The URL-safe pagination cursor.
+    """
+    return base64.urlsafe_b64encode(last_id.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decodes an opaque pagination cursor back into the ID it points after.
+
+    :param str cursor: The pagination cursor returned by a previous list call.
+    :return str: The ID of the last data contract of the previous page.
+    :raises ValueError: If the cursor is not a valid pagination cursor.
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
+def parse_tags(tags: Optional[str]) -> List[str]:
+    """
+    Parses a comma-separated list of tags such as ``"orders,checkout"``.
+
+    :param Optional[str] tags: The comma-separated list of tags, if any.
+    :return List[str]: The distinct non-empty tags, in their original order.
+    """
+    if tags is None:
+        return []
+    return list(dict.fromkeys(filter(None, (tag.strip() for tag in tags.split(",")))))
+
+
+def parse_fields(fields: str) -> Dict[str, Optional[List[str]]]:
+    """
+    Parses a sparse fieldset such as ``"id,info.title,info.version"``.
+
+    Each entry is either a top-level section of the data contract, or a ``section.key`` path selecting
+    a single key of a JSON section. The ID is always part of the projection.
+
+    :param str fields: The comma-separated list of fields to return.
+    :return Dict[str, Optional[List[str]]]: The selected sections, mapped to the selected keys
+        (None when the whole section is requested).
+    :raises ValueError: If a field is not part of the data contract, or cannot be projected.
+    """
+    json_sections = {
+        column.name for column in DBDataContract.__table__.columns if isinstance(column.type, (JSON, CompressedJSON))
+    }
+    projection: Dict[str, Optional[List[str]]] = {"id": None}
+    for field in filter(None, (field.strip() for field in fields.split(","))):
+        section, _, key = field.partition(".")
+        if section not in PydanticDataContract.model_fields:
+            raise ValueError(f"Unknown field: {field}")
+        if not key:
+            projection[section] = None
+        elif section not in json_sections or "." in key:
+            raise ValueError(f"Field cannot be projected: {field}")
+        elif section not in projection:
+            projection[section] = [key]
+        elif projection[section] is not None and key not in projection[section]:
+            projection[section].append(key)
+    return projection
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    Splits a sequence into consecutive chunks of at most ``size`` items.
+
+    :param Sequence[T] items: The sequence to split.
+    :param int size: The maximum number of items per chunk.
+    :yield: The chunks, in order.
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """
+    Formats a Pydantic validation error as a single line, one entry per invalid field.
+
+    :param ValidationError error: The validation error to format.
+    :return str: The formatted error, such as ``"info.title: Field required"``.
+    """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or '__root__'}: {detail['msg']}" for detail in error.errors()
+    )
@@ -0,0 +1,88 @@
+"""
+Compact mode benchmark of the data contracts served by the list route.
+
+Builds a page of data contracts whose models have many sparse fields, with most of their optional attributes unset,
+and compares the full documents served by default with the compact ones served with ``compact=true``:
+
+- the size of the page, raw and gzip-compressed,
+- the time a client spends parsing the page with ``json.loads``,
+- the time the server spends compacting a document, on the first request and from the compact document cache.
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.compact_benchmark --contracts 100 --fields 200 --repeat 20
+"""
+
+import argparse
+import copy
+import gzip
+import json
+import logging
+import time
+from typing import Any, Callable
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.cache import compact_document_cache
+from app.utils.tools import compact_document
+
+
+def build_document(index: int, fields: int) -> str:
+    """
+    Builds the stored document of a data contract whose model has ``fields`` sparse fields.
+
+    :param int index: The index of the data contract, used in its ID.
+    :param int fields: The number of fields of the model.
+    :return str: The document, as stored on write.
+    """
+    payload = copy.deepcopy(DataContract.get_example())
+    payload["id"] = f"urn:datacontract:benchmark:{index:05d}"
+    payload["models"] = {
+        "orders": {
+            "type": "table",
+            "fields": {f"field_{field:04d}": {"type": "string"} for field in range(fields)},
+        }
+    }
+    return DataContract.model_validate(payload).model_dump_json(by_alias=True)
+
+
+def best_time(function: Callable[[], Any], repeat: int) -> float:
+    """
+    Measures the best duration of a call, over several runs.
+
+    :param Callable[[], Any] function: The function to call.
+    :param int repeat: The number of calls.
+    :return float: The best duration, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contracts", type=int, default=100, help="Number of data contracts per page")
+    parser.add_argument("--fields", type=int, default=200, help="Number of fields per data contract")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of runs per measurement")
+    args = parser.parse_args()
+
+    documents = [build_document(index, args.fields) for index in range(args.contracts)]
+    compact_document_cache.clear()
+    start = time.perf_counter()
+    compact_documents = [compact_document(document) for document in documents]
+    uncached = (time.perf_counter() - start) / len(documents)
+    cached = best_time(lambda: [compact_document(document) for document in documents], args.repeat) / len(documents)
+
+    print(f"{'page':<10} {'bytes':>12} {'gzip bytes':>12} {'json.loads':>12}")
+    for name, page_documents in (("full", documents), ("compact", compact_documents)):
+        page = ("[" + ",".join(page_documents) + "]").encode("utf-8")
+        parse = best_time(lambda: json.loads(page), args.repeat)
+        print(f"{name:<10} {len(page):>12,} {len(gzip.compress(page)):>12,} {parse * 1000:>10.2f}ms")
+    print(f"\ncompacting a document: {uncached * 1e6:,.0f}µs on the first request, {cached * 1e6:,.2f}µs cached")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Storage benchmark of the compressed data contract columns, on data contracts with many fields and inline examples.
+
+Stores the same data contracts in two SQLite files, one with the compressed columns written as is (as before
+compression) and one compressed, then compares the size of the files, full scans of filters that are not
+indexed, and the export of every stored document (which pays the decompression).
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.compression_benchmark --contracts 500 --fields 200 --example-rows 2000
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from app.database.manager import db_manager
+from app.database.types import CompressedText
+from app.models.data_contract import DataContract as DataContractModel
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.utils.tools import pydantic_to_db_dict
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Engine
+
+from .ingest_benchmark import build_body
+
+
+def build_rows(contracts: int, fields: int, example_rows: int) -> List[Dict]:
+    """
+    Builds the database rows of data contracts with a large model and an inline CSV example.
+
+    :param int contracts: The number of data contracts.
+    :param int fields: The number of fields of their model.
+    :param int example_rows: The number of CSV rows of their example.
+    :return List[Dict]: The rows, as written by the create path.
+    """
+    payload = json.loads(build_body(fields))
+    csv = "\n".join(
+        f"{index},customer_{index % 97},{index * 3.5:.2f},2024-01-{index % 28 + 1:02d}" for index in range(example_rows)
+    )
+    payload["examples"] = [{"type": "csv", "model": "orders", "data": "id,customer,amount,date\n" + csv}]
+    rows = []
+    for index in range(contracts):
+        payload["id"] = f"urn:datacontract:benchmark:{index:06d}"
+        payload["info"]["owner"] = f"team-{index % 10}"
+        rows.append(pydantic_to_db_dict(DataContractCreate.model_validate(payload)))
+    return rows
+
+
+def store(path: str, rows: List[Dict], threshold: int) -> Engine:
+    """
+    Stores the rows in a new SQLite file, with the given compression threshold.
+
+    :return Engine: The engine of the database.
+    """
+    compressed_types = [
+        column.type for column in DataContractModel.__table__.columns if isinstance(column.type, CompressedText)
+    ]
+    previous = [column_type.threshold for column_type in compressed_types]
+    for column_type in compressed_types:
+        column_type.threshold = threshold
+    try:
+        engine = create_engine(f"sqlite:///{path}")
+        db_manager.Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(insert(DataContractModel), rows)
+    finally:
+        for column_type, value in zip(compressed_types, previous):
+            column_type.threshold = value
+    return engine
+
+
+def measure(engine: Engine, work: Callable, repeat: int) -> float:
+    """
+    Measures the mean duration of ``work``, run on a new connection each time.
+
+    :return float: The mean duration in milliseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        with engine.connect() as connection:
+            work(connection)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def scan_info(connection) -> None:
+    connection.execute(
+        select(func.count()).where(func.json_extract(DataContractModel.info, "$.owner") == "team-3")
+    ).scalar()
+
+
+def scan_tags(connection) -> None:
+    # The tags are stored after the large sections in each row, so reading them walks over those sections
+    connection.execute(select(func.count()).where(func.json_array_length(DataContractModel.tags) > 2)).scalar()
+
+
+def export(connection) -> None:
+    connection.execute(select(DataContractModel.document)).scalars().all()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contracts", type=int, default=500, help="Number of data contracts.")
+    parser.add_argument("--fields", type=int, default=200, help="Number of fields of the data contract model.")
+    parser.add_argument("--example-rows", type=int, default=2000, help="Number of CSV rows of the inline example.")
+    parser.add_argument("--repeat", type=int, default=10, help="Number of runs per measure.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rows = build_rows(args.contracts, args.fields, args.example_rows)
+    with tempfile.TemporaryDirectory() as directory:
+        engines = {}
+        for name, threshold in (("uncompressed", 2**62), ("compressed", 1024)):
+            path = os.path.join(directory, f"{name}.db")
+            engines[name] = (store(path, rows, threshold), os.path.getsize(path))
+
+        print(f"{args.contracts} data contracts with {args.fields} fields and {args.example_rows} example rows")
+        plain_engine, plain_size = engines["uncompressed"]
+        compressed_engine, compressed_size = engines["compressed"]
+        print(
+            f"  file size     {plain_size / 2**20:8.1f} MiB -> {compressed_size / 2**20:8.1f} MiB   "
+            f"({plain_size / compressed_size:.1f}x smaller)"
+        )
+        for label, work in (("owner scan", scan_info), ("tags scan", scan_tags), ("export", export)):
+            plain_ms = measure(plain_engine, work, args.repeat)
+            compressed_ms = measure(compressed_engine, work, args.repeat)
+            print(f"  {label:12s}  {plain_ms:8.1f} ms  -> {compressed_ms:8.1f} ms    ({plain_ms / compressed_ms:.1f}x)")
+        for engine, _ in engines.values():
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
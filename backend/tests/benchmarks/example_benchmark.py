@@ -0,0 +1,98 @@
+"""
+Benchmark of the examples of the schemas, memoized and shared versus rebuilt on every call to ``get_example``.
+
+Imports the routers in fresh interpreters, where every schema and route builds the examples of its models, and
+reports the import time, the number of examples built by the import, the generation of the OpenAPI schema, and the
+time and memory taken by the calls to ``get_example``.
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.example_benchmark --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORT_SCRIPT = """
+import json, sys, time, timeit, tracemalloc
+import fastapi, pydantic, sqlalchemy.ext.asyncio, sqlalchemy.orm
+import app.utils.config
+from app.utils.example_model import BaseModelWithExample
+
+builds = 0
+build_example = BaseModelWithExample.build_example.__func__
+
+def counted_build_example(cls):
+    global builds
+    builds += 1
+    return build_example(cls)
+
+BaseModelWithExample.build_example = classmethod(counted_build_example)
+if sys.argv[1] == "rebuilt":
+    BaseModelWithExample.get_example = classmethod(lambda cls: cls.build_example())
+
+start = time.perf_counter()
+import app.routers.cache
+import app.routers.data_contract
+imported = time.perf_counter() - start
+imported_builds = builds
+
+from fastapi import FastAPI
+application = FastAPI()
+application.include_router(app.routers.data_contract.router, prefix="/data_contract")
+application.include_router(app.routers.cache.router, prefix="/cache")
+start = time.perf_counter()
+application.openapi()
+documented = time.perf_counter() - start
+
+from app.schemas.data_contract.routes.data_contract_get import DataContractGetResponse
+call = min(timeit.repeat(DataContractGetResponse.get_example, number=1000, repeat=5)) / 1000
+# The examples referenced by the schemas and routes, and every example built since by the route decorators
+tracemalloc.start()
+examples = [model.get_example() for model in list(BaseModelWithExample.__subclasses__()) * 10]
+allocated = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+print(json.dumps([imported, imported_builds, documented, call, allocated]))
+"""
+
+
+def measure(mode: str, repeat: int) -> list:
+    """
+    Imports the routers in fresh interpreters.
+
+    :param str mode: "memoized", or "rebuilt" to build the examples on every call, as before.
+    :param int repeat: The number of interpreters started.
+    :return list: The median import time, examples built at import, OpenAPI time, call time and bytes allocated by
+        ten calls per model.
+    """
+    results = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT, mode], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(process.stdout.splitlines()[-1]))
+    return [statistics.median(column) for column in zip(*results)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of interpreters started per mode")
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'import':>10} {'built':>7} {'openapi':>10} {'get_example':>13} {'10 calls/model':>15}")
+    for mode in ("rebuilt", "memoized"):
+        imported, builds, documented, call, allocated = measure(mode, args.repeat)
+        print(
+            f"{mode:<10} {imported * 1000:>8.1f}ms {builds:>7.0f} {documented * 1000:>8.1f}ms "
+            f"{call * 1e6:>11.2f}us {allocated / 1024:>12.1f}KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
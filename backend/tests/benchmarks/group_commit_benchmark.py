@@ -0,0 +1,130 @@
+"""
+Group commit benchmark of the data contract updates, under concurrent writers.
+
+Runs the same updates from many threads against a SQLite file with the production PRAGMAs, first with each write
+committing its own transaction (the writers waiting for the lock of the database in turn), then with the writes
+submitted to the write queue, which commits them in groups. Reports the throughput and tail latency of each mode,
+and the average group size of the write queue.
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.group_commit_benchmark --writers 32 --writes 50
+    python -m tests.benchmarks.group_commit_benchmark --synchronous FULL --window-ms 1
+"""
+
+import argparse
+import copy
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import Callable, List, Tuple
+from unittest import mock
+
+from app.crud.data_contract import update_data_contract
+from app.database.manager import db_manager
+from app.database.writer import WriteQueue
+from app.models.data_contract import DataContract as DataContractModel
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.routes.data_contract_update import DataContractUpdate
+from app.utils.config import settings
+from app.utils.tools import pydantic_to_db_dict
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+
+def run_writers(writers: int, writes: int, write: Callable[[int, int], None]) -> Tuple[float, float]:
+    """
+    Runs ``writes`` writes from each of ``writers`` threads.
+
+    :param int writers: The number of threads.
+    :param int writes: The number of writes per thread.
+    :param Callable[[int, int], None] write: Writes once, given the index of the thread and of the write.
+    :return Tuple[float, float]: The throughput in writes per second, and the p99 latency in milliseconds.
+    """
+    latencies: List[float] = []
+    barrier = threading.Barrier(writers + 1)
+
+    def writer(index: int) -> None:
+        barrier.wait()
+        for number in range(writes):
+            sent = time.perf_counter()
+            write(index, number)
+            latencies.append(time.perf_counter() - sent)
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(writers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return writers * writes / elapsed, statistics.quantiles(latencies, n=100)[98] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=32, help="Number of concurrent writers.")
+    parser.add_argument("--writes", type=int, default=50, help="Number of updates per writer.")
+    parser.add_argument("--window-ms", type=float, default=settings.GROUP_COMMIT_WINDOW_MS, help="Group window.")
+    parser.add_argument("--max-batch", type=int, default=settings.GROUP_COMMIT_MAX_BATCH, help="Maximum group size.")
+    parser.add_argument("--synchronous", default=settings.SQLITE_SYNCHRONOUS, help="SQLite synchronous PRAGMA.")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    example = DataContract.model_validate(DataContract.get_example())
+    ids = [f"urn:datacontract:benchmark:{index}" for index in range(args.writers)]
+    updates = []
+    for id in ids:
+        payload = copy.deepcopy(DataContract.get_example())
+        payload["id"] = id
+        updates.append(DataContractUpdate.model_validate(payload))
+
+    with tempfile.TemporaryDirectory() as directory, mock.patch.object(
+        settings, "SQLITE_SYNCHRONOUS", args.synchronous
+    ):
+        engine: Engine = create_engine(
+            f"sqlite:///{os.path.join(directory, 'benchmark.db')}", pool_size=args.writers + 1, max_overflow=0
+        )
+        event.listen(engine, "connect", db_manager.apply_sqlite_pragmas)
+        db_manager.Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(
+                insert(DataContractModel), [pydantic_to_db_dict(example.model_copy(update={"id": id})) for id in ids]
+            )
+        session_factory = sessionmaker(autoflush=False, bind=engine)
+
+        def commit_each(index: int, number: int) -> None:
+            with session_factory() as db:
+                update_data_contract(db, ids[index], updates[index])
+
+        write_queue = WriteQueue()
+
+        def group_commit(index: int, number: int) -> None:
+            write_queue.submit(update_data_contract, ids[index], updates[index]).result()
+
+        print(
+            f"PUT /data_contract/{{id}} - {args.writers} writers x {args.writes} updates, "
+            f"synchronous={args.synchronous}"
+        )
+        throughput, p99 = run_writers(args.writers, args.writes, commit_each)
+        print(f"  {'commit per write':<18} {throughput:8.1f} writes/s   p99 {p99:7.1f} ms")
+        write_queue.start(engine, window_ms=args.window_ms, max_batch=args.max_batch)
+        try:
+            throughput, p99 = run_writers(args.writers, args.writes, group_commit)
+        finally:
+            write_queue.stop()
+        stats = write_queue.stats()
+        print(
+            f"  {'group commit':<18} {throughput:8.1f} writes/s   p99 {p99:7.1f} ms   "
+            f"{stats['average_batch']:.1f} writes per group (largest {stats['largest_batch']})"
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
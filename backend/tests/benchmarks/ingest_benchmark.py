@@ -0,0 +1,119 @@
+"""
+Ingest benchmark of the data contract create path, on data contracts with many fields.
+
+Compares the work done on a request body before it is stored, with the previous path and the single-pass one:
+
+- two-pass: ``json.loads`` and ``model_validate`` (FastAPI's body parsing), then a second validation of a
+  ``model_dump`` of the body, then one ``model_dump(mode="json")`` per section of the data contract.
+- single-pass: ``model_validate_json`` on the raw body bytes, then one ``model_dump(mode="json")`` of the
+  whole data contract, from which the columns are taken.
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.ingest_benchmark --fields 1000 --repeat 50
+"""
+
+import argparse
+import copy
+import json
+import logging
+import time
+from typing import Any, Callable, Dict
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.utils.tools import info_to_db_columns, pydantic_to_db_dict
+
+
+def build_body(fields: int) -> bytes:
+    """
+    Builds the JSON body of a data contract whose model has ``fields`` fields.
+
+    :param int fields: The number of fields of the model.
+    :return bytes: The JSON request body.
+    """
+    payload = copy.deepcopy(DataContract.get_example())
+    payload["models"] = {
+        "orders": {
+            "type": "table",
+            "description": "One record per order.",
+            "fields": {
+                f"field_{index:04d}": {
+                    "type": "string",
+                    "description": f"Field number {index} of the orders.",
+                    "required": index % 2 == 0,
+                    "tags": ["benchmark"],
+                }
+                for index in range(fields)
+            },
+        }
+    }
+    return json.dumps(DataContract.model_validate(payload).model_dump(mode="json")).encode("utf-8")
+
+
+def two_pass(body: bytes) -> Dict[str, Any]:
+    """
+    Converts a request body to a database row with the previous, two-pass ingest path.
+    """
+    data_contract = DataContractCreate.model_validate(json.loads(body))
+    model = DataContract.model_validate(data_contract.model_dump())
+    info = model.info.model_dump(mode="json")
+    return dict(
+        id=model.id,
+        data_contract_specification=model.data_contract_specification,
+        info=info,
+        **info_to_db_columns(info),
+        servers={k: v.model_dump(mode="json") for k, v in model.servers.items()} if model.servers else None,
+        terms=model.terms.model_dump(mode="json") if model.terms else None,
+        models={k: v.model_dump(mode="json") for k, v in model.models.items()} if model.models else None,
+        definitions=(
+            {k: v.model_dump(mode="json") for k, v in model.definitions.items()} if model.definitions else None
+        ),
+        examples=[example.model_dump(mode="json") for example in model.examples] if model.examples else None,
+        service_level=model.service_level.model_dump(mode="json") if model.service_level else None,
+        quality=model.quality.model_dump(mode="json") if model.quality else None,
+        links={str(k): str(v) for k, v in model.links.items()} if model.links else None,
+        tags=model.tags,
+    )
+
+
+def single_pass(body: bytes) -> Dict[str, Any]:
+    """
+    Converts a request body to a database row with the single-pass ingest path.
+    """
+    return pydantic_to_db_dict(DataContractCreate.model_validate_json(body))
+
+
+def measure(path: Callable[[bytes], Dict[str, Any]], body: bytes, repeat: int) -> float:
+    """
+    Measures the best time of ``repeat`` runs of an ingest path.
+
+    :return float: The best time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=1000, help="Number of fields of the data contract model.")
+    parser.add_argument("--repeat", type=int, default=50, help="Number of runs per path.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    body = build_body(args.fields)
+    assert two_pass(body) == single_pass(body), "Both paths must store the same row"
+
+    print(f"Ingest of a data contract with {args.fields} fields ({len(body) / 1024:.0f} KiB), best of {args.repeat}")
+    two_pass_ms = measure(two_pass, body, args.repeat)
+    single_pass_ms = measure(single_pass, body, args.repeat)
+    print(f"  two-pass     {two_pass_ms:8.2f} ms")
+    print(f"  single-pass  {single_pass_ms:8.2f} ms   ({two_pass_ms / single_pass_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+JSON benchmark of ``GET /data_contract/``, with and without the fast JSON mode.
+
+Lists the data contracts with a ``fields`` projection of their JSON sections, so that every request decodes
+the JSON columns of a page of rows and serializes them into the response: with the standard library, and
+with orjson (``FAST_JSON=true``) for both the JSON columns and the response.
+
+Without ``fields``, the list serves the stored JSON documents as is and does no JSON work at all.
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.json_benchmark --contracts 100 --requests 100
+"""
+
+import argparse
+import logging
+import time
+from unittest import mock
+
+from app.database.manager import db_manager
+from app.models.data_contract import DataContract as DataContractModel
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.utils.config import settings
+from app.utils.tools import pydantic_to_db_dict
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from ..helpers import create_test_app, create_test_engine
+from .ingest_benchmark import build_body
+
+FIELDS = "info,servers,models,quality,tags"
+
+
+def measure(contracts: int, requests: int, fields: int) -> float:
+    """
+    Measures the mean latency of listing ``contracts`` data contracts, in the current JSON mode.
+
+    :return float: The mean latency in milliseconds.
+    """
+    engine = create_test_engine()
+    data_contract = DataContractCreate.model_validate_json(build_body(fields))
+    with engine.begin() as connection:
+        connection.execute(
+            insert(DataContractModel),
+            [
+                pydantic_to_db_dict(data_contract.model_copy(update={"id": f"urn:benchmark:{i}"}))
+                for i in range(contracts)
+            ],
+        )
+    client = TestClient(create_test_app(engine))
+    params = {"limit": contracts, "fields": FIELDS}
+    client.get("/data_contract/", params=params).raise_for_status()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get("/data_contract/", params=params).raise_for_status()
+    elapsed = (time.perf_counter() - start) / requests * 1000
+    engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contracts", type=int, default=100, help="Number of data contracts per page.")
+    parser.add_argument("--requests", type=int, default=100, help="Number of requests per mode.")
+    parser.add_argument("--fields", type=int, default=50, help="Number of fields of the data contract model.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"GET /data_contract/?fields={FIELDS} - pages of {args.contracts} data contracts, mean of {args.requests}")
+    timings = {}
+    for label, fast_json in (("stdlib json", False), ("orjson", True)):
+        with mock.patch.object(settings, "FAST_JSON", fast_json):
+            timings[label] = measure(args.contracts, args.requests, args.fields)
+        print(f"  {label:<12} {timings[label]:8.2f} ms")
+    print(f"  fast JSON mode saves {1 - timings['orjson'] / timings['stdlib json']:.0%} of the request time")
+
+
+if __name__ == "__main__":
+    main()
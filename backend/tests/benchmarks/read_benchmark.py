@@ -0,0 +1,96 @@
+"""
+Read benchmark of ``GET /data_contract/{id}``, on data contracts with many fields.
+
+Compares the route serving the stored JSON document with the previous validated path, which loaded every
+column, validated them into a ``DataContract`` and let FastAPI validate and serialize the response model.
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.read_benchmark --fields 1000 --requests 200
+"""
+
+import argparse
+import logging
+import time
+from typing import Generator
+
+from app.database.manager import db_manager
+from app.models.data_contract import DataContract as DataContractModel
+from app.routers.data_contract import router as data_contract_router
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from app.schemas.data_contract.routes.data_contract_get import DataContractGetResponse
+from app.utils.tools import db_to_pydantic_model, pydantic_to_db_dict
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from .ingest_benchmark import build_body
+
+
+def build_app(session_factory: sessionmaker) -> FastAPI:
+    """
+    Builds an application serving the data contract routes, plus the previous validated GET route.
+
+    :param sessionmaker session_factory: The session factory of the benchmark database.
+    :return FastAPI: The application.
+    """
+
+    def get_db() -> Generator[Session, None, None]:
+        with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(data_contract_router, prefix="/data_contract")
+    app.dependency_overrides[db_manager.get_session] = get_db
+
+    @app.get("/validated/{id}", response_model=DataContractGetResponse)
+    async def get_validated(id: str, db: Session = Depends(get_db)) -> DataContractGetResponse:
+        db_data_contract = db.scalar(select(DataContractModel).where(DataContractModel.id == id))
+        return DataContractGetResponse(
+            message=" ✅ Data contract retrieved successfully", data=db_to_pydantic_model(db_data_contract)
+        )
+
+    return app
+
+
+def measure(client: TestClient, url: str, requests: int) -> float:
+    """
+    Measures the mean latency of ``requests`` sequential GET requests.
+
+    :return float: The mean latency in milliseconds.
+    """
+    client.get(url).raise_for_status()
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(url).raise_for_status()
+    return (time.perf_counter() - start) / requests * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=1000, help="Number of fields of the data contract model.")
+    parser.add_argument("--requests", type=int, default=200, help="Number of requests per path.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    db_manager.Base.metadata.create_all(bind=engine)
+    data_contract = DataContractCreate.model_validate_json(build_body(args.fields))
+    with engine.begin() as connection:
+        connection.execute(insert(DataContractModel), [pydantic_to_db_dict(data_contract)])
+    client = TestClient(build_app(sessionmaker(autoflush=False, bind=engine)))
+
+    validated = client.get(f"/validated/{data_contract.id}").json()
+    assert client.get(f"/data_contract/{data_contract.id}").json() == validated, "Both paths must serve the same JSON"
+
+    print(f"GET of a data contract with {args.fields} fields, mean of {args.requests} requests")
+    validated_ms = measure(client, f"/validated/{data_contract.id}", args.requests)
+    document_ms = measure(client, f"/data_contract/{data_contract.id}", args.requests)
+    print(f"  validated model  {validated_ms:8.2f} ms")
+    print(f"  stored document  {document_ms:8.2f} ms   ({validated_ms / document_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Startup benchmark of the application, as paid by every new worker process.
+
+Starts fresh interpreters importing ``app.main`` against a new SQLite file and reports:
+
+- an import-time profile (``python -X importtime``): the modules slowest to import, by their own time, and the
+  cumulative import time of each top-level package.
+- the time to import the application and then to serve its OpenAPI schema (the first request to ``/docs``), with
+  the schema generated on that request (as before), generated at startup and cached (first process of a build),
+  and loaded from the cache (next processes), and with the models and routers found by listing their directories.
+
+Usage (from the ``backend`` directory, with the application environment variables set):
+
+    python -m tests.benchmarks.startup_benchmark --repeat 5 --top 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STARTUP_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+app.main.app.openapi()
+print(json.dumps([imported - start, time.perf_counter() - imported]))
+"""
+
+
+def run(args: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    """
+    Runs a fresh interpreter from the ``backend`` directory.
+
+    :param List[str] args: The arguments of the interpreter.
+    :param Dict[str, str] env: The environment variables set on top of the current ones.
+    :return subprocess.CompletedProcess: The completed process, with its captured output.
+    """
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=BACKEND_DIR,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def profile_imports(env: Dict[str, str]) -> List[Tuple[str, int, int]]:
+    """
+    Profiles the import of the application with ``-X importtime``.
+
+    :param Dict[str, str] env: The environment variables of the application.
+    :return List[Tuple[str, int, int]]: The imported modules, with their own and cumulative import times in
+        microseconds.
+    """
+    stderr = run(["-X", "importtime", "-c", "import app.main"], env).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(own), int(cumulative)))
+    return modules
+
+
+def print_profile(modules: List[Tuple[str, int, int]], top: int) -> None:
+    """
+    Prints the slowest modules to import and the import time of each top-level package.
+    """
+    print(f"{'module (self time)':<60} {'self':>10} {'cumulative':>12}")
+    for name, own, cumulative in sorted(modules, key=lambda module: module[1], reverse=True)[:top]:
+        print(f"{name:<60} {own / 1000:>8.1f}ms {cumulative / 1000:>10.1f}ms")
+    packages = defaultdict(int)
+    for name, own, _ in modules:
+        packages[name.split(".")[0]] += own
+    print(f"\n{'package (total self time)':<60} {'self':>10}")
+    for name, own in sorted(packages.items(), key=lambda package: package[1], reverse=True)[:top]:
+        print(f"{name:<60} {own / 1000:>8.1f}ms")
+    print(f"{'total':<60} {sum(packages.values()) / 1000:>8.1f}ms\n")
+
+
+def measure_startup(env: Dict[str, str], repeat: int, cache_dir: str = "") -> Tuple[float, float]:
+    """
+    Measures the import of the application and the generation of its OpenAPI schema, in fresh interpreters.
+
+    :param Dict[str, str] env: The environment variables of the application.
+    :param int repeat: The number of interpreters started.
+    :param str cache_dir: The OpenAPI cache directory, emptied before each interpreter when it ends with "cold".
+    :return Tuple[float, float]: The median import and OpenAPI times, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        if cache_dir.endswith("cold"):
+            for filename in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, filename))
+        result = run(["-c", STARTUP_SCRIPT], {**env, "OPENAPI_CACHE_DIR": cache_dir})
+        timings.append(json.loads(result.stdout.splitlines()[-1]))
+    return statistics.median(timing[0] for timing in timings), statistics.median(timing[1] for timing in timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of interpreters started per mode")
+    parser.add_argument("--top", type=int, default=20, help="Number of modules and packages listed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = {"DATABASE_URL": f"sqlite:///{os.path.join(directory, 'mycelium.db')}"}
+        # Creates the database, so that every measured process starts against the same existing file
+        run(["-c", "import app.main"], env)
+        print_profile(profile_imports(env), args.top)
+
+        cold_dir = os.path.join(directory, "cold")
+        warm_dir = os.path.join(directory, "warm")
+        os.makedirs(cold_dir)
+        run(["-c", "import app.main"], {**env, "OPENAPI_CACHE_DIR": warm_dir})
+        modes = [
+            ("schema generated on first request", env, ""),
+            ("directory scan", {**env, "STATIC_REGISTRY": "false"}, ""),
+            ("schema generated at startup, cached", env, cold_dir),
+            ("schema loaded from cache", env, warm_dir),
+        ]
+        print(f"{'mode':<40} {'import':>10} {'first /docs':>12} {'total':>10}")
+        for name, mode_env, cache_dir in modes:
+            imported, documented = measure_startup(mode_env, args.repeat, cache_dir)
+            print(
+                f"{name:<40} {imported * 1000:>8.1f}ms {documented * 1000:>10.1f}ms "
+                f"{(imported + documented) * 1000:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
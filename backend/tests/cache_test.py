@@ -0,0 +1,125 @@
+import unittest
+from unittest import mock
+
+from app.utils import cache
+from app.utils.cache import LRUCache, data_contract_cache
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from helpers import create_test_app, create_test_engine, make_data_contract
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Test cases for the in-process LRU cache.
+    """
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test that the cache stays within its size bound by evicting the least recently used entries.
+        """
+        lru = LRUCache(max_bytes=10, ttl=60)
+        lru.put("a", "aaaa", lru.generation)
+        lru.put("b", "bbbb", lru.generation)
+        self.assertEqual(lru.get("a"), "aaaa")
+        lru.put("c", "cccc", lru.generation)
+        lru.put("d", "d" * 11, lru.generation)
+
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual((lru.get("a"), lru.get("c"), lru.get("d")), ("aaaa", "cccc", None))
+        stats = lru.stats()
+        self.assertEqual((stats["entries"], stats["size"]), (2, 8))
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (3, 2, 1))
+
+    def test_entries_expire(self):
+        """
+        Test that entries are not served once their time to live has elapsed.
+        """
+        lru = LRUCache(max_bytes=100, ttl=30)
+        with mock.patch.object(cache.time, "monotonic", return_value=1000.0):
+            lru.put("a", "aaaa", lru.generation)
+        with mock.patch.object(cache.time, "monotonic", return_value=1029.0):
+            self.assertEqual(lru.get("a"), "aaaa")
+        with mock.patch.object(cache.time, "monotonic", return_value=1030.0):
+            self.assertIsNone(lru.get("a"))
+        self.assertEqual((lru.stats()["expirations"], lru.stats()["entries"], lru.size), (1, 0, 0))
+
+    def test_invalidation_discards_concurrent_loads(self):
+        """
+        Test that a value loaded before an invalidation is not stored after it.
+        """
+        lru = LRUCache(max_bytes=100, ttl=60)
+        generation = lru.generation
+        lru.invalidate("a")
+        lru.put("a", "stale", generation)
+        self.assertIsNone(lru.get("a"))
+        lru.put("a", "fresh", lru.generation)
+        self.assertEqual(lru.get("a"), "fresh")
+
+
+class TestDataContractCache(unittest.TestCase):
+    """
+    Test cases for the cache of the stored data contracts.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh in-memory database and a test client for each test.
+        """
+        self.engine = create_test_engine()
+        self.client = TestClient(create_test_app(self.engine))
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self.record)
+
+    def tearDown(self):
+        """
+        Dispose of the in-memory database.
+        """
+        event.remove(self.engine, "before_cursor_execute", self.record)
+        self.engine.dispose()
+
+    def record(self, connection, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def test_get_is_served_from_cache(self):
+        """
+        Test that a data contract read again is served without querying the database, until it is written.
+        """
+        payload = make_data_contract("urn:datacontract:test:cached")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        first = self.client.get(url)
+
+        self.statements.clear()
+        second = self.client.get(url)
+        not_modified = self.client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        self.assertEqual(self.statements, [])
+        self.assertEqual((second.json(), second.headers["etag"]), (first.json(), first.headers["etag"]))
+        self.assertEqual(not_modified.status_code, 304)
+
+        patched = self.client.patch(url, content='{"tags": ["sales"]}')
+        self.assertEqual(self.client.get(url).headers["etag"], patched.headers["etag"])
+        payload["tags"] = ["orders"]
+        self.client.put(url, json=payload)
+        self.assertEqual(self.client.get(url).json()["data"]["tags"], ["orders"])
+        self.client.delete(url)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        stats = self.client.get("/cache/").json()["data"]["data_contracts"]
+        self.assertEqual((stats["hits"], stats["entries"]), (3, 0))
+        self.assertEqual(stats["max_bytes"], data_contract_cache.max_bytes)
+
+    def test_disabled_cache(self):
+        """
+        Test that a zero size bound disables the cache.
+        """
+        payload = make_data_contract("urn:datacontract:test:uncached")
+        self.client.post("/data_contract/", json=payload)
+        with mock.patch.object(data_contract_cache, "max_bytes", 0):
+            for _ in range(2):
+                self.assertEqual(self.client.get(f"/data_contract/{payload['id']}").status_code, 200)
+        self.assertEqual(data_contract_cache.stats()["entries"], 0)
+        self.assertEqual(data_contract_cache.hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
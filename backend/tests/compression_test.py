@@ -0,0 +1,156 @@
+import gzip
+import json
+import unittest
+from unittest import mock
+
+from app.utils import compression
+from app.utils.compression import PrecompressedCache, negotiate_encoding, precompressed_cache
+from fastapi.testclient import TestClient
+from helpers import create_test_app, create_test_engine, make_data_contract
+
+
+class TestCompression(unittest.TestCase):
+    """
+    Test cases for the response compression.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh in-memory database, a test client and an empty precompressed cache for each test.
+        """
+        self.engine = create_test_engine()
+        self.client = TestClient(create_test_app(self.engine))
+        precompressed_cache.clear()
+
+    def tearDown(self):
+        """
+        Dispose of the in-memory database.
+        """
+        self.engine.dispose()
+
+    def test_negotiate_encoding(self):
+        """
+        Test that brotli is preferred when available, and that refused encodings are not picked.
+        """
+        self.assertEqual(negotiate_encoding("gzip, deflate"), "gzip")
+        self.assertEqual(negotiate_encoding("gzip;q=0, identity"), None)
+        for refused in ("gzip;q=0.0", "gzip;q=0.00", "gzip; q = 0", "GZIP;Q=0", "gzip;q=invalid"):
+            self.assertEqual(negotiate_encoding(refused), None, refused)
+        self.assertEqual(negotiate_encoding("gzip;q=0.001"), "gzip")
+        self.assertEqual(negotiate_encoding(""), None)
+        with mock.patch.object(compression, "brotli", None):
+            self.assertEqual(negotiate_encoding("br, gzip"), "gzip")
+
+    def test_precompressed_cache_evicts_least_recently_used(self):
+        """
+        Test that the cache returns the same bytes on a hit and stays within its size bound.
+        """
+        bodies = [(str(index) * 5000).encode() for index in range(3)]
+        cache = PrecompressedCache(max_bytes=2 * len(gzip.compress(bodies[0])))
+
+        first = cache.get_or_compress(bodies[0], "gzip")
+        self.assertEqual(gzip.decompress(first), bodies[0])
+        self.assertIs(cache.get_or_compress(bodies[0], "gzip"), first)
+        cache.get_or_compress(bodies[1], "gzip")
+        cache.get_or_compress(bodies[2], "gzip")
+
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertLessEqual(cache.size, cache.max_bytes)
+        cache.get_or_compress(bodies[0], "gzip")
+        self.assertEqual(cache.misses, 4)
+
+    def test_get_serves_precompressed_document(self):
+        """
+        Test that a data contract is compressed once, then served from the cache while it is unchanged.
+        """
+        payload = make_data_contract("urn:datacontract:test:compressed")
+        self.client.post("/data_contract/", json=payload)
+
+        responses = [
+            self.client.get(f"/data_contract/{payload['id']}", headers={"Accept-Encoding": "gzip"}) for _ in range(2)
+        ]
+
+        for response in responses:
+            self.assertEqual(response.status_code, 200, response.text)
+            self.assertEqual(response.headers["content-encoding"], "gzip")
+            self.assertEqual(response.json()["data"]["id"], payload["id"])
+        self.assertEqual((precompressed_cache.hits, precompressed_cache.misses), (1, 1))
+
+        identity = self.client.get(f"/data_contract/{payload['id']}", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("content-encoding", identity.headers)
+        self.assertEqual(identity.json(), responses[0].json())
+
+    def test_compressed_responses_have_their_own_etag(self):
+        """
+        Test that the strong ETag of a compressed body has the encoding as a suffix, and is still accepted by the
+        conditional requests.
+        """
+        payload = make_data_contract("urn:datacontract:test:etags")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+
+        identity = self.client.get(url, headers={"Accept-Encoding": "identity"}).headers["etag"]
+        etags = {identity}
+        for path in (url, "/data_contract/"):
+            compressed = self.client.get(path, headers={"Accept-Encoding": "gzip"})
+            self.assertEqual(compressed.headers["content-encoding"], "gzip")
+            self.assertTrue(compressed.headers["etag"].endswith('-gzip"'), compressed.headers["etag"])
+            etags.add(compressed.headers["etag"])
+        self.assertEqual(len(etags), 3)
+        gzipped = self.client.get(url, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        self.assertEqual(gzipped, f'{identity[:-1]}-gzip"')
+
+        not_modified = self.client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped})
+        self.assertEqual((not_modified.status_code, not_modified.headers["etag"]), (304, gzipped))
+        patched = self.client.patch(url, content='{"tags": ["sales"]}', headers={"If-Match": gzipped})
+        self.assertEqual(patched.status_code, 200, patched.text)
+
+    def test_list_is_compressed_above_threshold(self):
+        """
+        Test that the middleware compresses large responses, and leaves small ones as is.
+        """
+        self.client.post("/data_contract/", json=make_data_contract("urn:datacontract:test:listed"))
+
+        listed = self.client.get("/data_contract/", headers={"Accept-Encoding": "gzip"})
+        ids = self.client.get("/data_contract/", params={"fields": "id"}, headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(listed.headers["content-encoding"], "gzip")
+        self.assertEqual(len(listed.json()["data"]), 1)
+        self.assertNotIn("content-encoding", ids.headers)
+
+    def test_streamed_response_is_compressed(self):
+        """
+        Test that streamed responses are compressed chunk by chunk into a single gzip stream.
+        """
+        ids = [f"urn:datacontract:test:streamed-{index}" for index in range(3)]
+        for id in ids:
+            self.client.post("/data_contract/", json=make_data_contract(id))
+
+        exported = self.client.get("/data_contract/export", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(exported.headers["content-encoding"], "gzip")
+        self.assertNotIn("content-length", exported.headers)
+        self.assertEqual([json.loads(line)["id"] for line in exported.text.splitlines()], ids)
+
+    def test_brotli(self):
+        """
+        Test that clients accepting brotli get brotli-compressed responses, streamed ones included.
+        """
+        if compression.brotli is None:
+            self.skipTest("The brotli extra is not installed")
+        payload = make_data_contract("urn:datacontract:test:brotli")
+        self.client.post("/data_contract/", json=payload)
+
+        fetched = self.client.get(f"/data_contract/{payload['id']}", headers={"Accept-Encoding": "br"})
+        exported = self.client.get(
+            "/data_contract/export", params={"format": "ndjson"}, headers={"Accept-Encoding": "br"}
+        )
+
+        self.assertEqual(fetched.headers["content-encoding"], "br")
+        self.assertEqual(fetched.json()["data"]["id"], payload["id"])
+        self.assertEqual(exported.headers["content-encoding"], "br")
+        self.assertEqual(len(exported.text.splitlines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
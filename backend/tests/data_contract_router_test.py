@@ -0,0 +1,763 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from app.crud import data_contract_async
+from app.database.manager import db_manager
+from app.database.writer import write_queue
+from app.models.data_contract import DataContract as DBDataContract
+from app.routers import data_contract as data_contract_router
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.cache import data_contract_cache
+from app.utils.config import settings
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+from helpers import create_test_app, create_test_engine, make_data_contract
+
+
+class TestDataContractRouter(unittest.TestCase):
+    """
+    Test cases for the data contract routes.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh in-memory database and a test client for each test.
+        """
+        self.engine = create_test_engine()
+        self.client = TestClient(create_test_app(self.engine))
+
+    def tearDown(self):
+        """
+        Dispose of the in-memory database.
+        """
+        self.engine.dispose()
+
+    def create_contracts(self, count: int) -> list:
+        """
+        Creates `count` data contracts through the API and returns their IDs.
+        """
+        ids = [f"urn:datacontract:test:{i:03d}" for i in range(count)]
+        for id in ids:
+            response = self.client.post("/data_contract/", json=make_data_contract(id))
+            self.assertEqual(response.status_code, 201, response.text)
+        return ids
+
+    def test_list_paginates_with_cursor(self):
+        """
+        Test that listing walks through every data contract exactly once, page by page.
+        """
+        ids = self.create_contracts(5)
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.client.get("/data_contract/", params=params)
+            self.assertEqual(response.status_code, 200, response.text)
+            body = response.json()
+            self.assertLessEqual(len(body["data"]), 2)
+            seen.extend(contract["id"] for contract in body["data"])
+            pages += 1
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, ids)
+        self.assertEqual(pages, 3)
+
+    def test_list_last_page_has_no_cursor(self):
+        """
+        Test that a page holding the remaining data contracts does not return a cursor.
+        """
+        self.create_contracts(2)
+
+        response = self.client.get("/data_contract/", params={"limit": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]), 2)
+        self.assertIsNone(response.json()["next_cursor"])
+
+    def test_list_rejects_invalid_cursor(self):
+        """
+        Test that a malformed cursor is rejected with a 400 error.
+        """
+        response = self.client.get("/data_contract/", params={"cursor": "not-a-cursor!"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_rejects_out_of_range_limit(self):
+        """
+        Test that the page size is bounded.
+        """
+        response = self.client.get("/data_contract/", params={"limit": 0})
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_list_with_fields_returns_summaries(self):
+        """
+        Test that a sparse fieldset only returns the ID and the requested keys.
+        """
+        ids = self.create_contracts(3)
+
+        response = self.client.get(
+            "/data_contract/", params={"fields": "info.title,info.version,info.owner", "limit": 2}
+        )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        body = response.json()
+        self.assertEqual([summary["id"] for summary in body["data"]], ids[:2])
+        self.assertEqual(set(body["data"][0]), {"id", "info"})
+        self.assertEqual(set(body["data"][0]["info"]), {"title", "version", "owner"})
+        self.assertIsNotNone(body["next_cursor"])
+
+    def test_get_with_fields_returns_whole_sections(self):
+        """
+        Test that a sparse fieldset can select whole sections of a data contract.
+        """
+        payload = make_data_contract("urn:datacontract:test:fields")
+        self.client.post("/data_contract/", json=payload)
+
+        response = self.client.get(f"/data_contract/{payload['id']}", params={"fields": "tags,info.title"})
+
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(
+            response.json()["data"],
+            {"id": payload["id"], "tags": payload["tags"], "info": {"title": payload["info"]["title"]}},
+        )
+
+    def test_get_with_fields_projects_compressed_section(self):
+        """
+        Test that single keys of a compressed section can be selected.
+        """
+        payload = make_data_contract("urn:datacontract:test:compressed-fields")
+        self.client.post("/data_contract/", json=payload)
+
+        response = self.client.get(f"/data_contract/{payload['id']}", params={"fields": "models.orders,models.missing"})
+
+        self.assertEqual(response.status_code, 200, response.text)
+        orders = DataContract.model_validate(payload).model_dump(mode="json", by_alias=True)["models"]["orders"]
+        self.assertEqual(response.json()["data"]["models"], {"orders": orders, "missing": None})
+
+    def test_sections_are_stored_with_field_aliases(self):
+        """
+        Test that the sections served by the projections and the batch reads use the field aliases, like the
+        stored document, whether the data contract was created or patched.
+        """
+        payload = make_data_contract("urn:datacontract:test:aliases")
+        payload["models"]["orders"]["fields"]["referenced"] = {"type": "string", "$ref": "#/definitions/order_id"}
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        patch = {"models": {"orders": {"fields": {"patched": {"type": "string", "$ref": "#/definitions/order_id"}}}}}
+        self.client.patch(url, content=json.dumps(patch), headers={"Content-Type": "application/merge-patch+json"})
+
+        fields = self.client.get(url).json()["data"]["models"]["orders"]["fields"]
+        projected = self.client.get(url, params={"fields": "models"}).json()["data"]["models"]["orders"]["fields"]
+        batch = self.client.post("/data_contract/batch_get", json={"ids": [payload["id"]]}).json()["data"][0]
+        for name in ("referenced", "patched"):
+            self.assertEqual(fields[name]["$ref"], "#/definitions/order_id")
+            self.assertEqual(projected[name], fields[name])
+            self.assertEqual(batch["models"]["orders"]["fields"][name], fields[name])
+
+    def test_fields_rejects_unknown_field(self):
+        """
+        Test that unknown or non-projectable fields are rejected with a 400 error.
+        """
+        self.assertEqual(self.client.get("/data_contract/", params={"fields": "unknown"}).status_code, 400)
+        self.assertEqual(
+            self.client.get("/data_contract/", params={"fields": "data_contract_specification.x"}).status_code, 400
+        )
+
+    def test_export_streams_ndjson(self):
+        """
+        Test that the export streams every data contract, one JSON document per line.
+        """
+        ids = self.create_contracts(3)
+
+        response = self.client.get("/data_contract/export", params={"format": "ndjson"})
+
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        lines = response.text.splitlines()
+        self.assertEqual([json.loads(line)["id"] for line in lines], ids)
+
+    def test_export_serves_stored_documents(self):
+        """
+        Test that the export writes the stored documents as served by GET, field aliases included.
+        """
+        payload = make_data_contract("urn:datacontract:test:export")
+        payload["models"]["orders"]["fields"]["referenced"] = {"type": "string", "$ref": "#/definitions/order_id"}
+        self.client.post("/data_contract/", json=payload)
+
+        line = self.client.get("/data_contract/export").text.rstrip("\n")
+
+        self.assertEqual(json.loads(line)["models"]["orders"]["fields"]["referenced"]["$ref"], "#/definitions/order_id")
+        self.assertIn(line, self.client.get(f"/data_contract/{payload['id']}").text)
+        self.client.delete(f"/data_contract/{payload['id']}")
+        self.assertEqual(self.client.post("/data_contract/", content=line).status_code, 201)
+        self.assertIn(line, self.client.get(f"/data_contract/{payload['id']}").text)
+
+    def test_bulk_create_reports_each_item(self):
+        """
+        Test that a bulk creation inserts the valid data contracts and reports the invalid ones.
+        """
+        self.create_contracts(1)
+        invalid = make_data_contract("urn:datacontract:test:invalid")
+        del invalid["info"]
+        payload = [
+            make_data_contract("urn:datacontract:test:bulk-0"),
+            invalid,
+            make_data_contract("urn:datacontract:test:000"),
+            make_data_contract("urn:datacontract:test:bulk-0"),
+            make_data_contract("urn:datacontract:test:bulk-1"),
+        ]
+
+        response = self.client.post("/data_contract/bulk", params={"chunk_size": 1}, json=payload)
+
+        self.assertEqual(response.status_code, 200, response.text)
+        body = response.json()
+        self.assertEqual((body["created"], body["failed"]), (2, 3))
+        self.assertEqual([result["success"] for result in body["data"]], [True, False, False, False, True])
+        self.assertIn("info", body["data"][1]["error"])
+        listed = self.client.get("/data_contract/", params={"fields": "id"}).json()["data"]
+        self.assertEqual(
+            [contract["id"] for contract in listed],
+            ["urn:datacontract:test:000", "urn:datacontract:test:bulk-0", "urn:datacontract:test:bulk-1"],
+        )
+
+    def test_batch_get_returns_found_and_missing(self):
+        """
+        Test that a batch retrieval returns the found data contracts and the missing IDs separately.
+        """
+        ids = self.create_contracts(3)
+
+        response = self.client.post(
+            "/data_contract/batch_get", json={"ids": [ids[2], "urn:datacontract:test:unknown", ids[0], ids[2]]}
+        )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        body = response.json()
+        self.assertEqual([contract["id"] for contract in body["data"]], [ids[2], ids[0]])
+        self.assertEqual(body["missing"], ["urn:datacontract:test:unknown"])
+
+    def test_batch_delete_returns_deleted_and_missing(self):
+        """
+        Test that a batch deletion removes the found data contracts and reports the missing IDs.
+        """
+        ids = self.create_contracts(3)
+
+        response = self.client.post("/data_contract/batch_delete", json={"ids": [ids[0], ids[1], "unknown"]})
+
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["deleted"], ids[:2])
+        self.assertEqual(response.json()["missing"], ["unknown"])
+        listed = self.client.get("/data_contract/", params={"fields": "id"}).json()["data"]
+        self.assertEqual([contract["id"] for contract in listed], ids[2:])
+
+    def test_create_validates_raw_body(self):
+        """
+        Test that an invalid body is reported like FastAPI's body validation, and that the body is documented.
+        """
+        response = self.client.post("/data_contract/", json={"id": 1})
+        self.assertEqual(response.status_code, 422)
+        self.assertIn(["body", "id"], [error["loc"] for error in response.json()["detail"]])
+
+        response = self.client.post(
+            "/data_contract/", content=b"{not json", headers={"content-type": "application/json"}
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["type"], "json_invalid")
+
+        openapi = self.client.get("/openapi.json").json()
+        body = openapi["paths"]["/data_contract/"]["post"]["requestBody"]["content"]["application/json"]
+        self.assertIn(body["schema"]["$ref"].rsplit("/", 1)[1], openapi["components"]["schemas"])
+
+    def test_create_serves_stored_document(self):
+        """
+        Test that a created data contract is answered with the stored document and its ETag, as served by GET.
+        """
+        payload = make_data_contract("urn:datacontract:test:created")
+
+        created = self.client.post("/data_contract/", json=payload)
+
+        self.assertEqual(created.status_code, 201, created.text)
+        fetched = self.client.get(f"/data_contract/{payload['id']}")
+        self.assertEqual(created.headers["etag"], fetched.headers["etag"])
+        self.assertEqual(created.json()["data"], fetched.json()["data"])
+        self.assertEqual(created.json()["message"], " ✅ Data contract created successfully")
+
+    def test_get_serves_stored_document(self):
+        """
+        Test that the stored document is served like the validated data contract, with or without a document.
+        """
+        payload = make_data_contract("urn:datacontract:test:document")
+        self.client.post("/data_contract/", json=payload)
+        expected = DataContract.model_validate(payload).model_dump(mode="json", by_alias=True)
+
+        for document in ("stored", "missing"):
+            if document == "missing":
+                with self.engine.begin() as connection:
+                    connection.execute(update(DBDataContract).values(document=None))
+
+            response = self.client.get("/data_contract/urn:datacontract:test:document")
+            self.assertEqual(response.status_code, 200, response.text)
+            self.assertEqual(response.json()["data"], expected)
+            self.assertEqual(response.json()["message"], " ✅ Data contract retrieved successfully")
+
+            response = self.client.get("/data_contract/", params={"limit": 1})
+            self.assertEqual(response.status_code, 200, response.text)
+            self.assertEqual(
+                response.json(),
+                {"message": " ✅ Data contracts retrieved successfully", "data": [expected], "next_cursor": None},
+            )
+
+    def capture_statements(self) -> list:
+        """
+        Records the SQL statements executed from now on, on the engine serving the requests.
+        """
+        engine = self.async_engine.sync_engine if hasattr(self, "async_engine") else self.engine
+        statements = []
+
+        def record(connection, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", record)
+        return statements
+
+    def test_get_answers_not_modified(self):
+        """
+        Test that a matching If-None-Match is answered with a 304 after reading the content hash only.
+        """
+        payload = make_data_contract("urn:datacontract:test:etag")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        etag = self.client.get(url).headers["etag"]
+
+        data_contract_cache.clear()
+        statements = self.capture_statements()
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual((response.headers["etag"], response.content), (etag, b""))
+        self.assertEqual(len(statements), 1)
+        self.assertIn("content_hash", statements[0])
+        self.assertNotEqual(self.client.get(url, params={"fields": "id"}).headers["etag"], etag)
+
+        payload["info"]["title"] = "Orders Renamed"
+        self.client.put(url, json=payload)
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertNotEqual(response.headers["etag"], etag)
+
+    def test_etag_describes_the_content_read(self):
+        """
+        Test that a data contract written after its content hash was read, and before its content was, is served with
+        the ETag of the content read, with or without a projection.
+        """
+        payload = make_data_contract("urn:datacontract:test:etag")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        current = {
+            params["fields"] if params else None: self.client.get(url, params=params).headers["etag"]
+            for params in (None, {"fields": "id,info"})
+        }
+        listed = self.client.get("/data_contract/", params={"fields": "id"}).headers["etag"]
+        data_contract_cache.clear()
+
+        # The content hashes read before a write, with the content read after it
+        with mock.patch.object(
+            data_contract_router, "get_data_contract_content_hash", return_value="0" * 64
+        ), mock.patch.object(
+            data_contract_async, "get_data_contract_content_hash", mock.AsyncMock(return_value="0" * 64)
+        ), mock.patch.object(
+            data_contract_router, "list_data_contract_content_hashes", return_value=(["0" * 64], None)
+        ), mock.patch.object(
+            data_contract_async, "list_data_contract_content_hashes", mock.AsyncMock(return_value=(["0" * 64], None))
+        ):
+            for fields, etag in current.items():
+                response = self.client.get(url, params={"fields": fields} if fields else None)
+                self.assertEqual(response.headers["etag"], etag)
+            response = self.client.get("/data_contract/", params={"fields": "id"})
+            self.assertEqual(response.headers["etag"], listed)
+
+    def test_list_answers_not_modified(self):
+        """
+        Test that the ETag of a page changes with the data contracts it holds.
+        """
+        self.create_contracts(2)
+        etag = self.client.get("/data_contract/").headers["etag"]
+
+        statements = self.capture_statements()
+        response = self.client.get("/data_contract/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(statements), 1)
+        self.client.post("/data_contract/", json=make_data_contract("urn:datacontract:test:new"))
+        response = self.client.get("/data_contract/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(len(response.json()["data"]), 3)
+        self.assertNotEqual(
+            self.client.get("/data_contract/", params={"fields": "id"}).headers["etag"], response.headers["etag"]
+        )
+
+    def test_compact_omits_null_fields(self):
+        """
+        Test that the compact mode serves the data contracts without their null fields, under their own ETag.
+        """
+        payload = make_data_contract("urn:datacontract:test:compact")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        contract = DataContract.model_validate(payload)
+        expected = contract.model_dump(mode="json", by_alias=True, exclude_none=True)
+        self.assertLess(len(json.dumps(expected)), len(json.dumps(contract.model_dump(mode="json", by_alias=True))))
+
+        response = self.client.get(url, params={"compact": True})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["data"], expected)
+        etag = response.headers["etag"]
+        self.assertNotEqual(self.client.get(url).headers["etag"], etag)
+        self.assertEqual(
+            self.client.get(url, params={"compact": True}, headers={"If-None-Match": etag}).status_code, 304
+        )
+
+        response = self.client.get("/data_contract/", params={"compact": True})
+        self.assertEqual(response.json()["data"], [expected])
+        self.assertNotEqual(self.client.get("/data_contract/").headers["etag"], response.headers["etag"])
+        export = self.client.get("/data_contract/export", params={"compact": True}).text.rstrip("\n")
+        self.assertIn(export, self.client.get(url, params={"compact": True}).text)
+
+        response = self.client.put(url, params={"compact": True}, json=payload)
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["data"], expected)
+        response = self.client.patch(
+            url, params={"compact": True}, json={"tags": ["orders"]}, headers={"If-Match": response.headers["etag"]}
+        )
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.headers["etag"], self.client.get(url).headers["etag"])
+        response = self.client.delete(url, params={"compact": True})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertNotIn(None, response.json()["data"].values())
+
+    def test_patch_merges_sections(self):
+        """
+        Test that a merge patch only writes the patched columns, and stores the same document as a full update.
+        """
+        payload = make_data_contract("urn:datacontract:test:patch")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+
+        statements = self.capture_statements()
+        response = self.client.patch(
+            url,
+            content=json.dumps({"info": {"owner": "Sales Team", "contact": None}, "tags": ["sales"], "terms": None}),
+            headers={"Content-Type": "application/merge-patch+json"},
+        )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        updates = [statement for statement in statements if statement.startswith("UPDATE data_contracts")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn("info_owner=", updates[0])
+        self.assertNotIn("models=", updates[0])
+        payload["info"]["owner"] = "Sales Team"
+        del payload["info"]["contact"]
+        payload.update(tags=["sales"], terms=None)
+        expected = DataContract.model_validate(payload).model_dump(mode="json", by_alias=True)
+        self.assertEqual(response.json()["data"], expected)
+        fetched = self.client.get(url)
+        self.assertEqual(fetched.json()["data"], expected)
+        self.assertEqual(fetched.headers["etag"], response.headers["etag"])
+        self.client.put(url, json=payload)
+        self.assertEqual(self.client.get(url).headers["etag"], response.headers["etag"])
+        listed = self.client.get("/data_contract/", params={"owner": "Sales Team", "tag": "sales", "fields": "id"})
+        self.assertEqual([summary["id"] for summary in listed.json()["data"]], [payload["id"]])
+
+    def test_patch_and_update_store_the_same_document(self):
+        """
+        Test that a merge patch and a full update of the same content store the same bytes, and have the same ETag,
+        including for the values that the JSON serializers format differently.
+        """
+        payload = make_data_contract("urn:datacontract:test:patch")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        patch = {
+            "info": {"description": "Orders\u2028placed in the shop, en été"},
+            "definitions": {"amount": {"name": "amount", "type": "decimal", "minimum": 1e-7, "maximum": 1e20}},
+        }
+
+        patched = self.client.patch(
+            url, content=json.dumps(patch), headers={"Content-Type": "application/merge-patch+json"}
+        )
+        self.assertEqual(patched.status_code, 200, patched.text)
+        patched_body = self.client.get(url).content
+        payload["info"].update(patch["info"])
+        payload["definitions"].update(patch["definitions"])
+        updated = self.client.put(url, json=payload)
+        self.assertEqual(updated.status_code, 200, updated.text)
+
+        self.assertEqual(updated.headers["etag"], patched.headers["etag"])
+        self.assertEqual(self.client.get(url).content, patched_body)
+
+    def test_patch_rejects_invalid_patches(self):
+        """
+        Test that invalid merge patches are rejected without modifying the data contract.
+        """
+        payload = make_data_contract("urn:datacontract:test:patch")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        etag = self.client.get(url).headers["etag"]
+
+        for patch, status_code in (
+            ("[]", 400),
+            ("{", 400),
+            ('{"owner": "Sales Team"}', 400),
+            ('{"id": "urn:datacontract:test:other"}', 400),
+            ('{"info": null}', 422),
+            ('{"info": {"title": 3}, "tags": "sales"}', 422),
+        ):
+            response = self.client.patch(url, content=patch)
+            self.assertEqual(response.status_code, status_code, patch)
+        self.assertEqual(
+            [error["loc"] for error in response.json()["detail"]], [["body", "info", "title"], ["body", "tags"]]
+        )
+        self.assertEqual(
+            self.client.patch("/data_contract/urn:datacontract:test:missing", content="{}").status_code, 404
+        )
+        self.assertEqual(self.client.get(url).headers["etag"], etag)
+
+    def race_next_update(self) -> list:
+        """
+        Commits a concurrent write of every data contract right before the next UPDATE of the data contracts.
+        """
+        engine = self.async_engine.sync_engine if hasattr(self, "async_engine") else self.engine
+        raced = []
+
+        def write_concurrently(connection, cursor, statement, *args):
+            if statement.startswith("UPDATE data_contracts") and not raced:
+                cursor.execute("UPDATE data_contracts SET version = version + 1, content_hash = 'concurrent'")
+                connection.connection.dbapi_connection.commit()
+                raced.append(statement)
+
+        event.listen(engine, "before_cursor_execute", write_concurrently)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", write_concurrently)
+        return raced
+
+    def test_conditional_writes(self):
+        """
+        Test that writes are only applied when their If-Match header matches the current ETag.
+        """
+        payload = make_data_contract("urn:datacontract:test:if-match")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        etag = self.client.get(url).headers["etag"]
+
+        payload["tags"] = ["sales"]
+        updated = self.client.put(url, json=payload, headers={"If-Match": etag})
+        self.assertEqual(updated.status_code, 200, updated.text)
+        self.assertEqual(updated.json()["data"]["tags"], ["sales"])
+        self.assertNotEqual(updated.headers["etag"], etag)
+
+        self.assertEqual(self.client.put(url, json=payload, headers={"If-Match": etag}).status_code, 412)
+        for if_match in (etag, f"W/{updated.headers['etag']}"):
+            response = self.client.patch(url, content='{"tags": ["stale"]}', headers={"If-Match": if_match})
+            self.assertEqual(response.status_code, 412, if_match)
+        patched = self.client.patch(url, content='{"tags": []}', headers={"If-Match": updated.headers["etag"]})
+        self.assertEqual(patched.status_code, 200, patched.text)
+        self.assertEqual(self.client.patch(url, content="{}", headers={"If-Match": "*"}).status_code, 200)
+        self.assertEqual(self.client.get(url).headers["etag"], patched.headers["etag"])
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.scalar(select(DBDataContract.version)), 4)
+
+    def test_concurrent_writes_are_detected(self):
+        """
+        Test that a write racing with another one is rejected if it is conditional, and merged again otherwise.
+        """
+        payload = make_data_contract("urn:datacontract:test:race")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        etag = self.client.get(url).headers["etag"]
+
+        self.race_next_update()
+        conflicting = self.client.patch(url, content='{"tags": ["sales"]}', headers={"If-Match": etag})
+        self.assertEqual(conflicting.status_code, 412, conflicting.text)
+        self.assertEqual(self.client.get(url, headers={"Accept-Encoding": "identity"}).headers["etag"], '"concurrent"')
+
+        raced = self.race_next_update()
+        statements = self.capture_statements()
+        patched = self.client.patch(url, content='{"tags": ["sales"]}')
+        self.assertEqual(patched.status_code, 200, patched.text)
+        self.assertEqual(len(raced), 1)
+        self.assertEqual(len([statement for statement in statements if statement.startswith("UPDATE")]), 2)
+        self.assertEqual(patched.json()["data"]["tags"], ["sales"])
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.scalar(select(DBDataContract.version)), 4)
+
+    def test_list_filters(self):
+        """
+        Test that the list filters on the owner, the title prefix and the version of the data contracts.
+        """
+        contracts = [
+            ("urn:datacontract:test:a", "Orders Latest", "2.0.0", "Checkout Team"),
+            ("urn:datacontract:test:b", "Orders Archive", "2.1.3", "Checkout Team"),
+            ("urn:datacontract:test:c", "Orders Legacy", "1.4.0", "Checkout Team"),
+            ("urn:datacontract:test:d", "Payments", "2.0.0", "Billing Team"),
+        ]
+        for id, title, version, owner in contracts:
+            payload = make_data_contract(id)
+            payload["info"].update(title=title, version=version, owner=owner)
+            response = self.client.post("/data_contract/", json=payload)
+            self.assertEqual(response.status_code, 201, response.text)
+
+        def list_ids(**params) -> list:
+            response = self.client.get("/data_contract/", params=params)
+            self.assertEqual(response.status_code, 200, response.text)
+            return [contract["id"].rsplit(":", 1)[1] for contract in response.json()["data"]]
+
+        self.assertEqual(list_ids(owner="Checkout Team"), ["a", "b", "c"])
+        self.assertEqual(list_ids(title_prefix="Orders L"), ["a", "c"])
+        self.assertEqual(list_ids(title_prefix="orders"), [])
+        self.assertEqual(list_ids(title_prefix="Orders L\U0010ffff"), [])
+        self.assertEqual(list_ids(title_prefix="\U0010ffff\U0010ffff"), [])
+        self.assertEqual(list_ids(title_prefix="Orders L\ud7ff"), [])
+        self.assertEqual(list_ids(version="2.x"), ["a", "b", "d"])
+        self.assertEqual(list_ids(version="2.*", owner="Checkout Team", limit=1, fields="info.version"), ["a"])
+        self.assertEqual(list_ids(version="2.0.0"), ["a", "d"])
+
+    def test_list_filters_by_tags(self):
+        """
+        Test that the tag filters follow the tags through creation, update and deletion.
+        """
+        for id, tags in [("a", ["orders", "checkout"]), ("b", ["orders"]), ("c", ["payments"]), ("d", None)]:
+            response = self.client.post(
+                "/data_contract/", json=make_data_contract(f"urn:datacontract:test:{id}", tags=tags)
+            )
+            self.assertEqual(response.status_code, 201, response.text)
+        self.client.post(
+            "/data_contract/bulk", json=[make_data_contract("urn:datacontract:test:e", tags=["checkout", "checkout"])]
+        )
+
+        def list_ids(**params) -> list:
+            response = self.client.get("/data_contract/", params=params)
+            self.assertEqual(response.status_code, 200, response.text)
+            return [contract["id"].rsplit(":", 1)[1] for contract in response.json()["data"]]
+
+        self.assertEqual(list_ids(tag="orders"), ["a", "b"])
+        self.assertEqual(list_ids(tags_all="orders,checkout"), ["a"])
+        self.assertEqual(list_ids(tags_any="checkout,payments"), ["a", "c", "e"])
+        self.assertEqual(list_ids(tag="checkout", tags_any="orders,payments"), ["a"])
+
+        self.client.put("/data_contract/urn:datacontract:test:b", json=make_data_contract("urn:datacontract:test:b"))
+        self.client.delete("/data_contract/urn:datacontract:test:a")
+        self.client.post("/data_contract/batch_delete", json={"ids": ["urn:datacontract:test:c"]})
+
+        response = self.client.get("/data_contract/tags")
+        self.assertEqual(response.status_code, 200, response.text)
+        # "b" now carries the example tags: checkout, orders and s3
+        self.assertEqual(
+            response.json()["data"],
+            [{"tag": "checkout", "count": 2}, {"tag": "orders", "count": 1}, {"tag": "s3", "count": 1}],
+        )
+        self.assertEqual(list_ids(tag="s3"), ["b"])
+
+
+class TestDataContractRouterAsync(TestDataContractRouter):
+    """
+    Runs the data contract route test cases with the async database sessions.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh database file, shared by the sync and async engines, and a test client for each test.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, "mycelium.db")
+        self.engine = create_engine(f"sqlite:///{path}")
+        db_manager.Base.metadata.create_all(bind=self.engine)
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.client = TestClient(create_test_app(self.engine, self.async_engine))
+
+    def tearDown(self):
+        """
+        Dispose of the engines and remove the database file.
+        """
+        asyncio.run(self.async_engine.dispose())
+        self.engine.dispose()
+        self.directory.cleanup()
+
+
+class TestDataContractRouterFastJSON(TestDataContractRouter):
+    """
+    Runs the data contract route test cases in the fast JSON mode (orjson responses and JSON columns).
+    """
+
+    def setUp(self):
+        """
+        Enable the fast JSON mode before setting up the database and the test client.
+        """
+        patcher = mock.patch.object(settings, "FAST_JSON", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+        self.assertIn("json_serializer", db_manager.get_json_options())
+
+
+class TestDataContractRouterGroupCommit(TestDataContractRouter):
+    """
+    Runs the data contract route test cases with the writes committed in groups by the write queue.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh database file, the write queue writing to it, and a test client for each test.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.directory.name, 'mycelium.db')}")
+        db_manager.Base.metadata.create_all(bind=self.engine)
+        write_queue.start(self.engine)
+        self.client = TestClient(create_test_app(self.engine))
+
+    def tearDown(self):
+        """
+        Stop the write queue, dispose of the engine and remove the database file.
+        """
+        write_queue.stop()
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    @unittest.skip("The writes of a group hold the write lock from their first read, so no other write can race them")
+    def test_concurrent_writes_are_detected(self):
+        pass
+
+
+@unittest.skipUnless(os.getenv("TEST_POSTGRES_URL"), "TEST_POSTGRES_URL is not set")
+class TestDataContractRouterPostgres(TestDataContractRouter):
+    """
+    Runs the data contract route test cases against a PostgreSQL database (e.g. a local container).
+    """
+
+    def setUp(self):
+        """
+        Set up fresh tables in the PostgreSQL database and a test client for each test.
+        """
+        self.engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+        db_manager.Base.metadata.drop_all(bind=self.engine)
+        db_manager.Base.metadata.create_all(bind=self.engine)
+        self.client = TestClient(create_test_app(self.engine))
+
+    def tearDown(self):
+        """
+        Drop the tables and dispose of the engine.
+        """
+        db_manager.Base.metadata.drop_all(bind=self.engine)
+        self.engine.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from app.database.manager import DatabaseManager, db_manager
+from app.crud.data_contract import (
+    backfill_data_contract_documents,
+    backfill_data_contract_tags,
+    backfill_info_columns,
+    compress_data_contracts,
+)
+from app.database.types import COMPRESSED_MARKER
+from app.utils.tools import content_hash
+from app.models.data_contract import DataContract as DBDataContract
+from app.models.data_contract_tag import DataContractTag as DBDataContractTag
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+from helpers import make_data_contract
+
+
+class TestDatabaseManager(unittest.TestCase):
+    """
+    Test cases for the database manager.
+    """
+
+    def setUp(self):
+        """
+        Point the database manager to a temporary SQLite file.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "mycelium.db")
+        self.previous = (db_manager.db_url, db_manager.engine, db_manager.SessionLocal)
+        db_manager.db_url = f"sqlite:///{self.path}"
+        db_manager.setup_engine()
+
+    def tearDown(self):
+        """
+        Restore the database manager and remove the temporary file.
+        """
+        db_manager.engine.dispose()
+        db_manager.db_url, db_manager.engine, db_manager.SessionLocal = self.previous
+        self.directory.cleanup()
+
+    def test_sqlite_profile_is_applied(self):
+        """
+        Test that every connection is configured with the production SQLite profile.
+        """
+        with db_manager.engine.connect() as connection:
+            pragma = lambda name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()  # noqa: E731
+            self.assertEqual(pragma("journal_mode"), "wal")
+            self.assertEqual(pragma("synchronous"), 1)  # NORMAL
+            self.assertEqual(pragma("busy_timeout"), 5000)
+            self.assertEqual(pragma("temp_store"), 2)  # MEMORY
+            self.assertEqual(pragma("cache_size"), -64 * 1024)
+
+    def test_writer_is_not_blocked_by_open_reader(self):
+        """
+        Test that a write can commit while another connection holds an open read transaction.
+        """
+        with db_manager.engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            connection.execute(text("INSERT INTO items VALUES (1)"))
+
+        reader = sqlite3.connect(self.path, isolation_level=None, timeout=0)
+        try:
+            reader.execute("BEGIN")
+            self.assertEqual(reader.execute("SELECT COUNT(*) FROM items").fetchone(), (1,))
+
+            with db_manager.engine.begin() as connection:
+                connection.execute(text("INSERT INTO items VALUES (2)"))
+
+            # The open read transaction keeps its snapshot until it ends
+            self.assertEqual(reader.execute("SELECT COUNT(*) FROM items").fetchone(), (1,))
+            reader.execute("COMMIT")
+            self.assertEqual(reader.execute("SELECT COUNT(*) FROM items").fetchone(), (2,))
+        finally:
+            reader.close()
+
+    def test_upgrade_tables_backfills_info_columns(self):
+        """
+        Test that the columns and tables added since a database was created are added to it and populated.
+        """
+        payload = make_data_contract("urn:datacontract:test:legacy")
+        with db_manager.engine.begin() as connection:
+            connection.execute(
+                text(
+                    "CREATE TABLE data_contracts (id VARCHAR PRIMARY KEY, data_contract_specification VARCHAR NOT NULL, "
+                    "info JSON NOT NULL, servers JSON, terms JSON, models JSON, definitions JSON, examples JSON, "
+                    "service_level JSON, quality JSON, links JSON, tags JSON)"
+                )
+            )
+            connection.execute(
+                DBDataContract.__table__.insert().values(
+                    id=payload["id"], data_contract_specification="0.9.3", info=payload["info"], tags=["orders"]
+                )
+            )
+
+        db_manager.create_tables()
+        db_manager.upgrade_tables()
+        with db_manager.get_session_factory()() as db:
+            self.assertEqual(backfill_info_columns(db), 1)
+            self.assertEqual(backfill_data_contract_tags(db), 1)
+            self.assertEqual(backfill_data_contract_tags(db), 0)
+            self.assertEqual(backfill_data_contract_documents(db), 1)
+            document, stored_hash = db.execute(select(DBDataContract.document, DBDataContract.content_hash)).one()
+            self.assertEqual(stored_hash, content_hash(document))
+            self.assertEqual(db.scalar(select(DBDataContract.version)), 1)
+            row = db.execute(select(DBDataContract.info_title, DBDataContract.info_owner)).one()
+            self.assertEqual(db.execute(select(DBDataContractTag.tag)).scalars().all(), ["orders"])
+
+        self.assertEqual(tuple(row), (payload["info"]["title"], payload["info"]["owner"]))
+        indexes = {index["name"] for index in inspect(db_manager.engine).get_indexes("data_contracts")}
+        self.assertIn("ix_data_contracts_info_owner", indexes)
+
+    def test_compress_data_contracts(self):
+        """
+        Test that rows stored before compression are read as is, then rewritten compressed by the migration.
+        """
+        payload = make_data_contract(
+            "urn:datacontract:test:compressed", examples=[{"type": "csv", "data": "a,b\n" * 500}]
+        )
+        db_manager.create_tables()
+        with db_manager.engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO data_contracts (id, data_contract_specification, info, models, examples) "
+                    "VALUES (:id, '0.9.3', :info, :models, :examples)"
+                ),
+                {
+                    "id": payload["id"],
+                    "info": json.dumps(payload["info"]),
+                    "models": json.dumps(payload["models"]),
+                    "examples": json.dumps(payload["examples"]),
+                },
+            )
+        size_query = text("SELECT typeof(examples), length(examples), substr(examples, 1, 2) FROM data_contracts")
+
+        with db_manager.get_session_factory()() as db:
+            self.assertEqual(db.scalar(select(DBDataContract.examples)), payload["examples"])
+            self.assertEqual(compress_data_contracts(db), 1)
+            self.assertEqual(db.scalar(select(DBDataContract.models)), payload["models"])
+            self.assertEqual(db.scalar(select(DBDataContract.examples)), payload["examples"])
+            stored = db.execute(size_query).one()
+        db_manager.vacuum()
+
+        self.assertEqual((stored[0], stored[2]), ("blob", COMPRESSED_MARKER))
+        self.assertLess(stored[1], len(json.dumps(payload["examples"])) / 10)
+
+
+class TestPostgresSchema(unittest.TestCase):
+    """
+    Test cases for the PostgreSQL mapping of the data contract table.
+    """
+
+    def test_json_columns_are_jsonb(self):
+        """
+        Test that the JSON sections are stored as JSONB on PostgreSQL.
+        """
+        ddl = str(CreateTable(DBDataContract.__table__).compile(dialect=postgresql.dialect()))
+        self.assertIn("info JSONB NOT NULL", ddl)
+        self.assertIn("tags JSONB", ddl)
+        self.assertIn("models JSONB", ddl)
+        self.assertIn("document VARCHAR", ddl)
+        self.assertNotIn(" JSON,", ddl)
+
+    def test_gin_indexes(self):
+        """
+        Test that GIN indexes are created on PostgreSQL only.
+        """
+        indexes = {
+            index.name: str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+            for index in DBDataContract.__table__.indexes
+        }
+        for column in ("info", "servers", "tags"):
+            self.assertIn(f"USING gin ({column})", indexes[f"ix_data_contracts_{column}_gin"])
+
+        engine = create_engine("sqlite://")
+        try:
+            DBDataContract.__table__.create(bind=engine)
+            created = {index["name"] for index in inspect(engine).get_indexes("data_contracts")}
+            self.assertFalse({name for name in created if name.endswith("_gin")})
+        finally:
+            engine.dispose()
+
+    def test_create_database_skips_server_backends(self):
+        """
+        Test that no database file is created for a PostgreSQL URL.
+        """
+        previous = db_manager.db_url
+        try:
+            db_manager.db_url = "postgresql://mycelium@localhost/mycelium"
+            with tempfile.TemporaryDirectory() as directory:
+                cwd = os.getcwd()
+                os.chdir(directory)
+                try:
+                    DatabaseManager().create_database()
+                    self.assertEqual(os.listdir(directory), [])
+                finally:
+                    os.chdir(cwd)
+        finally:
+            db_manager.db_url = previous
+
+
+if __name__ == "__main__":
+    unittest.main()
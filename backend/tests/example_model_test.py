@@ -0,0 +1,61 @@
+import copy
+import json
+import unittest
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.objects.model_object import ModelObject
+from app.schemas.data_contract.routes.data_contract_get import DataContractGetResponse
+from app.utils.example_model import FrozenDict
+
+
+class TestExamples(unittest.TestCase):
+    """
+    Test cases for the examples shared by the schemas.
+    """
+
+    def test_examples_are_shared(self):
+        """
+        Test that an example is built once, and shared with the schemas embedding it.
+        """
+        example = DataContract.get_example()
+        self.assertIs(DataContract.get_example(), example)
+        self.assertIs(DataContractGetResponse.get_example()["data"], example)
+        self.assertEqual(DataContract.model_validate(example).id, example["id"])
+
+    def test_examples_are_read_only(self):
+        """
+        Test that the examples are JSON-compatible and cannot be modified, except through a deep copy.
+        """
+        example = ModelObject.get_example()
+        self.assertEqual(json.loads(json.dumps(example))["fields"]["order_id"]["format"], "uuid")
+        with self.assertRaises(TypeError):
+            example["fields"]["order_id"]["type"] = "integer"
+        with self.assertRaises(TypeError):
+            example.update(type="view")
+
+        payload = copy.deepcopy(example)
+        payload["fields"]["order_id"]["type"] = "integer"
+        self.assertEqual(example["fields"]["order_id"]["type"], "string")
+        self.assertIs(type(payload["fields"]), dict)
+
+    def test_examples_are_read_as_models(self):
+        """
+        Test that the nested models of an example are dumped by alias, and read as models once validated.
+        """
+        example = ModelObject.get_example()
+        self.assertIsInstance(example["fields"]["order_id"], FrozenDict)
+        model = ModelObject.model_validate(example)
+        self.assertEqual(model.fields["order_id"].format, "uuid")
+        self.assertEqual(model.model_dump(mode="json", by_alias=True, exclude_unset=True), example)
+
+    def test_unhashable_values_are_hashed_by_identity(self):
+        """
+        Test that hashing a FrozenDict holding a value that is not hashable does not fail.
+        """
+        frozen = FrozenDict(tags={"orders"})
+        self.assertEqual(hash(frozen), id(frozen))
+        self.assertEqual(hash(FrozenDict(tags=("orders",))), hash(FrozenDict(tags=("orders",))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import copy
+from typing import Any, AsyncGenerator, Dict, Generator, Optional, Union
+
+from app.database.manager import db_manager
+from app.models.data_contract import DataContract as DBDataContract  # noqa: F401 (registers the table)
+from app.routers.cache import router as cache_router
+from app.routers.data_contract import router as data_contract_router
+from app.utils.cache import compact_document_cache, data_contract_cache
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.utils.compression import CompressionMiddleware
+from app.utils.config import settings
+from app.utils.tools import get_json_response_class
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+def create_test_engine() -> Engine:
+    """
+    Creates an in-memory SQLite engine with all the application tables.
+
+    :return Engine: The SQLAlchemy engine, shared across threads through a static pool.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool, **db_manager.get_json_options()
+    )
+    db_manager.Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def create_test_app(engine: Engine, async_engine: Optional[AsyncEngine] = None) -> FastAPI:
+    """
+    Creates a FastAPI application exposing the data contract routes on top of the given engine.
+
+    :param Engine engine: The engine the database sessions are bound to.
+    :param Optional[AsyncEngine] async_engine: The engine of the async sessions, to test the async mode.
+    :return FastAPI: The FastAPI application.
+    """
+    # The cached data contracts of the previous tests are not in this database
+    data_contract_cache.clear()
+    compact_document_cache.clear()
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async_session_factory = (
+        async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False) if async_engine else None
+    )
+
+    def get_test_db() -> Generator[Session, None, None]:
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_test_session() -> AsyncGenerator[Union[Session, AsyncSession], None]:
+        if async_session_factory:
+            async with async_session_factory() as db:
+                yield db
+        else:
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+    app = FastAPI(default_response_class=get_json_response_class())
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE)
+    app.include_router(data_contract_router, prefix="/data_contract")
+    app.include_router(cache_router, prefix="/cache")
+    app.dependency_overrides[db_manager.get_db] = get_test_db
+    app.dependency_overrides[db_manager.get_session] = get_test_session
+    app.dependency_overrides[db_manager.get_session_factory] = lambda: session_factory
+    return app
+
+
+def make_data_contract(id: str, **overrides: Any) -> Dict[str, Any]:
+    """
+    Builds a valid data contract payload based on the schema examples.
+
+    :param str id: The ID of the data contract.
+    :param Any overrides: Top-level fields to override in the payload.
+    :return Dict[str, Any]: The data contract payload, in JSON mode.
+    """
+    payload = DataContract.model_validate(copy.deepcopy(DataContract.get_example())).model_dump(mode="json")
+    payload.update(id=id, **overrides)
+    return payload
@@ -0,0 +1,96 @@
+import unittest
+
+from app.schemas.data_contract.objects.data_contract import DataContract
+from app.schemas.data_contract.objects.quality_object import (
+    CustomQualityObject,
+    GreatExpectationsQualityObject,
+    QualityObject,
+    SodaCLQualityObject,
+)
+from app.schemas.data_contract.objects.server_object import (
+    BigQueryServerObject,
+    OtherServerObject,
+    PostgresServerObject,
+    S3ServerObject,
+)
+from helpers import make_data_contract
+from pydantic import ValidationError
+
+
+class TestDiscriminatedUnions(unittest.TestCase):
+    """
+    Test cases for the servers and quality specifications validated by the model of their type.
+    """
+
+    def validate_servers(self, servers: dict) -> dict:
+        payload = make_data_contract("urn:datacontract:test:servers")
+        payload["servers"] = servers
+        return DataContract.model_validate(payload).servers
+
+    def test_servers_are_validated_by_type(self):
+        """
+        Test that each server is validated by the model of its type, which only defines the fields of that type.
+        """
+        servers = self.validate_servers(
+            {
+                "lake": {"type": "s3", "location": "s3://bucket/orders/*.json", "project": None, "topic": None},
+                "warehouse": {"type": "bigquery", "project": "shop", "dataset": "orders"},
+                "replica": {"type": "postgres", "host": "localhost", "port": "5432", "schema_name": "public"},
+            }
+        )
+        self.assertIsInstance(servers["lake"], S3ServerObject)
+        self.assertIsInstance(servers["warehouse"], BigQueryServerObject)
+        self.assertIsInstance(servers["replica"], PostgresServerObject)
+        self.assertEqual(servers["replica"].port, 5432)
+        self.assertEqual(
+            set(S3ServerObject.model_fields),
+            {"type", "description", "environment", "location", "endpoint_url", "format", "delimiter"},
+        )
+
+    def test_servers_keep_undefined_keys(self):
+        """
+        Test that the keys a server model does not define are kept, so that they survive a write of the server.
+        """
+        servers = self.validate_servers({"lake": {"type": "s3", "location": "s3://bucket/orders", "project": "p"}})
+        self.assertIsInstance(servers["lake"], S3ServerObject)
+        self.assertEqual(servers["lake"].model_extra, {"project": "p"})
+        self.assertEqual(
+            servers["lake"].model_dump(exclude_none=True),
+            {"type": "s3", "location": "s3://bucket/orders", "project": "p"},
+        )
+
+    def test_other_servers_are_kept(self):
+        """
+        Test that the servers of other types keep all their fields, and that invalid servers of a known type are not
+        accepted as servers of another type.
+        """
+        servers = self.validate_servers({"frame": {"type": "dataframe", "location": "memory", "options": {"a": 1}}})
+        self.assertIsInstance(servers["frame"], OtherServerObject)
+        self.assertEqual(servers["frame"].model_dump()["options"], {"a": 1})
+
+        with self.assertRaises(ValidationError) as context:
+            self.validate_servers({"replica": {"type": "postgres", "port": "not a port"}})
+        port_error, type_error = context.exception.errors()
+        self.assertEqual(port_error["loc"][-2:], ("postgres", "port"))
+        self.assertIn("PostgresServerObject", type_error["msg"])
+
+    def test_quality_specifications_are_validated_by_type(self):
+        """
+        Test that the quality specifications are validated by the model of their type, or of their shape without one.
+        """
+        cases = [
+            ({"type": "custom", "specification": "checks"}, CustomQualityObject),
+            ({"specification": "checks"}, SodaCLQualityObject),
+            ({"specification": {"orders": "[]"}}, GreatExpectationsQualityObject),
+        ]
+        for specification, model in cases:
+            quality = QualityObject.model_validate({"type": "any", "specification": specification})
+            self.assertIsInstance(quality.specification, model)
+
+        with self.assertRaises(ValidationError) as context:
+            QualityObject.model_validate({"type": "any", "specification": {"type": "unknown", "specification": ""}})
+        self.assertEqual(context.exception.errors()[0]["type"], "union_tag_invalid")
+
+
+if __name__ == "__main__":
+    unittest.main()
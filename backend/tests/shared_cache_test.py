@@ -0,0 +1,277 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from app.crud import data_contract_async
+from app.database.manager import db_manager
+from app.models.data_contract import DataContract as DBDataContract
+from app.routers import data_contract as data_contract_router
+from app.utils.cache import LRUCache, data_contract_cache
+from app.utils.shared_cache import SharedCache, shared_cache
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.ext.asyncio import create_async_engine
+from helpers import create_test_app, create_test_engine, make_data_contract
+
+try:
+    import fakeredis
+    import redis
+except ImportError:  # pragma: no cover - fakeredis is only installed to run these tests
+    fakeredis = None
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestSharedCache(unittest.TestCase):
+    """
+    Test cases for the cache shared by the workers, on an in-memory Redis server.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh in-memory database and Redis server, and a test client for each test.
+        """
+        self.server = fakeredis.FakeServer()
+        self.redis = fakeredis.FakeRedis(server=self.server)
+        shared_cache.setup(client=self.redis, async_client=fakeredis.FakeAsyncRedis(server=self.server))
+        self.addCleanup(shared_cache.close)
+        self.engine = create_test_engine()
+        self.client = TestClient(create_test_app(self.engine))
+        self.record_statements(self.engine)
+
+    def tearDown(self):
+        """
+        Dispose of the in-memory database.
+        """
+        self.engine.dispose()
+
+    def record_statements(self, engine) -> None:
+        """
+        Records the SQL statements executed on the engine serving the requests.
+        """
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self.record)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", self.record)
+
+    def record(self, connection, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def test_get_is_served_across_workers(self):
+        """
+        Test that a data contract read by one worker is served to the others from Redis, until it is written.
+        """
+        payload = make_data_contract("urn:datacontract:test:shared")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        first = self.client.get(url)
+
+        # Another worker, whose in-process cache is empty
+        data_contract_cache.clear()
+        self.statements.clear()
+        second = self.client.get(url)
+        self.assertEqual(self.statements, [])
+        self.assertEqual((second.json(), second.headers["etag"]), (first.json(), first.headers["etag"]))
+
+        patched = self.client.patch(url, content='{"tags": ["sales"]}')
+        data_contract_cache.clear()
+        fetched = self.client.get(url)
+        self.assertEqual(fetched.headers["etag"], patched.headers["etag"])
+        self.assertEqual(fetched.json()["data"]["tags"], ["sales"])
+        self.client.delete(url)
+        data_contract_cache.clear()
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_list_pages_are_cached_by_etag(self):
+        """
+        Test that a page read again only reads the content hashes of its data contracts from the database.
+        """
+        for index in range(3):
+            self.client.post("/data_contract/", json=make_data_contract(f"urn:datacontract:test:{index}"))
+        first = self.client.get("/data_contract/", params={"limit": 2})
+
+        self.statements.clear()
+        second = self.client.get("/data_contract/", params={"limit": 2})
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn("content_hash", self.statements[0])
+        self.assertEqual(second.content, first.content)
+
+        self.client.patch("/data_contract/urn:datacontract:test:0", content='{"tags": ["sales"]}')
+        third = self.client.get("/data_contract/", params={"limit": 2})
+        self.assertNotEqual(third.headers["etag"], first.headers["etag"])
+        self.assertEqual(third.json()["data"][0]["tags"], ["sales"])
+
+    def test_page_written_while_loading_is_not_cached(self):
+        """
+        Test that a page whose data contracts were written after their hashes were read is served with the ETag of
+        the data contracts actually read, and not cached under the ETag of the hashes.
+        """
+        for index in range(2):
+            self.client.post("/data_contract/", json=make_data_contract(f"urn:datacontract:test:{index}"))
+        written = (
+            update(DBDataContract)
+            .where(DBDataContract.id == "urn:datacontract:test:0")
+            .values(document='{"id": "urn:datacontract:test:0"}', content_hash="written")
+        )
+        read_documents = data_contract_router.list_data_contract_documents
+        aread_documents = data_contract_async.list_data_contract_documents
+
+        def write_then_read(db, **kwargs):
+            db.execute(written)
+            db.commit()
+            return read_documents(db, **kwargs)
+
+        async def awrite_then_read(db, **kwargs):
+            await db.execute(written)
+            await db.commit()
+            return await aread_documents(db, **kwargs)
+
+        with mock.patch.object(
+            data_contract_router, "list_data_contract_documents", side_effect=write_then_read
+        ), mock.patch.object(data_contract_async, "list_data_contract_documents", side_effect=awrite_then_read):
+            first = self.client.get("/data_contract/")
+        self.assertEqual(first.json()["data"][0], {"id": "urn:datacontract:test:0"})
+        self.assertEqual(self.redis.keys("*data_contract_page:*"), [])
+
+        second = self.client.get("/data_contract/")
+        self.assertEqual((second.content, second.headers["etag"]), (first.content, first.headers["etag"]))
+        self.assertEqual(len(self.redis.keys("*data_contract_page:*")), 1)
+
+    def test_missing_value_is_loaded_once(self):
+        """
+        Test that concurrent requests missing the same key wait for a single one of them to load it.
+        """
+        cache = SharedCache()
+        cache.setup(client=self.redis, async_client=fakeredis.FakeAsyncRedis(server=self.server))
+        loads = []
+
+        def load() -> bytes:
+            loads.append(threading.get_ident())
+            time.sleep(0.2)
+            return b"page"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("key", load, bytes, bytes)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [b"page"] * 8)
+        self.assertEqual(len(loads), 1)
+        self.assertIsNone(self.redis.get("key:lock"))
+
+    def test_writes_are_published_to_workers(self):
+        """
+        Test that the data contracts written by a worker are dropped from the in-process cache of the others.
+        """
+        local_cache = LRUCache(max_bytes=1024, ttl=60)
+        local_cache.put("urn:datacontract:test:a", ("{}", "hash"), local_cache.generation)
+        shared_cache.listen(local_cache)
+
+        shared_cache.invalidate(["urn:datacontract:test:a"])
+        deadline = time.monotonic() + 5
+        while local_cache.stats()["entries"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertIsNone(local_cache.get("urn:datacontract:test:a"))
+
+    def test_versions_outlive_the_cached_values(self):
+        """
+        Test that a data contract read long after a write, then written again, is not served from the value cached
+        under its previous version.
+        """
+        payload = make_data_contract("urn:datacontract:test:versions")
+        self.client.post("/data_contract/", json=payload)
+        url = f"/data_contract/{payload['id']}"
+        self.addCleanup(setattr, shared_cache, "ttl", shared_cache.ttl)
+        shared_cache.ttl = 0.5
+
+        self.client.patch(url, content='{"tags": ["first"]}')
+        # Read by another worker after the version would have expired with a TTL of twice the cached values'
+        time.sleep(0.8)
+        data_contract_cache.clear()
+        self.assertEqual(self.client.get(url).json()["data"]["tags"], ["first"])
+        time.sleep(0.4)
+        self.client.patch(url, content='{"tags": ["second"]}')
+        data_contract_cache.clear()
+
+        self.assertEqual(self.client.get(url).json()["data"]["tags"], ["second"])
+        self.assertEqual(self.redis.pttl(shared_cache._version_key(payload["id"])), -1)
+
+    def test_waiting_for_a_load_does_not_block_other_requests(self):
+        """
+        Test that a request waiting for another worker to load a data contract lets the worker serve other requests.
+        """
+        payload = make_data_contract("urn:datacontract:test:locked")
+        self.client.post("/data_contract/", json=payload)
+        data_contract_cache.clear()
+        # Another worker is loading the data contract
+        self.redis.set(f"{shared_cache._data_contract_key(payload['id'], None)}:lock", "other")
+        self.addCleanup(setattr, shared_cache, "lock_timeout", shared_cache.lock_timeout)
+        shared_cache.lock_timeout = 1
+
+        with self.client as client:
+            waiting = threading.Thread(target=client.get, args=(f"/data_contract/{payload['id']}",))
+            waiting.start()
+            time.sleep(0.1)
+            start = time.monotonic()
+            self.assertEqual(client.get("/data_contract/", params={"fields": "id"}).status_code, 200)
+            self.assertLess(time.monotonic() - start, 0.5)
+            waiting.join()
+
+    def test_redis_errors_fall_back_to_database(self):
+        """
+        Test that the data contracts are still served when Redis is unavailable.
+        """
+        payload = make_data_contract("urn:datacontract:test:unavailable")
+        self.client.post("/data_contract/", json=payload)
+        error = redis.ConnectionError("Connection refused")
+        with mock.patch.object(self.redis, "get", side_effect=error), mock.patch.object(
+            shared_cache.async_client, "get", side_effect=error
+        ):
+            response = self.client.get(f"/data_contract/{payload['id']}")
+            listed = self.client.get("/data_contract/")
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["data"]["id"], payload["id"])
+        self.assertEqual(len(listed.json()["data"]), 1)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestSharedCacheAsync(TestSharedCache):
+    """
+    Runs the shared cache test cases with the async database sessions.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh database file, shared by the sync and async engines, an in-memory Redis server, and a test
+        client for each test.
+        """
+        self.server = fakeredis.FakeServer()
+        self.redis = fakeredis.FakeRedis(server=self.server)
+        shared_cache.setup(client=self.redis, async_client=fakeredis.FakeAsyncRedis(server=self.server))
+        self.addCleanup(shared_cache.close)
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, "mycelium.db")
+        self.engine = create_engine(f"sqlite:///{path}")
+        db_manager.Base.metadata.create_all(bind=self.engine)
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.client = TestClient(create_test_app(self.engine, self.async_engine))
+        self.record_statements(self.async_engine.sync_engine)
+
+    def tearDown(self):
+        """
+        Dispose of the engines and remove the database file.
+        """
+        asyncio.run(self.async_engine.dispose())
+        self.engine.dispose()
+        self.directory.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from app.registry import MODEL_MODULES, ROUTER_MODULES, scan_modules
+from app.utils import openapi
+from app.utils.openapi import get_openapi_cache_path, load_or_build_openapi
+from fastapi.testclient import TestClient
+from helpers import create_test_app, create_test_engine
+
+
+class TestRegistry(unittest.TestCase):
+    """
+    Test cases for the static registry of the models and routers.
+    """
+
+    def test_registry_lists_every_module(self):
+        """
+        Test that the registry imports the same modules as listing the package directories.
+        """
+        self.assertEqual(sorted(MODEL_MODULES), scan_modules("models"))
+        self.assertEqual(sorted(ROUTER_MODULES), scan_modules("routers"))
+
+
+class TestOpenAPICache(unittest.TestCase):
+    """
+    Test cases for the OpenAPI schema cached across processes.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh cache directory and in-memory database for each test.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.engine = create_test_engine()
+        self.addCleanup(self.engine.dispose)
+
+    def test_schema_is_generated_once(self):
+        """
+        Test that the schema generated by a process is loaded by the next ones, and served as is.
+        """
+        schema = load_or_build_openapi(create_test_app(self.engine), self.directory.name)
+        path = get_openapi_cache_path(self.directory.name)
+        self.assertEqual(os.listdir(self.directory.name), [os.path.basename(path)])
+        self.assertIn("/data_contract/{id}", schema["paths"])
+
+        app = create_test_app(self.engine)
+        with mock.patch.object(app, "openapi", wraps=app.openapi) as generate:
+            self.assertEqual(load_or_build_openapi(app, self.directory.name), schema)
+        generate.assert_not_called()
+        self.assertEqual(TestClient(app).get("/openapi.json").json(), schema)
+
+    def test_schema_is_keyed_by_source(self):
+        """
+        Test that a schema cached by other source code, or unreadable, is not loaded.
+        """
+        path = get_openapi_cache_path(self.directory.name)
+        with open(path, "w") as file:
+            file.write('{"paths": ')
+        schema = load_or_build_openapi(create_test_app(self.engine), self.directory.name)
+        with open(path) as file:
+            self.assertEqual(json.load(file), schema)
+
+        with mock.patch.object(openapi, "get_source_hash", return_value="0" * 64):
+            self.assertNotEqual(get_openapi_cache_path(self.directory.name), path)
+
+
+if __name__ == "__main__":
+    unittest.main()
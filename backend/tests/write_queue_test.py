@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+
+from app.crud.data_contract import create_data_contract
+from app.database.manager import db_manager
+from app.database.writer import WriteQueue, after_commit
+from app.models.data_contract import DataContract as DBDataContract
+from app.schemas.data_contract.routes.data_contract_create import DataContractCreate
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from helpers import make_data_contract
+
+
+class TestWriteQueue(unittest.TestCase):
+    """
+    Test cases for the write queue committing the writes in groups.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh database file, and a write queue waiting long enough to group all the writes of a test.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.directory.name, 'mycelium.db')}")
+        db_manager.Base.metadata.create_all(bind=self.engine)
+        self.write_queue = WriteQueue()
+        self.write_queue.start(self.engine, window_ms=200, max_batch=10)
+
+    def tearDown(self):
+        """
+        Stop the write queue, dispose of the engine and remove the database file.
+        """
+        self.write_queue.stop()
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def count_contracts(self) -> int:
+        with self.engine.connect() as connection:
+            return connection.scalar(select(func.count()).select_from(DBDataContract))
+
+    def submit_create(self, id: str):
+        return self.write_queue.submit(
+            create_data_contract, DataContractCreate.model_validate(make_data_contract(f"urn:datacontract:test:{id}"))
+        )
+
+    def test_writes_are_committed_in_groups(self):
+        """
+        Test that the writes received together are committed at once, and only visible once their group is.
+        """
+        visible_after_commit = []
+
+        def check_visibility(db: Session) -> None:
+            after_commit(db, lambda: visible_after_commit.append(self.count_contracts()))
+            db.commit()
+
+        futures = [self.submit_create(f"{index:02d}") for index in range(3)]
+        futures.append(self.write_queue.submit(check_visibility))
+
+        self.assertEqual(
+            [future.result(timeout=10)["id"] for future in futures[:3]],
+            [f"urn:datacontract:test:{index:02d}" for index in range(3)],
+        )
+        futures[3].result(timeout=10)
+        self.assertEqual(visible_after_commit, [3])
+        self.assertEqual(self.write_queue.stats()["batches"], 1)
+        self.assertEqual(self.write_queue.stats()["writes"], 4)
+
+        futures = [self.submit_create(f"{index:02d}") for index in range(3, 15)]
+        for future in futures:
+            future.result(timeout=10)
+        self.assertEqual(self.write_queue.stats()["largest_batch"], 10)
+        self.assertEqual(self.count_contracts(), 15)
+
+    def test_failing_write_only_fails_itself(self):
+        """
+        Test that a failing write is rolled back to its savepoint, without failing the other writes of its group.
+        """
+        futures = [self.submit_create("first"), self.submit_create("first"), self.submit_create("second")]
+
+        self.assertEqual(futures[0].result(timeout=10)["id"], "urn:datacontract:test:first")
+        with self.assertRaises(IntegrityError):
+            futures[1].result(timeout=10)
+        self.assertEqual(futures[2].result(timeout=10)["id"], "urn:datacontract:test:second")
+        self.assertEqual(self.write_queue.stats()["batches"], 1)
+        self.assertEqual(self.count_contracts(), 2)
+
+    def test_callbacks_run_right_away_outside_the_queue(self):
+        """
+        Test that the callbacks of the writes committed by other sessions are not deferred.
+        """
+        called = []
+        with Session(self.engine) as db:
+            after_commit(db, lambda: called.append(True))
+        self.assertEqual(called, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()